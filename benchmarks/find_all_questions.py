@@ -0,0 +1,86 @@
+"""Compare batched and per-element exercise catalog reads.
+
+Builds a large chapter set page locally, loads it in a headless browser and
+times the two catalog reads behind Assignment.find_all_questions.
+
+    python benchmarks/find_all_questions.py [chapters] [sections] [exercises]
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from staxing.assignment import Assignment  # NOQA
+from staxing.helper import Helper  # NOQA
+
+__version__ = '0.0.1'
+
+REPEAT = 5
+
+
+def chapter_set(chapters, sections, exercises):
+    """Return HTML for an exercise picker with the requested size."""
+    rows = []
+    for chapter in range(1, chapters + 1):
+        for section in range(1, sections + 1):
+            cards = ''.join(
+                '<div class="openstax-exercise-preview">'
+                '<div class="controls-overlay"></div>'
+                '<div class="exercise-tags"><span>ID: %s@1</span></div>'
+                '</div>' % (chapter * 10000 + section * 100 + number)
+                for number in range(exercises)
+            )
+            rows.append(
+                '<div class="exercise-sections">'
+                '<label><span class="chapter-section">%s.%s</span></label>'
+                '<div class="exercises">%s</div>'
+                '</div>' % (chapter, section, cards)
+            )
+    return '<html><body>%s</body></html>' % ''.join(rows)
+
+
+def measure(helper, batched):
+    """Return the median time and command count for one read mode."""
+    assign = Assignment()
+    timings = []
+    commands = 0
+    questions = {}
+    for _ in range(REPEAT):
+        with helper.trace_commands() as tracer:
+            start = time.time()
+            questions = assign.read_question_catalog(helper.driver) \
+                if batched else assign.scrape_question_catalog(helper.driver)
+            timings.append(time.time() - start)
+        commands = len(tracer.commands)
+    return statistics.median(timings), commands, questions
+
+
+def main(chapters=12, sections=6, exercises=15):
+    """Run both read modes against the same page and print the results."""
+    page = tempfile.NamedTemporaryFile('w', suffix='.html', delete=False)
+    page.write(chapter_set(chapters, sections, exercises))
+    page.close()
+    helper = Helper(profile='headless-fast', wait_time=1)
+    try:
+        helper.get('file://%s' % page.name)
+        batched, batched_commands, fast = measure(helper, True)
+        scraped, scraped_commands, slow = measure(helper, False)
+    finally:
+        helper.delete()
+        os.remove(page.name)
+    if fast != slow:
+        raise AssertionError('Batched catalog differs from the scrape')
+    total = sum(len(ids) for ids in fast.values())
+    print('%s sections, %s exercises' % (len(fast), total))
+    print('%-12s %10s %10s' % ('mode', 'median', 'commands'))
+    print('%-12s %9.3fs %10s' % ('batched', batched, batched_commands))
+    print('%-12s %9.3fs %10s' % ('per-element', scraped, scraped_commands))
+    print('speed-up: %.1fx' % (scraped / batched if batched else 0))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:4]])
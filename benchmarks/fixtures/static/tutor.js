@@ -0,0 +1,169 @@
+// Behaviour for the recorded Tutor fixture pages. The book size matches the
+// large chapter set used by benchmarks/find_all_questions.py.
+var BOOK = {chapters: 12, sections: 6, exercises: 15};
+
+function show(id) { document.getElementById(id).hidden = false; }
+function hide(id) { document.getElementById(id).hidden = true; }
+
+function openMenu(button) {
+    button.classList.toggle('open');
+    document.getElementById('assignment-menu').hidden =
+        !button.classList.contains('open');
+}
+
+var PERIODS = ['First', 'Second', 'Third'];
+
+function dateFields(kind) {
+    return '<div class="-assignment-' + kind + '-date">' +
+        '<div class="datepicker__input-container">' +
+        '<input class="datepicker__input" placeholder="MM/DD/YYYY"></div>' +
+        '</div><div class="-assignment-' + kind + '-time">' +
+        '<input placeholder="hh:mm am"></div>';
+}
+
+function taskingPlans(target) {
+    var html = '<div class="tasking-all">' + dateFields('open') +
+        dateFields('due') + '</div>';
+    for (var i = 0; i < PERIODS.length; i++) {
+        var id = 'period-toggle-period-' + (i + 1);
+        html += '<div class="tasking-plan"><div class="period-toggle">' +
+            '<input type="checkbox" id="' + id + '" checked>' +
+            '<label for="' + id + '">' + PERIODS[i] + '</label></div>' +
+            dateFields('open') + dateFields('due') + '</div>';
+    }
+    document.getElementById(target).innerHTML = html;
+}
+
+// A one-month date picker: it opens on the month of the input's date,
+// pages a month at a time and sets the input when a day is picked.
+var MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+    'August', 'September', 'October', 'November', 'December'];
+var picker = null;
+
+function pad(number) { return (number < 10 ? '0' : '') + number; }
+
+function closePicker() {
+    if (picker) { picker.parentNode.removeChild(picker); picker = null; }
+}
+
+function openPicker(input, shown) {
+    closePicker();
+    var days = new Date(shown.getFullYear(), shown.getMonth() + 1, 0)
+        .getDate();
+    var html = '<a class="datepicker__navigation--previous">&lt;</a>' +
+        '<div class="datepicker__current-month">' +
+        MONTHS[shown.getMonth()] + ' ' + shown.getFullYear() + '</div>' +
+        '<a class="datepicker__navigation--next">&gt;</a>';
+    for (var day = 1; day <= days; day++) {
+        html += '<div class="datepicker__day">' + day + '</div>';
+    }
+    picker = document.createElement('div');
+    picker.className = 'datepicker';
+    picker.innerHTML = html;
+    picker.input = input;
+    picker.shown = shown;
+    input.parentNode.appendChild(picker);
+}
+
+document.addEventListener('click', function (event) {
+    var target = event.target;
+    if (target.classList.contains('datepicker__input')) {
+        var parts = target.value.split('/');
+        openPicker(target, parts.length == 3 ?
+            new Date(parts[2], parts[0] - 1, 1) : new Date());
+    } else if (picker && target.classList.contains('datepicker__day')) {
+        picker.input.value = pad(picker.shown.getMonth() + 1) + '/' +
+            pad(+target.textContent) + '/' + picker.shown.getFullYear();
+        closePicker();
+    } else if (picker && target.className.indexOf('datepicker__nav') == 0) {
+        var step = target.className == 'datepicker__navigation--next' ? 1 : -1;
+        openPicker(picker.input, new Date(picker.shown.getFullYear(),
+                                          picker.shown.getMonth() + step, 1));
+    }
+});
+
+function chapterList(target) {
+    var html = '';
+    for (var c = 1; c <= BOOK.chapters; c++) {
+        html += '<div class="chapter-heading" data-chapter-section="' + c +
+            '"><a href="#" aria-expanded="false" ' +
+            'onclick="expandChapter(this); return false;">' +
+            '<i class="tutor-icon" onclick="selectChapter(' + c +
+            '); event.preventDefault(); event.stopPropagation();"></i>' +
+            '<span class="chapter-section">' + c + '</span> Chapter ' + c +
+            '</a><div class="sections" hidden>';
+        for (var s = 1; s <= BOOK.sections; s++) {
+            var label = c + '.' + s;
+            html += '<div class="section"><span class="section-checkbox">' +
+                '<input type="checkbox" value="' + label + '"></span>' +
+                '<span class="chapter-section" data-chapter-section="' +
+                label + '">' + label + '</span> Section ' + label + '</div>';
+        }
+        html += '</div></div>';
+    }
+    document.getElementById(target).innerHTML = html;
+}
+
+function expandChapter(link) {
+    var open = link.getAttribute('aria-expanded') != 'true';
+    link.setAttribute('aria-expanded', open ? 'true' : 'false');
+    link.parentNode.querySelector('.sections').hidden = !open;
+}
+
+function selectChapter(chapter) {
+    var boxes = document.querySelectorAll(
+        'div[data-chapter-section="' + chapter + '"] input[type="checkbox"]'
+    );
+    for (var i = 0; i < boxes.length; i++) { boxes[i].checked = true; }
+}
+
+function selectedSections(target) {
+    var boxes = document.querySelectorAll('#' + target + ' input:checked');
+    var labels = [];
+    for (var i = 0; i < boxes.length; i++) { labels.push(boxes[i].value); }
+    return labels;
+}
+
+function showProblems() {
+    var sections = selectedSections('topics');
+    hide('topics');
+    show('loading');
+    // the real picker fetches the exercises before drawing them
+    setTimeout(function () {
+        var html = '';
+        for (var i = 0; i < sections.length; i++) {
+            var parts = sections[i].split('.');
+            html += '<div class="exercise-sections"><label>' +
+                '<span class="chapter-section">' + sections[i] +
+                '</span></label><div class="exercises">';
+            for (var n = 0; n < BOOK.exercises; n++) {
+                var id = parts[0] * 10000 + parts[1] * 100 + n;
+                html += '<div class="openstax-exercise-preview">' +
+                    '<div class="controls-overlay" ' +
+                    'onclick="toggleExercise(this)"></div>' +
+                    '<div class="exercise-tags"><span>ID: ' + id +
+                    '@1</span></div></div>';
+            }
+            html += '</div></div>';
+        }
+        document.getElementById('exercises').innerHTML = html;
+        // the real spinner is removed from the page, not hidden
+        var loading = document.getElementById('loading');
+        loading.parentNode.removeChild(loading);
+        show('exercise-picker');
+    }, 300);
+}
+
+function toggleExercise(overlay) {
+    overlay.parentNode.classList.toggle('is-selected');
+    document.getElementById('selected-count').textContent =
+        document.querySelectorAll('.is-selected').length;
+}
+
+function changeTutorSelections(change) {
+    var count = document.querySelector('.tutor-selections h2');
+    var value = Math.min(4, Math.max(2, parseInt(count.textContent) + change));
+    count.textContent = value;
+}
+
+function save() { window.location.href = 'calendar.html'; }
@@ -0,0 +1,255 @@
+"""Time staxing flows against recorded Tutor and Accounts pages.
+
+Serves benchmarks/fixtures from a local HTTP server, so no Tutor server or
+network access is needed, and reports the median and 95th percentile time
+and the WebDriver command count for each flow.
+
+    python benchmarks/flows.py [--repeat N] [--only NAME ...]
+                               [--save baseline.json] [--compare baseline.json]
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import statistics
+import sys
+import threading
+import time
+
+from collections import OrderedDict
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from selenium.webdriver.common.by import By  # NOQA
+from selenium.webdriver.support import expected_conditions as expect  # NOQA
+from selenium.webdriver.support.ui import WebDriverWait  # NOQA
+from staxing.assignment import Assignment  # NOQA
+from staxing.helper import Helper, User  # NOQA
+
+__version__ = '0.0.1'
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'fixtures')
+REPEAT = 5
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """Serve the fixture directory quietly."""
+
+    def translate_path(self, path):
+        """Map request paths onto the fixture directory."""
+        relative = os.path.relpath(
+            SimpleHTTPRequestHandler.translate_path(self, path), os.getcwd()
+        )
+        return os.path.join(FIXTURES, relative)
+
+    def log_message(self, *args):
+        """Keep the benchmark output readable."""
+        pass
+
+
+class FixtureServer(ThreadingMixIn, HTTPServer):
+    """Threaded local server for the fixture pages."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        """Bind to a free local port and start serving."""
+        HTTPServer.__init__(self, ('127.0.0.1', 0), FixtureHandler)
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def url(self, path=''):
+        """Return the full URL for a fixture path."""
+        return 'http://127.0.0.1:%s/%s' % (self.server_port,
+                                           path.lstrip('/'))
+
+
+def dates(days):
+    """Return an MM/DD/YYYY date the given number of days from today."""
+    return (datetime.date.today() + datetime.timedelta(days=days)) \
+        .strftime('%m/%d/%Y')
+
+
+PERIODS = {
+    'First': (dates(1), dates(8)),
+    'Second': ((dates(2), '6:30 am'), (dates(9), '11:59 pm')),
+    'Third': (dates(3), dates(10)),
+}
+PROBLEMS = {'1.1': 3, '1.2': (2, 4), '2.1': 'all', '2.3': ['20301', '20302']}
+READINGS = ['ch1', '2.1', '2.2']
+
+
+def open_page(helper, server, page):
+    """Load a fixture page and wait for its scripts to draw the form."""
+    helper.driver.get(server.url(page))
+    WebDriverWait(helper.driver, 10).until(
+        lambda driver: driver.execute_script(
+            'return document.readyState == "complete";'
+        )
+    )
+
+
+def open_problems(helper, server):
+    """Load the homework form as far as the exercise picker."""
+    open_page(helper, server, 'courses/1/t/homework.html')
+    assign = Assignment()
+    helper.driver.find_element(By.ID, 'problems-select').click()
+    assign.select_sections(helper.driver, list(PROBLEMS))
+    helper.driver.find_element(
+        By.XPATH, '//button[contains(@class,"-show-problems")]'
+    ).click()
+
+
+def run_helper(helper, server):
+    """Launch and close a headless browser."""
+    Helper(profile='headless-fast').delete()
+
+
+def run_login(helper, server):
+    """Sign in through the Tutor and Accounts pages."""
+    user = User('teacher', 'password', existing_driver=helper.driver)
+    try:
+        user.login(url=server.url('tutor/'))
+        WebDriverWait(helper.driver, 10).until(
+            expect.url_contains('calendar')
+        )
+    finally:
+        # the driver belongs to the benchmark helper
+        user.delete(quit_driver=False)
+
+
+def run_reading(helper, server):
+    """Create a reading from the calendar."""
+    Assignment().add_new_reading(
+        driver=helper.driver,
+        title='Reading',
+        description='Benchmark reading',
+        periods=PERIODS,
+        readings=READINGS,
+        status=Assignment.PUBLISH
+    )
+    WebDriverWait(helper.driver, 10).until(
+        expect.url_contains('calendar')
+    )
+
+
+def run_periods(helper, server):
+    """Set open and due dates and times for each period."""
+    Assignment().assign_periods(helper.driver, PERIODS)
+
+
+def run_problems(helper, server):
+    """Select homework exercises from the picker."""
+    Assignment().add_homework_problems(helper.driver, PROBLEMS)
+
+
+def run_questions(helper, server):
+    """Read the exercise catalog."""
+    Assignment().find_all_questions(helper.driver, PROBLEMS)
+
+
+# name -> (setup, run); setup loads the page a flow starts from untimed
+FLOWS = [
+    ('helper_construction', (None, run_helper)),
+    ('login', (lambda helper, server: helper.driver.delete_all_cookies(),
+               run_login)),
+    ('add_new_reading', (
+        lambda helper, server: open_page(helper, server,
+                                         'courses/1/t/calendar.html'),
+        run_reading)),
+    ('assign_periods', (
+        lambda helper, server: open_page(helper, server,
+                                         'courses/1/t/reading.html'),
+        run_periods)),
+    ('add_homework_problems', (
+        lambda helper, server: open_page(helper, server,
+                                         'courses/1/t/homework.html'),
+        run_problems)),
+    ('find_all_questions', (open_problems, run_questions)),
+]
+
+
+def percentile(values, fraction):
+    """Return the nearest-rank percentile of the values."""
+    ordered = sorted(values)
+    rank = max(1, int(math.ceil(fraction * len(ordered))))
+    return ordered[rank - 1]
+
+
+def measure(helper, server, setup, run, repeat):
+    """Return the timings and command counts for one flow."""
+    timings = []
+    commands = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup(helper, server)
+        with helper.trace_commands() as tracer:
+            start = time.time()
+            run(helper, server)
+            timings.append(time.time() - start)
+        commands.append(len(tracer.commands))
+    return {
+        'median': statistics.median(timings),
+        'p95': percentile(timings, 0.95),
+        'commands': int(statistics.median(commands)),
+        'runs': len(timings),
+    }
+
+
+def report(results, baseline=None):
+    """Print the results, with the change from a baseline when given."""
+    print('%-22s %9s %9s %9s %s' % ('flow', 'median', 'p95', 'commands',
+                                    'vs baseline' if baseline else ''))
+    for name, result in results.items():
+        change = ''
+        if baseline and name in baseline and baseline[name]['median']:
+            change = '%+.0f%% time, %+d commands' % (
+                (result['median'] / baseline[name]['median'] - 1) * 100,
+                result['commands'] - baseline[name]['commands']
+            )
+        print('%-22s %8.3fs %8.3fs %9d %s' % (
+            name, result['median'], result['p95'], result['commands'], change
+        ))
+
+
+def main(argv=None):
+    """Run the selected flows and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--only', nargs='*', default=None,
+                        choices=[name for name, _ in FLOWS])
+    parser.add_argument('--save', default=None,
+                        help='write the results to a JSON baseline')
+    parser.add_argument('--compare', default=None,
+                        help='compare with a saved JSON baseline')
+    args = parser.parse_args(argv)
+    server = FixtureServer()
+    helper = Helper(profile='headless-fast', wait_time=1)
+    results = OrderedDict()
+    try:
+        for name, (setup, run) in FLOWS:
+            if args.only and name not in args.only:
+                continue
+            results[name] = measure(helper, server, setup, run, args.repeat)
+    finally:
+        helper.delete()
+        server.shutdown()
+        server.server_close()
+    baseline = None
+    if args.compare:
+        with open(args.compare) as saved:
+            baseline = json.load(saved)
+    report(results, baseline)
+    if args.save:
+        with open(args.save, 'w') as saved:
+            json.dump(results, saved, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
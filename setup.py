@@ -23,7 +23,9 @@ setup(
         '': ['*.txt', '*.rst', '*.md'],
     },
     # entry_points={},
-    # extras_require={},
+    extras_require={
+        'test': ['lxml>=3.6.0'],
+    },
     # setup_requires=[],
     # use_2to3=True,
     # convert_2to3_doctests=[],
@@ -36,6 +38,6 @@ setup(
     url='https://github.com/gregfitch/staxing',
     long_description=open('README.md').read(),
     # test_suite=''
-    # tests_require=[],
+    tests_require=['lxml>=3.6.0'],
     # test_loader='',
 )
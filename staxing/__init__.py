@@ -3,6 +3,16 @@
 from .helper import Helper, Admin, Student, Teacher, User, ContentQA
 from .assignment import Assignment
 from .page_load import SeleniumWait
+from .session_pool import SessionPool
+from .session_store import SessionStore
+from .wait_strategy import WaitStrategy
+from .launcher import ConcurrentLauncher
+from .wait_ledger import WaitLedger
+from .command_trace import CommandTracer
+from .text_entry import TextEntry
+from .exercise_catalog import CatalogCache, ExerciseCatalog
+
+WaitLedger.from_env()
 
 if __name__ == '__main__':
     a = Helper
@@ -13,3 +23,12 @@ if __name__ == '__main__':
     f = User
     g = ContentQA
     h = SeleniumWait
+    i = SessionPool
+    j = ConcurrentLauncher
+    k = SessionStore
+    m = WaitStrategy
+    n = WaitLedger
+    o = CommandTracer
+    p = TextEntry
+    r = ExerciseCatalog
+    s = CatalogCache
@@ -4,18 +4,38 @@ import calendar
 import datetime
 import inspect
 import random
+import re
 import string
 import time
 
+from collections import OrderedDict
+from urllib.parse import urlparse
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support import expected_conditions as expect
 from selenium.webdriver.support.ui import WebDriverWait
 
+try:
+    from staxing.assignment_api import AssignmentAPI
+except ImportError:
+    from assignment_api import AssignmentAPI
+try:
+    from staxing.exercise_catalog import CatalogCache, ExerciseCatalog
+except ImportError:
+    from exercise_catalog import CatalogCache, ExerciseCatalog
 try:
     from staxing.page_load import SeleniumWait as Page
 except ImportError:
     from page_load import SeleniumWait as Page
+try:
+    from staxing.text_entry import TextEntry, TextEntryError
+except ImportError:
+    from text_entry import TextEntry, TextEntryError
+try:
+    from staxing.wait_strategy import WaitStrategy
+except ImportError:
+    from wait_strategy import WaitStrategy
 
 __version__ = '0.0.27'
 
@@ -39,6 +59,9 @@ class Assignment(object):
 
     WAIT_TIME = 15
 
+    DIRECT_DATES = True
+    DATE_FORMATS = ('%m/%d/%Y', '%Y-%m-%d', '%m/%d/%y')
+
     TUTOR_SELECTIONS = 'tutor'
 
     PUBLISH = 'publish'
@@ -46,8 +69,14 @@ class Assignment(object):
     DRAFT = 'draft'
     DELETE = 'delete'
 
-    def __init__(self):
-        """Provide a switch-style dictionary to add assignments."""
+    def __init__(self, catalog_cache=None):
+        """Provide a switch-style dictionary to add assignments.
+
+        catalog_cache (CatalogCache): optional saved exercise catalogs; True
+            uses the default directory
+        """
+        self.catalog_cache = CatalogCache() if catalog_cache is True \
+            else catalog_cache
         self.add = {
             Assignment.READING:
             (
@@ -216,10 +245,18 @@ class Assignment(object):
     def send_keys(cls, driver, element, text):
         """Send data to an element using javascript."""
         Assignment.scroll_to(driver, element)
-        element.clear()
-        time.sleep(0.5)
-        for ch in text:
-            element.send_keys(ch)
+        return TextEntry(driver).enter(element, text)
+
+    @classmethod
+    def time_matches(cls, value, text):
+        """Compare a rendered time field with the digits typed into it."""
+        value = (value or '').lower()
+        digits = ''.join(ch for ch in value if ch.isdigit())
+        if digits.lstrip('0') != ''.join(
+                ch for ch in text if ch.isdigit()).lstrip('0'):
+            return False
+        meridiem = [ch for ch in text.lower() if ch in 'ap']
+        return not meridiem or meridiem[0] in value
 
     def open_assignment_menu(self, driver):
         """Open the Add Assignment menu if it is closed."""
@@ -241,6 +278,12 @@ class Assignment(object):
         """Rotate the date picker to the correct month and year."""
         today = datetime.date.today()
         target.click()
+        WaitStrategy.pause(
+            'date_picker_open',
+            driver,
+            expect.visibility_of_element_located(
+                (By.CLASS_NAME, 'datepicker__current-month'))
+        )
         if today.year == new_date.year and today.month == new_date.month:
             return
         months = {v: k for k, v in enumerate(calendar.month_name)}
@@ -258,7 +301,9 @@ class Assignment(object):
         year = int(year)
 
         while year <= new_date.year and month < new_date.month:
+            shown = current.text
             next_month.click()
+            self.wait_for_month_change(driver, shown)
             current = driver.find_element(
                 By.CLASS_NAME,
                 'datepicker__current-month'
@@ -266,7 +311,6 @@ class Assignment(object):
             month, year = current.text.split(' ')
             month = months[month]
             year = int(year)
-            time.sleep(1.0)
         while year >= new_date.year and month > new_date.month:
             # because it will only ever go back one month it's okay to find
             # arrow inside the while loop
@@ -274,7 +318,9 @@ class Assignment(object):
                 By.CLASS_NAME,
                 'datepicker__navigation--previous'
             )
+            shown = current.text
             previous_month.click()
+            self.wait_for_month_change(driver, shown)
             current = driver.find_element(
                 By.CLASS_NAME,
                 'datepicker__current-month'
@@ -282,7 +328,17 @@ class Assignment(object):
             month, year = current.text.split(' ')
             month = months[month]
             year = int(year)
-            time.sleep(1.0)
+
+    def wait_for_month_change(self, driver, shown):
+        """Wait for the date picker to leave the month it was showing."""
+        WaitStrategy.pause(
+            'date_picker_month',
+            driver,
+            lambda browser: browser.find_element(
+                By.CLASS_NAME,
+                'datepicker__current-month'
+            ).text != shown
+        )
 
     def assign_time(self, driver, time,
                     option=None, is_all=False, target='due'):
@@ -291,13 +347,22 @@ class Assignment(object):
         path = '../..' if not is_all else ''
         path += '//div[contains(@class,"-%s-time")]//input' % target
         element = start.find_element(By.XPATH, path)
-        element.clear()
-        for char in self.modify_time(time):
-            element.send_keys(char)
+        # masked time inputs may only accept typing one key at a time
+        TextEntry(
+            driver,
+            strategies=(TextEntry.REACT, TextEntry.CHUNKED),
+            chunk_size=1,
+            verify=Assignment.time_matches
+        ).enter(element, self.modify_time(time), key='assign_time')
 
     def assign_date(self, driver, date,
-                    option=None, is_all=False, target='due'):
-        """Set the date for a particular period/section row."""
+                    option=None, is_all=False, target='due', direct=None):
+        """Set the date for a particular period/section row.
+
+        direct (bool): write the date into the input so the picker opens on
+            its month, instead of paging the picker month by month; defaults
+            to Assignment.DIRECT_DATES
+        """
         start = option if option else driver
         path = '../..' if not is_all else ''
         path += '//div[contains(@class,"-%s-date")]' % target
@@ -306,7 +371,9 @@ class Assignment(object):
         # get calendar to correct month
         split = date.split('/')
         change = datetime.date(int(split[2]), int(split[0]), int(split[1]))
-        time.sleep(0.15)
+        direct = Assignment.DIRECT_DATES if direct is None else direct
+        if direct and self.set_date(driver, date_element, change):
+            return
         self.adjust_date_picker(driver, date_element, change)
         driver.find_element(
             By.XPATH,
@@ -315,6 +382,58 @@ class Assignment(object):
             'and text()="%s"]' % change.day
         ).click()
 
+    @classmethod
+    def date_matches(cls, value, target):
+        """Return True if a rendered date field shows the target date."""
+        for date_format in Assignment.DATE_FORMATS:
+            try:
+                shown = datetime.datetime.strptime(value.strip(), date_format)
+            except (AttributeError, ValueError):
+                continue
+            return shown.date() == target
+        return False
+
+    def set_date(self, driver, element, target):
+        """Jump the date picker to a date's month and pick the day.
+
+        The date is written into the input so the picker opens on its month,
+        then the day is clicked like any user would, which only accepts
+        enabled days. Return False if the picker is not showing the target
+        month, the day is not enabled there or the app did not keep it.
+        """
+        text = target.strftime(Assignment.DATE_FORMATS[0])
+        month = '%s %s' % (calendar.month_name[target.month], target.year)
+        try:
+            TextEntry(
+                driver,
+                strategies=(TextEntry.REACT,),
+                verify=lambda value, _: Assignment.date_matches(value, target)
+            ).enter(element, text)
+            element.click()
+            WaitStrategy.pause(
+                'date_picker_open',
+                driver,
+                expect.visibility_of_element_located(
+                    (By.CLASS_NAME, 'datepicker__current-month'))
+            )
+            shown = driver.find_element(
+                By.CLASS_NAME,
+                'datepicker__current-month'
+            ).text
+            if shown != month:
+                return False
+            driver.find_element(
+                By.XPATH,
+                '//div[contains(@class,"datepicker__day") ' +
+                'and not(contains(@class,"disabled")) ' +
+                'and text()="%s"]' % target.day
+            ).click()
+            # the input re-renders from the app's state after the pick
+            rendered = element.get_attribute('value')
+        except (TextEntryError, WebDriverException):
+            return False
+        return Assignment.date_matches(rendered, target)
+
     def assign_periods(self, driver, periods):
         """Assign dates and times to particular periods/sections."""
         # prepare assignment for all periods/sections together
@@ -394,19 +513,18 @@ class Assignment(object):
         Assignment.scroll_to(driver, element)
         if status == self.PUBLISH:
             print('Publishing...')
-            time.sleep(1)
-            driver.find_element(
-                By.XPATH, '//button[contains(@class,"-publish")]').click()
+            self.wait_for_button(
+                driver, '//button[contains(@class,"-publish")]'
+            ).click()
         elif status == self.DRAFT:
             print('Saving draft')
-            time.sleep(1)
-            element = driver.find_element(
-                By.XPATH, '//button[contains(@class," -save")]').click()
+            self.wait_for_button(
+                driver, '//button[contains(@class," -save")]'
+            ).click()
         elif status == self.CANCEL:
             print('Canceling assignment')
-            time.sleep(1)
-            element = driver.find_element(
-                By.XPATH,
+            self.wait_for_button(
+                driver,
                 '//button[contains(@aria-role,"close") and @type="button"]'
             ).click()
             try:
@@ -420,10 +538,8 @@ class Assignment(object):
                 pass
         elif status == self.DELETE:
             print('Deleting assignment')
-            time.sleep(1)
-            element = driver.find_element(
-                By.XPATH,
-                '//button[contains(text(),"Delete")]'
+            self.wait_for_button(
+                driver, '//button[contains(text(),"Delete")]'
             ).click()
             wait = WebDriverWait(driver, Assignment.WAIT_TIME)
             wait.until(
@@ -432,6 +548,15 @@ class Assignment(object):
                 )
             ).click()
 
+    def wait_for_button(self, driver, xpath):
+        """Return a footer button once it can be clicked."""
+        WaitStrategy.pause(
+            'status_select',
+            driver,
+            expect.element_to_be_clickable((By.XPATH, xpath))
+        )
+        return driver.find_element(By.XPATH, xpath)
+
     def open_chapter_list(self, driver, chapter):
         """Open the reading chapter list."""
         data_chapter = driver.find_element(
@@ -451,7 +576,11 @@ class Assignment(object):
                     '//div[@data-chapter-section="%s"]' % section[2:] +
                     '//i[contains(@class,"tutor-icon")]'
                 )
-                time.sleep(0.5)
+                WaitStrategy.pause(
+                    'section_select',
+                    driver,
+                    lambda _: chapter.is_displayed()
+                )
                 if not chapter.is_selected():
                     chapter.click()
             elif 'tutor' in section:
@@ -459,7 +588,8 @@ class Assignment(object):
             else:  # select an individual section
                 print('Adding section: ' + section)
                 self.open_chapter_list(driver, section.split('.')[0])
-                time.sleep(0.5)
+                # the visibility wait below replaces the pause in fast mode
+                WaitStrategy.pause('section_select')
                 wait = WebDriverWait(driver, Assignment.WAIT_TIME)
                 marked = wait.until(
                     expect.visibility_of_element_located(
@@ -491,7 +621,8 @@ class Assignment(object):
         print('Creating a new Reading')
         self.open_assignment_menu(driver)
         driver.find_element(By.LINK_TEXT, 'Add Reading').click()
-        time.sleep(1)
+        # the clickable wait below replaces the pause in fast mode
+        WaitStrategy.pause('assignment_form')
         wait = WebDriverWait(driver, Assignment.WAIT_TIME * 3)
         wait.until(
             expect.element_to_be_clickable(
@@ -534,10 +665,63 @@ class Assignment(object):
             return
         self.select_status(driver, status)
 
-    def find_all_questions(self, driver, problems):
-        """Final all available questions."""
-        questions = {}
-        section = ''
+    QUESTION_SCRIPT = r'''
+        var catalog = [];
+        var rows = document.querySelectorAll(
+            'div[class*="exercise-sections"]'
+        );
+        for (var i = 0; i < rows.length; i++) {
+            var section = null;
+            var children = rows[i].children;
+            for (var j = 0; j < children.length && section === null; j++) {
+                if (children[j].tagName != 'LABEL') { continue; }
+                var spans = children[j].children;
+                for (var k = 0; k < spans.length; k++) {
+                    if (spans[k].tagName == 'SPAN' &&
+                            spans[k].className == 'chapter-section') {
+                        section = spans[k].textContent.trim();
+                        break;
+                    }
+                }
+            }
+            if (section === null) { return null; }
+            var ids = [];
+            var groups = rows[i].querySelectorAll('div[class="exercises"]');
+            for (var g = 0; g < groups.length; g++) {
+                var tags = groups[g].getElementsByTagName('span');
+                for (var t = 0; t < tags.length; t++) {
+                    // only a span's own text, as contains(text(),"ID:")
+                    var nodes = tags[t].childNodes;
+                    for (var n = 0; n < nodes.length; n++) {
+                        var text = nodes[n].nodeType == 3 ?
+                            nodes[n].nodeValue.trim() : '';
+                        if (text.indexOf('ID:') >= 0) {
+                            ids.push(text.split(/\s+/)[1]);
+                            break;
+                        }
+                    }
+                }
+            }
+            catalog.push([section, ids]);
+        }
+        return catalog;
+    '''
+
+    def find_all_questions(self, driver, problems, batched=True):
+        """Final all available questions.
+
+        The catalog is read with one in-browser script; when that fails the
+        rows are read element by element instead.
+        """
+        self.wait_for_exercises(driver)
+        if batched:
+            questions = self.read_question_catalog(driver)
+            if questions is not None:
+                return questions
+        return self.scrape_question_catalog(driver)
+
+    def wait_for_exercises(self, driver):
+        """Wait for the exercise picker to finish loading."""
         wait = WebDriverWait(driver, 5)
         try:
             loading = wait.until(
@@ -548,6 +732,24 @@ class Assignment(object):
             wait.until(expect.staleness_of(loading))
         except:
             pass
+
+    def read_question_catalog(self, driver):
+        """Return {section: [exercise IDs]} from one script or None."""
+        try:
+            catalog = driver.execute_script(Assignment.QUESTION_SCRIPT)
+        except WebDriverException:
+            return None
+        if catalog is None:
+            return None
+        questions = {}
+        for section, ids in catalog:
+            questions[section] = list(ids)
+        return questions
+
+    def scrape_question_catalog(self, driver):
+        """Return {section: [exercise IDs]} reading each element."""
+        questions = {}
+        section = ''
         rows = driver.find_elements(
             By.XPATH,
             '//div[contains(@class,"exercise-sections")]')
@@ -571,13 +773,9 @@ class Assignment(object):
 
     def get_chapter_list(self, problems, chapter_id):
         """Return available chapters."""
-        available = []
-        chapter = int(chapter_id[2:])
-        for section in problems:
-            if int(section.split('.')[0]) == chapter:
-                for i in range(len(problems[section])):
-                    available.append(problems[section][i])
-        return available
+        catalog = problems if isinstance(problems, ExerciseCatalog) else \
+            ExerciseCatalog(problems)
+        return catalog.available(chapter_id)
 
     def set_tutor_selections(self, driver, problems):
         """Select the number of Tutor selected problems."""
@@ -603,9 +801,186 @@ class Assignment(object):
                 change -= 1
                 decrease.click()
 
+    SELECTED_COUNT = '//div[contains(@class,"num mine")]/h2'
+    SELECT_SCRIPT = r'''
+        var wanted = arguments[0];
+        var overlays = {};
+        var tags = document.querySelectorAll('div[class="exercises"] span');
+        for (var t = 0; t < tags.length; t++) {
+            var text = tags[t].textContent.trim();
+            if (text.indexOf('ID:') < 0) { continue; }
+            var card = tags[t].parentNode.parentNode;
+            for (var c = 0; c < card.children.length; c++) {
+                if (card.children[c].className == 'controls-overlay') {
+                    var id = text.split(/\s+/)[1];
+                    overlays[id] = card.children[c];
+                    overlays[id.split('@')[0]] = card.children[c];
+                    break;
+                }
+            }
+        }
+        var found = [];
+        var missed = [];
+        var selected = [];
+        for (var w = 0; w < wanted.length; w++) {
+            var overlay = overlays[wanted[w]];
+            if (!overlay) {
+                missed.push(wanted[w]);
+            } else if (overlay.parentNode.classList.contains('is-selected')) {
+                selected.push(wanted[w]);
+            } else {
+                found.push([wanted[w], overlay]);
+            }
+        }
+        return {'found': found, 'missed': missed, 'selected': selected};
+    '''
+
+    def selected_count(self, driver):
+        """Return the number of exercises the picker shows as selected."""
+        try:
+            return int(driver.find_element(
+                By.XPATH, Assignment.SELECTED_COUNT).text)
+        except (ValueError, WebDriverException):
+            return None
+
+    @classmethod
+    def click_add_control(cls, driver, add_button):
+        """Hover over an exercise card and click its add control."""
+        Assignment.scroll_to(driver, add_button)
+        # the add control sits left of the card's center
+        ActionChains(driver) \
+            .move_to_element(add_button) \
+            .move_by_offset(-60, 0) \
+            .click() \
+            .perform()
+
+    def select_exercise(self, driver, exercise):
+        """Click the add control on one exercise card.
+
+        Return False without clicking when the card is already selected,
+        since a second click removes it again.
+        """
+        card = driver.find_element(
+            By.XPATH, '//span[contains(text(),"%s")]/../..' % exercise)
+        if 'is-selected' in (card.get_attribute('class') or '').split():
+            return False
+        Assignment.click_add_control(
+            driver,
+            card.find_element(By.XPATH, 'div[@class="controls-overlay"]')
+        )
+        return True
+
+    def select_exercises(self, driver, exercises, batched=True):
+        """Add exercises to a homework and return the selected count.
+
+        One script matches the add controls to exercise IDs, then each is
+        clicked with the pointer as select_exercise does; any the script
+        cannot match are found one at a time. Exercises already selected
+        are left alone. Raise AssignmentError when the count read back
+        from the picker is not the one expected.
+        """
+        exercises = list(OrderedDict.fromkeys(exercises))
+        before = self.selected_count(driver)
+        found = []
+        missed = exercises
+        skipped = []
+        if batched and exercises:
+            try:
+                result = driver.execute_script(Assignment.SELECT_SCRIPT,
+                                               exercises)
+            except WebDriverException:
+                result = None
+            if result is not None:
+                found = result['found']
+                missed = result['missed']
+                skipped = result['selected']
+        added = len(exercises) - len(skipped)
+        for exercise, add_button in found:
+            try:
+                Assignment.click_add_control(driver, add_button)
+            except WebDriverException:
+                missed.append(exercise)
+        for exercise in missed:
+            if not self.select_exercise(driver, exercise):
+                added -= 1
+        if before is None:
+            return None
+        expected = before + added
+        WaitStrategy.pause(
+            'exercise_select',
+            driver,
+            lambda browser: self.selected_count(browser) == expected
+        )
+        selected = self.selected_count(driver)
+        if selected != expected:
+            raise AssignmentError('Selected %s of %s exercises' %
+                                  (selected, expected))
+        return selected
+
+    @classmethod
+    def catalog_key(cls, driver):
+        """Return (site, course ID, ecosystem ID) for the open course.
+
+        The ecosystem ID versions the course's exercises; None is returned
+        when it cannot be read.
+        """
+        match = re.search(r'/courses/(\d+)', driver.current_url)
+        if match is None:
+            return None
+        parsed = urlparse(driver.current_url)
+        site = '%s://%s' % (parsed.scheme, parsed.netloc)
+        try:
+            course = AssignmentAPI.from_driver(driver, site) \
+                .course(match.group(1))
+        except Exception as err:
+            print('No exercise catalog version: %s' % err)
+            return None
+        if not isinstance(course, dict) or \
+                course.get('ecosystem_id') is None:
+            return None
+        return site, match.group(1), '%s' % course['ecosystem_id']
+
+    def plan_exercises(self, catalog, problems):
+        """Return the exercise IDs to add for a problems dictionary.
+
+        Specific exercise IDs are only taken from the requested sections,
+        as the picker only shows those.
+        """
+        using = OrderedDict()
+        for section in problems:
+            choice = problems[section]
+            if choice is None or str(choice).lower() == 'none':
+                print('%s: No exercises (%s)' % (section, choice))
+                continue
+            if section == 'tutor':
+                continue
+            if choice == 'all':
+                print('Selecting all from %s' % section)
+            elif type(choice) == tuple:
+                print('Selecting %s to %s random from %s' %
+                      (choice[0], choice[1], section))
+            elif type(choice) == int:
+                print('Selecting first %s from %s' % (choice, section))
+            elif type(choice) == list:
+                print('Adding %s custom if available' % len(choice))
+            using.update((ex, section) for ex in
+                         catalog.select(section, choice, within=problems))
+        return list(using)
+
     def add_homework_problems(self, driver, problems):
-        """Add assessments to a homework."""
+        """Add assessments to a homework.
+
+        With a catalog cache the exercises are chosen before the picker
+        opens and the picker is only read when the cached catalog is
+        missing, lacks a requested section or is for another ecosystem.
+        """
         wait = WebDriverWait(driver, Assignment.WAIT_TIME)
+        key = self.catalog_key(driver) if self.catalog_cache is not None \
+            else None
+        catalog = self.catalog_cache.load(*key) if key else None
+        using = None
+        if catalog is not None and catalog.covers(problems):
+            using = self.plan_exercises(catalog, problems)
         driver.find_element(By.ID, 'problems-select').click()
         wait.until(
             expect.visibility_of_element_located(
@@ -620,63 +995,21 @@ class Assignment(object):
         driver.find_element(
             By.XPATH, '//button[contains(@class,"-show-problems")]'
         ).click()
-        all_available = self.find_all_questions(driver, problems)
-        using = []
-        # print('AHP - Selection list: %s' % selections)
-        for section in problems:
-            if problems is None or str(problems).lower() == 'none':
-                print('%s: No exercises (%s)' % (section, problems[section]))
-                continue
-            # Set maximum Tutor-selected problems
-            if section == 'tutor':
-                print('Using %s Tutor selections' % problems[section])
-                self.set_tutor_selections(driver, problems)
-            # Select all exercises in the section
-            elif problems[section] == 'all':
-                print('Selecting all from %s' % section)
-                available = self.get_chapter_list(all_available, section) if \
-                    'ch' in section else all_available[section]
-                for ex in available:
-                    using.append(ex)
-            # Select between X and Y exercises, inclusive, from the section
-            elif type(problems[section]) == tuple:
-                low, high = problems[section]
-                total = random.randint(int(low), int(high))
-                print('Selecting %s random from %s (%s to %s)' %
-                      (total, section, low, high))
-                available = self.get_chapter_list(all_available, section) if \
-                    'ch' in section else all_available[section]
-                for _ in range(total):
-                    ex = random.randint(0, len(available) - 1)
-                    using.append(available[ex])
-                    available.remove(available[ex])
-            # Select the first X exercises from the section
-            elif type(problems[section]) == int:
-                print('Selecting first %s from %s' %
-                      (problems[section], section))
-                available = self.get_chapter_list(all_available, section) if \
-                    'ch' in section else all_available[section]
-                for position in range(problems[section]):
-                    using.append(available[position])
-            elif type(problems[section]) == list:
-                print('Adding %s custom if available' % len(problems[section]))
-                for ex in problems[section]:
-                    for section in all_available:
-                        if ex in all_available[section]:
-                            using.append(ex)
-        for exercise in set(using):
-            add_button = driver.find_element(
-                By.XPATH,
-                '//span[contains(text(),"%s")]' % exercise +
-                '/../../div[@class="controls-overlay"]')
-            Assignment.scroll_to(driver, add_button)
-            ac = ActionChains(driver)
-            time.sleep(0.5)
-            ac.move_to_element(add_button)
-            for _ in range(60):
-                ac.move_by_offset(-1, 0)
-            ac.click()
-            ac.perform()
+        if using is None:
+            catalog = ExerciseCatalog(
+                self.find_all_questions(driver, problems),
+                [section for section in problems if section != 'tutor']
+            )
+            if key:
+                self.catalog_cache.save(catalog, *key)
+            using = self.plan_exercises(catalog, problems)
+        else:
+            self.wait_for_exercises(driver)
+        # Set maximum Tutor-selected problems
+        if str(problems.get('tutor')).lower() != 'none':
+            print('Using %s Tutor selections' % problems['tutor'])
+            self.set_tutor_selections(driver, problems)
+        self.select_exercises(driver, using)
         wait.until(
             expect.visibility_of_element_located(
                 (By.XPATH, '//*[text()="Next"]')
@@ -763,7 +1096,8 @@ class Assignment(object):
         print('Creating a new External Assignment')
         self.open_assignment_menu(driver)
         driver.find_element(By.LINK_TEXT, 'Add External Assignment').click()
-        time.sleep(1)
+        # the clickable wait below replaces the pause in fast mode
+        WaitStrategy.pause('assignment_form')
         wait = WebDriverWait(driver, Assignment.WAIT_TIME * 3)
         wait.until(
             expect.element_to_be_clickable(
@@ -811,7 +1145,8 @@ class Assignment(object):
         print('Creating a new Event')
         self.open_assignment_menu(driver)
         driver.find_element(By.LINK_TEXT, 'Add Event').click()
-        time.sleep(1)
+        # the clickable wait below replaces the pause in fast mode
+        WaitStrategy.pause('assignment_form')
         wait = WebDriverWait(driver, Assignment.WAIT_TIME * 3)
         wait.until(
             expect.element_to_be_clickable(
@@ -890,7 +1225,16 @@ class Assignment(object):
                 (By.XPATH, '//a[label[text()="%s"]]' % title)
             )
         ).click()
-        time.sleep(0.3)
+        # the edit modal is optional, so never wait longer than the old pause
+        WaitStrategy.pause(
+            'plan_open',
+            driver,
+            lambda browser: browser.execute_script(
+                'return document.getElementsByClassName(' +
+                '"-edit-assignment").length > 0;'
+            ),
+            timeout=WaitStrategy.DELAYS['plan_open']
+        )
         try:
             modal = driver.find_element(By.CLASS_NAME, '-edit-assignment')
             Assignment.scroll_to(driver, modal)
@@ -946,6 +1290,18 @@ class Assignment(object):
         )
 
 
+class AssignmentError(Exception):
+    """Assignment error exception."""
+
+    def __init__(self, value):
+        """Exception initializer."""
+        self.value = value
+
+    def __str__(self):
+        """Return string of the exception text."""
+        return repr(self.value)
+
+
 if __name__ == '__main__':
     # Test Assignment work
     import os
@@ -0,0 +1,260 @@
+"""Create assignments through the Tutor API instead of the plan form."""
+
+import datetime
+import random
+
+try:
+    from staxing.http_session import BrowserSession
+except ImportError:
+    from http_session import BrowserSession
+
+__version__ = '0.0.1'
+
+
+class AssignmentAPI(object):
+    """Send Teacher.add_assignment arguments as direct API requests.
+
+    The args dictionary is the one the form-driven Assignment.add methods
+    take: title, description, periods, status and, by assignment type,
+    reading_list, problems, url and feedback.
+    """
+
+    TYPES = ('reading', 'homework', 'external', 'event')
+    CSRF_SCRIPT = '''
+        var meta = document.querySelector('meta[name="csrf-token"]');
+        return meta ? meta.getAttribute('content') : null;
+    '''
+    DATE_FORMAT = '%m/%d/%Y'
+    TIME_FORMAT = '%I:%M %p'
+    DEFAULT_OPEN_TIME = '00:01'
+    DEFAULT_DUE_TIME = '07:00'
+    TUTOR_SELECTIONS = 3
+
+    def __init__(self, session, site, csrf_token=None, timeout=30):
+        """Constructor.
+
+        session (requests.Session): logged-in HTTP session
+        site (string): Tutor server root URL
+        csrf_token (string): token sent with write requests
+        timeout (int): seconds per request
+        """
+        self.session = session
+        self.site = site.rstrip('/')
+        self.timeout = timeout
+        self.courses = {}
+        self.readings = {}
+        self.session.headers['Accept'] = 'application/json'
+        if csrf_token:
+            self.session.headers['X-CSRF-Token'] = csrf_token
+
+    @classmethod
+    def from_driver(cls, driver, site, timeout=30):
+        """Return an API client using a WebDriver's logged-in session."""
+        try:
+            token = driver.execute_script(AssignmentAPI.CSRF_SCRIPT)
+        except Exception:
+            token = None
+        return cls(BrowserSession.from_driver(driver), site, token, timeout)
+
+    def request(self, method, path, payload=None, params=None):
+        """Send one request and return the decoded JSON response."""
+        response = self.session.request(
+            method,
+            '%s/api/%s' % (self.site, path.lstrip('/')),
+            json=payload,
+            params=params,
+            timeout=self.timeout
+        )
+        if response.status_code >= 400:
+            raise AssignmentAPIError('%s %s returned %s: %s' % (
+                method, path, response.status_code, response.text[:200]))
+        return response.json() if response.content else None
+
+    def course(self, course_id):
+        """Return the course record, fetched once per client."""
+        course_id = '%s' % course_id
+        if course_id not in self.courses:
+            self.courses[course_id] = self.request('GET',
+                                                   'courses/%s' % course_id)
+        return self.courses[course_id]
+
+    def period_ids(self, course, periods):
+        """Map period names (or 'all') to (period ID, dates) pairs."""
+        active = [period for period in course.get('periods', [])
+                  if not period.get('is_archived')]
+        by_name = {period['name']: period['id'] for period in active}
+        if 'all' in periods:
+            return [(period['id'], periods['all']) for period in active]
+        missing = [name for name in periods if name not in by_name]
+        if missing:
+            raise AssignmentAPIError('Unknown periods: %s' % missing)
+        return [(by_name[name], dates) for name, dates in periods.items()]
+
+    def timestamp(self, value, default_time):
+        """Convert an Assignment date or (date, time) to an API timestamp."""
+        if isinstance(value, tuple):
+            day, clock = value
+            moment = datetime.datetime.strptime(
+                '%s %s' % (day, clock.upper()),
+                '%s %s' % (AssignmentAPI.DATE_FORMAT,
+                           AssignmentAPI.TIME_FORMAT)
+            )
+        else:
+            moment = datetime.datetime.strptime(
+                '%s %s' % (value, default_time),
+                '%s %%H:%%M' % AssignmentAPI.DATE_FORMAT
+            )
+        return moment.strftime('%Y-%m-%d %H:%M')
+
+    def tasking_plans(self, course, periods):
+        """Return the per-period open and due dates."""
+        open_time = course.get('default_open_time') or \
+            AssignmentAPI.DEFAULT_OPEN_TIME
+        due_time = course.get('default_due_time') or \
+            AssignmentAPI.DEFAULT_DUE_TIME
+        plans = []
+        for period_id, (opens_on, closes_on) in \
+                self.period_ids(course, periods):
+            plans.append({
+                'target_id': '%s' % period_id,
+                'target_type': 'period',
+                'opens_at': self.timestamp(opens_on, open_time),
+                'due_at': self.timestamp(closes_on, due_time),
+            })
+        return plans
+
+    def book_pages(self, ecosystem_id):
+        """Return {chapter.section: page ID} for an ecosystem's book."""
+        if ecosystem_id in self.readings:
+            return self.readings[ecosystem_id]
+        pages = {}
+        nodes = list(self.request('GET',
+                                  'ecosystems/%s/readings' % ecosystem_id))
+        while nodes:
+            node = nodes.pop()
+            nodes.extend(node.get('children', []))
+            if node.get('type') == 'page' or not node.get('children'):
+                section = node.get('chapter_section', [])
+                pages['.'.join('%s' % part for part in section)] = \
+                    '%s' % node['id']
+        self.readings[ecosystem_id] = pages
+        return pages
+
+    def page_ids(self, ecosystem_id, sections):
+        """Map 'ch<n>' and '<chapter>.<section>' names to page IDs."""
+        pages = self.book_pages(ecosystem_id)
+        selected = []
+        for section in sections:
+            if section.startswith('ch'):
+                prefix = section[2:] + '.'
+                matches = sorted(
+                    (key for key in pages if key.startswith(prefix)),
+                    key=lambda key: [int(part) for part in key.split('.')]
+                )
+            else:
+                matches = [section] if section in pages else []
+            if not matches:
+                raise AssignmentAPIError('Unknown book section: %s' % section)
+            selected.extend(pages[key] for key in matches
+                            if pages[key] not in selected)
+        return selected
+
+    def exercises(self, ecosystem_id, page_ids):
+        """Return the homework exercises for the pages as (uid, ID) pairs."""
+        data = self.request(
+            'GET',
+            'ecosystems/%s/exercises/homework_core' % ecosystem_id,
+            params={'page_ids[]': page_ids}
+        )
+        items = data.get('items', []) if isinstance(data, dict) else data
+        return [
+            (item.get('content', {}).get('uid', item.get('uid', '')),
+             '%s' % item['id'])
+            for item in items
+        ]
+
+    def homework_settings(self, ecosystem_id, problems):
+        """Translate the homework problems dictionary to plan settings."""
+        sections = [key for key in problems if key != 'tutor']
+        section_pages = [(section, self.page_ids(ecosystem_id, [section]))
+                         for section in sections]
+        page_ids = []
+        for _, pages in section_pages:
+            page_ids.extend(page for page in pages if page not in page_ids)
+        selected = []
+        for section, pages in section_pages:
+            choice = problems[section]
+            if choice is None or str(choice).lower() == 'none':
+                continue
+            available = self.exercises(ecosystem_id, pages)
+            if choice == 'all':
+                chosen = available
+            elif isinstance(choice, int):
+                chosen = available[:choice]
+            elif isinstance(choice, tuple):
+                count = random.randint(*choice)
+                chosen = random.sample(available, min(count, len(available)))
+            else:
+                wanted = ['%s' % uid for uid in choice]
+                chosen = [item for item in available
+                          if item[0].split('@')[0] in wanted]
+                if len(chosen) < len(wanted):
+                    raise AssignmentAPIError(
+                        'Exercises not in %s: %s' % (section, wanted))
+            selected.extend(exercise_id for _, exercise_id in chosen
+                            if exercise_id not in selected)
+        return {
+            'page_ids': page_ids,
+            'exercise_ids': selected,
+            'exercises_count_dynamic':
+                problems.get('tutor', AssignmentAPI.TUTOR_SELECTIONS),
+        }
+
+    def plan(self, assignment, course, args):
+        """Return the task plan payload for an assignment."""
+        if assignment not in AssignmentAPI.TYPES:
+            raise AssignmentAPIError('Unknown assignment type: %s' %
+                                     assignment)
+        ecosystem_id = course.get('ecosystem_id')
+        if assignment == 'reading':
+            settings = {'page_ids': self.page_ids(ecosystem_id,
+                                                  args['reading_list'])}
+        elif assignment == 'homework':
+            settings = self.homework_settings(ecosystem_id, args['problems'])
+        elif assignment == 'external':
+            settings = {'external_url': args['url']}
+        else:
+            settings = {}
+        return {
+            'title': args['title'],
+            'description': args.get('description', ''),
+            'type': assignment,
+            'ecosystem_id': ecosystem_id,
+            'is_feedback_immediate': args.get('feedback') != 'non-immediate',
+            'settings': settings,
+            'tasking_plans': self.tasking_plans(course, args['periods']),
+            'is_publish': args['status'] == 'publish',
+        }
+
+    def add(self, assignment, course_id, args):
+        """Create the assignment and return the new plan record.
+
+        A 'cancel' status creates nothing and returns None, as cancelling
+        the form does.
+        """
+        if args['status'] == 'cancel':
+            return None
+        payload = self.plan(assignment, self.course(course_id), args)
+        return self.request('POST', 'courses/%s/plans' % course_id, payload)
+
+
+class AssignmentAPIError(Exception):
+    """Assignment API error exception."""
+
+    def __init__(self, value):
+        """Exception initializer."""
+        self.value = value
+
+    def __str__(self):
+        """Return string of the exception text."""
+        return repr(self.value)
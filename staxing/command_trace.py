@@ -0,0 +1,171 @@
+"""WebDriver wire-command tracer grouped by staxing operation."""
+
+import json
+import os
+import sys
+import threading
+import time
+
+__version__ = '0.0.1'
+
+
+class CommandTracer(object):
+    """Count and time every WebDriver command a driver sends.
+
+    Each command is attributed to the outermost staxing method on the call
+    stack, so the commands inside Assignment.add_new_reading are reported
+    against it rather than against the helpers it calls.
+    """
+
+    PACKAGE = os.path.dirname(os.path.abspath(__file__))
+    IGNORED = ('command_trace.py', 'wait_ledger.py')
+
+    def __init__(self, driver):
+        """Constructor."""
+        self.driver = driver
+        self.commands = []
+        self.started = None
+        self._lock = threading.Lock()
+        self._tracing = False
+
+    def __enter__(self):
+        """Entry point."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Class exitor."""
+        self.stop()
+
+    def start(self):
+        """Wrap the driver's command executor."""
+        if self._tracing:
+            return self
+        original = self.driver.execute
+        tracer = self
+
+        def execute(driver_command, params=None):
+            operation = tracer.operation()
+            start = time.time()
+            try:
+                return original(driver_command, params)
+            finally:
+                tracer.record(driver_command, operation, start,
+                              time.time() - start)
+
+        if self.started is None:
+            self.started = time.time()
+        self.driver.execute = execute
+        self._tracing = True
+        return self
+
+    def stop(self):
+        """Restore the driver's command executor."""
+        if self._tracing:
+            # drop the instance wrapper so the class method is used again
+            del self.driver.execute
+            self._tracing = False
+        return self
+
+    def record(self, command, operation, start, duration):
+        """Add one command to the trace."""
+        with self._lock:
+            self.commands.append({
+                'command': command,
+                'operation': operation,
+                'start': start,
+                'duration': duration,
+                'thread': threading.current_thread().ident,
+            })
+
+    def operation(self):
+        """Return the outermost staxing method on the call stack."""
+        frame = sys._getframe(2)
+        outermost = None
+        while frame is not None:
+            filename = os.path.abspath(frame.f_code.co_filename)
+            if filename.startswith(CommandTracer.PACKAGE) and \
+                    os.path.basename(filename) not in CommandTracer.IGNORED:
+                owner = frame.f_locals.get('self', frame.f_locals.get('cls'))
+                if owner is not None:
+                    owner = owner if isinstance(owner, type) else type(owner)
+                    outermost = '%s.%s' % (owner.__name__,
+                                           frame.f_code.co_name)
+                elif frame.f_code.co_name != '<lambda>':
+                    outermost = frame.f_code.co_name
+            frame = frame.f_back
+        return outermost or 'direct'
+
+    def counts(self):
+        """Return {operation: {command: count}}."""
+        counts = {}
+        with self._lock:
+            for entry in self.commands:
+                commands = counts.setdefault(entry['operation'], {})
+                commands[entry['command']] = \
+                    commands.get(entry['command'], 0) + 1
+        return counts
+
+    def summary(self):
+        """Return per-operation round trips and time, most trips first."""
+        operations = {}
+        with self._lock:
+            for entry in self.commands:
+                operation = operations.setdefault(entry['operation'], {
+                    'operation': entry['operation'],
+                    'round_trips': 0,
+                    'total': 0.0,
+                })
+                operation['round_trips'] += 1
+                operation['total'] += entry['duration']
+        return sorted(operations.values(),
+                      key=lambda operation: -operation['round_trips'])
+
+    def to_json(self, path=None):
+        """Return the trace as JSON and optionally write it to path."""
+        with self._lock:
+            commands = list(self.commands)
+        data = json.dumps({
+            'summary': self.summary(),
+            'counts': self.counts(),
+            'commands': commands,
+        }, indent=2)
+        if path:
+            with open(path, 'w') as trace_file:
+                trace_file.write(data)
+        return data
+
+    def to_chrome_trace(self, path=None):
+        """Return the trace in Chrome trace-event format.
+
+        The file opens in chrome://tracing or the Performance panel.
+        """
+        origin = self.started or 0
+        with self._lock:
+            events = [
+                {
+                    'name': entry['command'],
+                    'cat': entry['operation'],
+                    'ph': 'X',
+                    'ts': int((entry['start'] - origin) * 1e6),
+                    'dur': int(entry['duration'] * 1e6),
+                    'pid': os.getpid(),
+                    'tid': entry['thread'],
+                    'args': {'operation': entry['operation']},
+                }
+                for entry in self.commands
+            ]
+        data = json.dumps({'traceEvents': events})
+        if path:
+            with open(path, 'w') as trace_file:
+                trace_file.write(data)
+        return data
+
+    def report(self, stream=None):
+        """Print round trips and time per operation."""
+        stream = stream or sys.stdout
+        stream.write('\n%11s %9s  %s\n' % ('round trips', 'time', 'operation'))
+        for operation in self.summary():
+            stream.write('%11d %8.2fs  %s\n' % (
+                operation['round_trips'], operation['total'],
+                operation['operation']
+            ))
@@ -0,0 +1,215 @@
+"""Index of the exercises available to a homework."""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+
+from collections import OrderedDict
+
+try:
+    from staxing.session_store import SessionStore
+except ImportError:
+    from session_store import SessionStore
+
+__version__ = '0.0.1'
+
+
+class ExerciseCatalog(object):
+    """Exercise IDs by section and chapter, built once per picker load.
+
+    Exercise IDs carry a version suffix (4321@2); lookups also accept the
+    bare ID. Selections return new lists and never change the index.
+    covered holds the sections and 'ch<n>' chapters read in full.
+    """
+
+    ALL = 'all'
+
+    def __init__(self, questions=None, covered=None):
+        """Constructor.
+
+        questions (dict): {section: [exercise IDs]}, as returned by
+            Assignment.find_all_questions
+        covered (list): sections and chapters the questions hold in full;
+            defaults to the question sections
+        """
+        self.sections = OrderedDict()
+        self.chapters = OrderedDict()
+        self.index = {}
+        self.versions = {}
+        self.covered = set()
+        for section, exercises in (questions or {}).items():
+            self.add(section, exercises)
+        self.covered.update(covered or [])
+
+    def __len__(self):
+        """Return the number of exercises."""
+        return len(self.index)
+
+    def __iter__(self):
+        """Iterate over the section names."""
+        return iter(self.sections)
+
+    def __contains__(self, exercise):
+        """Return True for a known exercise ID, with or without version."""
+        return self.find(exercise) is not None
+
+    def add(self, section, exercises):
+        """Index the exercises of one section."""
+        section = '%s' % section
+        chapter = section.split('.')[0]
+        listed = self.sections.setdefault(section, [])
+        self.covered.add(section)
+        in_chapter = self.chapters.setdefault(chapter, [])
+        for exercise in exercises:
+            if exercise in self.index:
+                continue
+            self.index[exercise] = section
+            self.versions.setdefault(exercise.split('@')[0], exercise)
+            listed.append(exercise)
+            in_chapter.append(exercise)
+
+    def update(self, catalog):
+        """Add the sections and coverage of another catalog."""
+        for section, exercises in catalog.sections.items():
+            self.add(section, exercises)
+        self.covered.update(catalog.covered)
+
+    def covers(self, sections):
+        """Return True if every section or 'ch<n>' chapter is read in full.
+
+        The 'tutor' key of a problems dictionary is ignored.
+        """
+        return all(
+            section in self.covered or
+            'ch%s' % section.split('.')[0] in self.covered
+            for section in ('%s' % name for name in sections)
+            if section != 'tutor'
+        )
+
+    def find(self, exercise):
+        """Return the catalog ID for an exercise ID or None."""
+        exercise = '%s' % exercise
+        if exercise in self.index:
+            return exercise
+        return self.versions.get(exercise)
+
+    def section_of(self, exercise):
+        """Return the section holding an exercise or None."""
+        return self.index.get(self.find(exercise))
+
+    def available(self, section):
+        """Return the exercises in a section or a 'ch<n>' chapter."""
+        section = '%s' % section
+        if section.startswith('ch'):
+            return list(self.chapters.get(section[2:], []))
+        return list(self.sections.get(section, []))
+
+    def select(self, section, choice, within=None):
+        """Return the exercises chosen from a section.
+
+        choice: 'all', the first N (int), N random between low and high
+            inclusive (tuple), or specific exercise IDs (list)
+        within (list): sections and 'ch<n>' chapters that specific IDs must
+            belong to; defaults to the whole catalog
+        """
+        if choice is None or str(choice).lower() == 'none':
+            return []
+        if isinstance(choice, (list, set)):
+            if within is not None:
+                within = set('%s' % name for name in within)
+            return [found for found in (self.find(exercise)
+                                        for exercise in choice)
+                    if found is not None and
+                    (within is None or self.index[found] in within or
+                     'ch%s' % self.index[found].split('.')[0] in within)]
+        available = self.available(section)
+        if choice == ExerciseCatalog.ALL:
+            return available
+        if isinstance(choice, tuple):
+            low, high = choice
+            total = random.randint(int(low), int(high))
+            return random.sample(available, min(total, len(available)))
+        return available[:int(choice)]
+
+    def as_dict(self):
+        """Return {section: [exercise IDs]}."""
+        return OrderedDict((section, list(exercises))
+                           for section, exercises in self.sections.items())
+
+
+class CatalogCache(object):
+    """On-disk exercise catalogs by site and course.
+
+    Each file holds one ecosystem version of a course's catalog; a load for
+    any other version misses, and the next save replaces the file.
+    """
+
+    DEFAULT_DIRECTORY = os.path.join(
+        os.path.expanduser('~'), '.staxing', 'catalogs'
+    )
+
+    def __init__(self, directory=None):
+        """Constructor.
+
+        directory (string): folder holding the catalog files
+        """
+        self.directory = directory or os.getenv(
+            'STAXING_CATALOG_DIR',
+            CatalogCache.DEFAULT_DIRECTORY
+        )
+        self._lock = threading.Lock()
+
+    def path(self, site, course_id):
+        """Return the catalog file for a site and course."""
+        key = '%s|%s' % (SessionStore.origin(site), course_id)
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, '%s.json' % digest)
+
+    def read(self, site, course_id):
+        """Return the stored record for a course or None."""
+        try:
+            with open(self.path(site, course_id)) as catalog_file:
+                return json.load(catalog_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def load(self, site, course_id, version):
+        """Return the cached ExerciseCatalog or None for another version."""
+        record = self.read(site, course_id)
+        if record is None or record.get('version') != '%s' % version:
+            return None
+        return ExerciseCatalog(OrderedDict(record.get('sections', [])),
+                               record.get('covered', []))
+
+    def save(self, catalog, site, course_id, version):
+        """Store a catalog, adding to the sections cached for the version."""
+        with self._lock:
+            cached = self.load(site, course_id, version)
+            if cached is not None:
+                cached.update(catalog)
+                catalog = cached
+            record = {
+                'site': SessionStore.origin(site),
+                'course': '%s' % course_id,
+                'version': '%s' % version,
+                'saved': time.time(),
+                'sections': list(catalog.as_dict().items()),
+                'covered': sorted(catalog.covered),
+            }
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            path = self.path(site, course_id)
+            temp = '%s.%s.%s.tmp' % (path, os.getpid(), threading.get_ident())
+            with open(temp, 'w') as catalog_file:
+                json.dump(record, catalog_file)
+            os.replace(temp, path)
+
+    def discard(self, site, course_id):
+        """Remove a cached catalog."""
+        try:
+            os.remove(self.path(site, course_id))
+        except OSError:
+            pass
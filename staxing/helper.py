@@ -4,15 +4,19 @@ import calendar
 import datetime
 import inspect
 import os
+import queue
 import re
+import time
 
 from autochomsky import chomsky
 from builtins import FileNotFoundError
+from concurrent.futures import ThreadPoolExecutor
 from itertools import repeat
 from random import randint
 from requests import HTTPError
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome import service
 from selenium.webdriver.common.by import By
@@ -26,10 +30,50 @@ try:
     from staxing.assignment import Assignment
 except ImportError:
     from assignment import Assignment
+try:
+    from staxing.assignment_api import AssignmentAPI
+except ImportError:
+    from assignment_api import AssignmentAPI
+try:
+    from staxing.command_trace import CommandTracer
+except ImportError:
+    from command_trace import CommandTracer
+try:
+    from staxing.exercise_catalog import CatalogCache
+except ImportError:
+    from exercise_catalog import CatalogCache
+try:
+    from staxing.http_session import BrowserSession, SmokeCheck
+except ImportError:
+    from http_session import BrowserSession, SmokeCheck
+try:
+    from staxing.launcher import BatchReport, ConcurrentLauncher, LaunchError
+except ImportError:
+    from launcher import BatchReport, ConcurrentLauncher, LaunchError
+try:
+    from staxing.locator_cache import LocatorCache
+except ImportError:
+    from locator_cache import LocatorCache
 try:
     from staxing.page_load import SeleniumWait as Page
 except ImportError:
     from page_load import SeleniumWait as Page
+try:
+    from staxing.session_pool import SessionPool
+except ImportError:
+    from session_pool import SessionPool
+try:
+    from staxing.session_store import SessionStore
+except ImportError:
+    from session_store import SessionStore
+try:
+    from staxing.text_entry import TextEntry
+except ImportError:
+    from text_entry import TextEntry
+try:
+    from staxing.wait_strategy import WaitStrategy
+except ImportError:
+    from wait_strategy import WaitStrategy
 
 __version__ = '0.0.26'
 
@@ -39,6 +83,7 @@ class Helper(object):
 
     CONDENSED_WIDTH = 767  # pixels wide
     DEFAULT_WAIT_TIME = 15  # seconds
+    WINDOW_TOLERANCE = 2  # pixels
     CAPABILITIES = {
         'android': DesiredCapabilities.ANDROID,
         'chrome': DesiredCapabilities.CHROME,
@@ -53,6 +98,31 @@ class Helper(object):
         'phantomjs': DesiredCapabilities.PHANTOMJS,
         'safari': DesiredCapabilities.SAFARI,
     }
+    PROFILES = {
+        'headless-fast': {
+            'headless': True,
+            'window_size': (1300, 768),
+            'arguments': [
+                '--disable-extensions',
+                '--disable-background-networking',
+                '--disable-default-apps',
+                '--disable-sync',
+                '--disable-translate',
+                '--disable-dev-shm-usage',
+                '--disable-gpu',
+                '--no-first-run',
+                '--mute-audio',
+            ],
+        },
+        'headed-debug': {
+            'headless': False,
+            'window_size': (1300, 768),
+            'arguments': [
+                '--disable-extensions',
+                '--disable-background-networking',
+            ],
+        },
+    }
 
     def __init__(self,
                  driver_type='chrome',
@@ -61,25 +131,111 @@ class Helper(object):
                  wait_time=DEFAULT_WAIT_TIME,
                  opera_driver='',
                  existing_driver=None,
+                 pool=None,
+                 lazy=False,
+                 profile=None,
+                 cache_locators=False,
                  **kwargs):
-        """Class constructor."""
+        """Class constructor.
+
+        existing_driver (WebDriver): browser to drive instead of launching
+            one; delete() quits it unless called with quit_driver=False
+        pool (SessionPool): optional warm driver pool; the driver is checked
+            out on construction and checked back in by delete()
+        lazy (bool): postpone the browser launch until driver, wait or page
+            is first used
+        profile (string): named launch profile from Helper.PROFILES
+        cache_locators (bool): reuse find results until the page navigates
+            or a cached element is clicked
+        """
         if driver_type == 'saucelabs' and pasta_user is None:
             raise TypeError('A Sauce Labs user is required for remote testing')
+        if profile is not None and profile not in Helper.PROFILES:
+            raise ValueError('Unknown launch profile: %s' % profile)
         self.pasta = pasta_user
         self.opera_driver = opera_driver
+        self.profile = profile
+        self.pool = pool
+        self.pool_key = None
+        self.wait_time = wait_time
+        self.locator_cache = LocatorCache() if cache_locators else None
+        self._driver = None
+        self._wait = None
+        self._page = None
+        self._launch = None
         if existing_driver:
             self.driver = existing_driver
+            self._wait = WebDriverWait(self._driver, wait_time)
+            self._page = Page(self._driver, wait_time)
         else:
             driver = driver_type if not pasta_user else 'saucelabs'
-            self.driver = self.run_on(driver_type=driver,
-                                      pasta_user=self.pasta,
-                                      capabilities=capabilities)
-            self.driver.implicitly_wait(wait_time)
-        self.wait = WebDriverWait(self.driver, wait_time)
-        self.wait_time = wait_time
-        self.page = Page(self.driver, self.wait_time)
+            self._launch = lambda: self.start_driver(driver, capabilities)
+            if not lazy:
+                self.driver  # launch now
         super(Helper, self).__init__(**kwargs)
 
+    @property
+    def driver(self):
+        """Return the WebDriver, launching it on first use if lazy."""
+        if self._driver is None and self._launch is not None:
+            launch, self._launch = self._launch, None
+            self._driver = launch()
+            self._driver.implicitly_wait(self.wait_time)
+            self._wait = WebDriverWait(self._driver, self.wait_time)
+            self._page = Page(self._driver, self.wait_time)
+        return self._driver
+
+    @driver.setter
+    def driver(self, driver):
+        """Replace the WebDriver."""
+        self._driver = driver
+
+    @property
+    def wait(self):
+        """Return the standard WebDriverWait."""
+        if self._wait is None and self._launch is not None:
+            self.driver
+        return self._wait
+
+    @wait.setter
+    def wait(self, wait):
+        """Replace the standard WebDriverWait."""
+        self._wait = wait
+
+    @property
+    def page(self):
+        """Return the page load watcher."""
+        if self._page is None and self._launch is not None:
+            self.driver
+        return self._page
+
+    @page.setter
+    def page(self, page):
+        """Replace the page load watcher."""
+        self._page = page
+
+    def start_driver(self, driver_type, capabilities=None):
+        """Launch a driver or check one out of the session pool."""
+        if self.pool is None:
+            return self.run_on(driver_type=driver_type,
+                               pasta_user=self.pasta,
+                               capabilities=capabilities,
+                               profile=self.profile)
+        # a checked-in driver may still be signed in elsewhere, so it only
+        # goes back to the same account
+        account = None
+        if getattr(self, 'username', None):
+            account = '%s@%s' % (self.username, self.url)
+        self.pool_key = SessionPool.key(driver_type, capabilities,
+                                        self.profile, account)
+        return self.pool.checkout(
+            self.pool_key,
+            lambda: self.run_on(driver_type=driver_type,
+                                pasta_user=self.pasta,
+                                capabilities=capabilities,
+                                profile=self.profile)
+        )
+
     def __enter__(self):
         """Entry point."""
         return self
@@ -92,26 +248,79 @@ class Helper(object):
         """Class exitor."""
         self.delete()
 
-    def delete(self):
-        """Webdriver destructor."""
+    def delete(self, quit_driver=True):
+        """Webdriver destructor.
+
+        quit_driver (bool): False detaches the browser and leaves it open,
+            for a driver shared with the caller through existing_driver
+        """
+        # a lazy browser that was never used has nothing to close
+        self._launch = None
         self.wait = None
+        if not quit_driver or getattr(self, '_driver', None) is None:
+            self._driver = None
+            return
+        if getattr(self, 'pool', None) is not None and self.pool_key:
+            # return pooled drivers instead of quitting them
+            self.pool.checkin(self.pool_key, self._driver)
+            self.pool_key = None
+            self._driver = None
+            return
         try:
-            self.driver.quit()
+            self._driver.quit()
         except:
             pass
+        self._driver = None
 
     @classmethod
-    def default_capabilities(cls, browser='chrome'):
+    def default_capabilities(cls, browser='chrome', profile=None):
         """Return the default browser capabilities."""
         browser = browser.lower()
         browser = ''.join(browser.split())
-        return Helper.CAPABILITIES[browser].copy()
+        capabilities = Helper.CAPABILITIES[browser].copy()
+        options = Helper.launch_options(browser, profile)
+        if options is not None:
+            capabilities.update(options.to_capabilities())
+        return capabilities
+
+    @classmethod
+    def launch_options(cls, browser='chrome', profile=None):
+        """Return browser options for a named launch profile.
 
-    def run_on(self, driver_type, pasta_user=None, capabilities={}):
+        Only Chrome and Firefox accept launch options; other browsers and an
+        empty profile return None.
+        """
+        if profile is None:
+            return None
+        if profile not in Helper.PROFILES:
+            raise ValueError('Unknown launch profile: %s' % profile)
+        settings = Helper.PROFILES[profile]
+        width, height = settings['window_size']
+        # options.headless was removed in Selenium 4.13, so pass the flags
+        if browser == 'chrome':
+            options = webdriver.ChromeOptions()
+            if settings['headless']:
+                options.add_argument('--headless')
+            options.add_argument('--window-size=%s,%s' % (width, height))
+            for argument in settings['arguments']:
+                options.add_argument(argument)
+            return options
+        if browser == 'firefox':
+            options = webdriver.FirefoxOptions()
+            if settings['headless']:
+                options.add_argument('-headless')
+            options.add_argument('--width=%s' % width)
+            options.add_argument('--height=%s' % height)
+            return options
+        return None
+
+    def run_on(self, driver_type, pasta_user=None, capabilities={},
+               profile=None):
         """Webdriver activation.
 
         driver_type (string): web browser type
         pasta_user (PastaSauce): optional API access for saucelabs
+        profile (string): named launch profile from Helper.PROFILES
         capabilities (dict): browser settings; copy object to avoid overwrite
             Defaults:
                 DesiredCapabilities.ANDROID.copy()
@@ -140,10 +349,20 @@ class Helper(object):
             driver = driver_type
         else:
             driver = 'chrome'
+        if profile and driver == 'saucelabs':
+            capabilities = dict(capabilities or {})
+            browser = str(capabilities.get('browserName', 'chrome')).lower()
+            options = Helper.launch_options(browser, profile)
+            if options is not None:
+                capabilities.update(options.to_capabilities())
         try:
             return {
-                'firefox': lambda: webdriver.Firefox(),
-                'chrome': lambda: webdriver.Chrome(),
+                'firefox': lambda: webdriver.Firefox(
+                    options=Helper.launch_options('firefox', profile)
+                ),
+                'chrome': lambda: webdriver.Chrome(
+                    options=Helper.launch_options('chrome', profile)
+                ),
                 'ie': lambda: webdriver.Ie(),
                 'opera': lambda: self.start_opera(self.opera_driver),
                 'phantomjs': lambda: webdriver.PhantomJS(),
@@ -173,6 +392,10 @@ class Helper(object):
         """Change the max action wait time."""
         if new_wait <= 0:
             raise ValueError('Wait time must be 1 or higher.')
+        if self._driver is None and self._launch is not None:
+            # applied when the lazy browser launches
+            self.wait_time = new_wait
+            return
         self.driver.implicitly_wait(new_wait)
         self.wait = WebDriverWait(self.driver, new_wait)
         self.wait_time = new_wait
@@ -186,6 +409,12 @@ class Helper(object):
         """Return the current URL."""
         self.driver.get(url)
         self.page.wait_for_page_load()
+        self.page.mark_navigation()
+
+    def back(self):
+        """Go back one page in the browser history."""
+        self.driver.back()
+        self.page.mark_navigation()
 
     def get_window_size(self, dimension=None):
         """Return the current window dimensions."""
@@ -202,25 +431,55 @@ class Helper(object):
             self.driver.maximize_window()
         elif width >= 1 and height >= 1:
             self.driver.set_window_size(width, height)
-            sleep(1.0)
+            WaitStrategy.pause(
+                'window_resize',
+                self.driver,
+                lambda driver: Helper.window_matches(
+                    driver.get_window_size(),
+                    {'width': width, 'height': height})
+            )
         return self.get_window_size()
 
     def set_window_position(self, x_=0, y_=0):
         """Move the browser window anchor."""
         if x_ >= 0 and y_ >= 0:
             self.driver.set_window_position(x_, y_)
-            sleep(1.0)
+            WaitStrategy.pause(
+                'window_move',
+                self.driver,
+                lambda driver: Helper.window_matches(
+                    driver.get_window_position(), {'x': x_, 'y': y_})
+            )
+
+    @classmethod
+    def window_matches(cls, actual, expected):
+        """Return True if window values are within WINDOW_TOLERANCE pixels.
+
+        Window managers and display scaling can round the size or position
+        the browser reports.
+        """
+        return all(abs(actual.get(key, 0) - value) <= cls.WINDOW_TOLERANCE
+                   for key, value in expected.items())
 
     def sleep(self, seconds=1):
         """Stop execution for the specified time in seconds."""
         sleep(seconds)
 
+    def trace_commands(self):
+        """Start counting and timing this driver's WebDriver commands."""
+        return CommandTracer(self.driver).start()
+
     def find(self, by, value):
         """Find element."""
+        if self.locator_cache is not None:
+            return self.locator_cache.find(self.driver, by, value, self.page)
         return self.driver.find_element(by=by, value=value)
 
     def find_all(self, by, value):
         """Find elements."""
+        if self.locator_cache is not None:
+            return self.locator_cache.find_all(self.driver, by, value,
+                                               self.page)
         return self.driver.find_elements(by=by, value=value)
 
 
@@ -249,6 +508,28 @@ class User(Helper):
 
     CONDENSED_WIDTH = Helper.CONDENSED_WIDTH
     DEFAULT_WAIT_TIME = Helper.DEFAULT_WAIT_TIME
+    RESET_PASSWORD = 'reset'
+    AGREEMENT = 'agreement'
+    INTERSTITIAL_SCRIPT = '''
+        if (document.getElementById('reset_password_password')) {
+            return 'reset';
+        }
+        if (document.getElementById('i_agree')) { return 'agreement'; }
+        return null;
+    '''
+    # user menu link text -> (path below /courses/<course ID>/, locator of an
+    # element the page shows); unconfirmed, so routes are opt-in
+    ROUTES = {}
+    ROUTE_WAIT = 5  # seconds
+    SIGNED_OUT_SCRIPT = '''
+        if (document.getElementById('auth_key')) { return true; }
+        var links = document.getElementsByTagName('a');
+        for (var i = 0; i < links.length; i++) {
+            var text = links[i].textContent.trim();
+            if (text == 'Login' || text == 'Sign in') { return true; }
+        }
+        return false;
+    '''
 
     def __init__(self,
                  username,
@@ -263,6 +544,7 @@ class User(Helper):
                  wait_time=DEFAULT_WAIT_TIME,
                  opera_driver='',
                  existing_driver=None,
+                 session_store=None,
                  **kwargs):
         """
         Base user constructor.
@@ -293,8 +575,12 @@ class User(Helper):
                 javascriptEnabled
         wait (int): standard time, in seconds, to wait for Selenium commands
         opera_driver (string): Chromium location
+        session_store (SessionStore): optional saved login sessions; True
+            uses the default store location
         """
         self.username = username
+        self.session_store = SessionStore() if session_store is True \
+            else session_store
         self.password = password
         parse = list(
             urlparse(
@@ -333,6 +619,9 @@ class User(Helper):
         username = self.username if not username else username
         password = self.password if not password else password
         url_address = self.url if not url else url
+        if self.session_store is not None and \
+                self.resume_session(url_address, username):
+            return
         # open the URL
         self.get(url_address)
         self.page.wait_for_page_load()
@@ -363,45 +652,77 @@ class User(Helper):
             raise self.LoginError('Non-OpenStax URL: %s' %
                                   self.driver.current_url)
         # enter the username and password
-        self.driver.find_element(By.ID, 'auth_key').send_keys(username)
-        self.driver.find_element(By.ID, 'password').send_keys(password)
+        TextEntry(self.driver).fill({
+            'auth_key': username,
+            'password': password,
+        })
         # click on the sign in button
         self.driver.find_element(
             By.XPATH, '//button[text()="Sign in"]'
         ).click()
         self.page.wait_for_page_load()
-        # check if a password change is required
-        if 'Reset Password' in self.driver.page_source:
-            try:
-                self.driver.find_element(
-                    By.ID,
-                    'reset_password_password'
-                ).send_keys(self.password)
-                self.driver.find_element(
-                    By.ID,
-                    'reset_password_password_confirmation'
-                ).send_keys(self.password)
-                self.driver.find_element(
-                    By.XPATH,
-                    '//input[@value="Set Password"]'
-                ).click()
-            except Exception as e:
-                raise e
-        self.page.wait_for_page_load()
-        if 'Terms of Use' in self.driver.page_source:
-            try:
-                self.driver.find_element(By.ID, 'i_agree').click()
-                self.driver.find_element(By.ID, 'agreement_submit').click()
-            except Exception as e:
-                raise e
-        self.page.wait_for_page_load()
-        if 'Privacy Policy' in self.driver.page_source:
+        self.clear_interstitials()
+        if self.session_store is not None:
+            self.session_store.save(self.driver, url_address, username)
+
+    def clear_interstitials(self):
+        """Complete password reset and agreement pages after a login.
+
+        Each page is done once it is replaced, so back-to-back agreements
+        (terms of use, then privacy policy) are each accepted in turn.
+        """
+        interstitial = self.detect_interstitial()
+        while interstitial is not None:
+            handled = self.handle_interstitial(interstitial)
             try:
-                self.driver.find_element(By.ID, 'i_agree').click()
-                self.driver.find_element(By.ID, 'agreement_submit').click()
-            except Exception as e:
-                raise e
-        self.page.wait_for_page_load()
+                self.wait.until(expect.staleness_of(handled))
+            except TimeoutException:
+                raise LoginError('Unable to clear the %s page' % interstitial)
+            interstitial = self.detect_interstitial()
+
+    def detect_interstitial(self):
+        """Return which post-login interstitial is showing, if any.
+
+        Returns User.RESET_PASSWORD, User.AGREEMENT or None using a single
+        in-browser check.
+        """
+        return self.driver.execute_script(User.INTERSTITIAL_SCRIPT)
+
+    def handle_interstitial(self, interstitial):
+        """Complete a password reset or accept an agreement.
+
+        Return the page element that goes stale once the page is replaced.
+        """
+        if interstitial == User.RESET_PASSWORD:
+            field = self.driver.find_element(By.ID, 'reset_password_password')
+            field.send_keys(self.password)
+            self.driver.find_element(
+                By.ID,
+                'reset_password_password_confirmation'
+            ).send_keys(self.password)
+            self.driver.find_element(
+                By.XPATH,
+                '//input[@value="Set Password"]'
+            ).click()
+            return field
+        elif interstitial == User.AGREEMENT:
+            agree = self.driver.find_element(By.ID, 'i_agree')
+            agree.click()
+            self.driver.find_element(By.ID, 'agreement_submit').click()
+            return agree
+        raise ValueError('Unknown interstitial: %s' % interstitial)
+
+    def resume_session(self, url, username):
+        """Restore a saved login and confirm it with one page request."""
+        if not self.session_store.restore(self.driver, url, username):
+            return False
+        self.get(url)
+        if self.driver.execute_script(User.SIGNED_OUT_SCRIPT):
+            # expired on the server; fall back to the full login
+            self.session_store.discard(url, username)
+            self.driver.delete_all_cookies()
+            return False
+        return True
 
     def logout(self):
         """Logout control."""
@@ -519,6 +840,36 @@ class User(Helper):
         ).click()
         self.page.wait_for_page_load()
 
+    def goto_route(self, item):
+        """Load a course page by URL from the route table.
+
+        Return False when the item has no route, no course is open or the
+        page's marker element does not appear; in the last case the browser
+        goes back to the page it was on.
+        """
+        route = self.ROUTES.get(item)
+        course_id = self.get_course_id()
+        if route is None or course_id is None:
+            return False
+        path, marker = route
+        parsed = urlparse(self.driver.current_url)
+        self.get('%s://%s/courses/%s/%s' %
+                 (parsed.scheme, parsed.netloc, course_id, path))
+        try:
+            WebDriverWait(self.driver, User.ROUTE_WAIT).until(
+                expect.visibility_of_element_located(marker)
+            )
+        except TimeoutException:
+            print('%s not found at %s' % (item, path))
+            self.back()
+            return False
+        return True
+
+    def get_course_id(self):
+        """Return the course ID from the current URL or None."""
+        match = re.search(r'/courses/(\d+)', self.driver.current_url)
+        return match.group(1) if match else None
+
     def view_reference_book(self):
         """Access the reference book."""
         try:
@@ -551,6 +902,46 @@ class Teacher(User):
 
     CONDENSED_WIDTH = User.CONDENSED_WIDTH
     DEFAULT_WAIT_TIME = User.DEFAULT_WAIT_TIME
+    BOOK_SECTION_TTL = 60 * 60  # seconds
+    UI = 'ui'
+    API = 'api'
+    ROUTES = {
+        'Performance Forecast': ('t/guide',
+                                 (By.CLASS_NAME, 'guide-container')),
+        'Student Scores': ('t/scores', (By.CLASS_NAME, 'scores-report')),
+        'Course Settings and Roster': ('t/settings',
+                                       (By.CLASS_NAME, 'course-settings')),
+    }
+    CALENDAR_DATE = re.compile(r'(?<=/)\d{4}-\d{2}-\d{2}(?=[/?#]|$)')
+    EXPAND_CHAPTERS_SCRIPT = '''
+        var links = document.querySelectorAll('a[href="#"]');
+        for (var i = 0; i < links.length; i++) {
+            if (links[i].getElementsByTagName('span').length &&
+                    links[i].getAttribute('aria-expanded') != 'true') {
+                links[i].click();
+            }
+        }
+    '''
+    SECTION_LABELS_SCRIPT = '''
+        var links = document.querySelectorAll('a[href="#"]');
+        for (var i = 0; i < links.length; i++) {
+            if (links[i].getElementsByTagName('span').length &&
+                    links[i].getAttribute('aria-expanded') != 'true') {
+                return null;
+            }
+        }
+        var labels = [];
+        var spans = document.querySelectorAll(
+            'div[class="section"] > span[class="chapter-section"]'
+        );
+        for (var j = 0; j < spans.length; j++) {
+            labels.push(spans[j].textContent.trim());
+        }
+        return labels.length ? labels : null;
+    '''
+
+    # (site, course ID, book version) -> (time read, [sections])
+    book_sections = {}
 
     def __init__(self,
                  use_env_vars=False,
@@ -569,9 +960,19 @@ class Teacher(User):
         super(Teacher, self).__init__(existing_driver=existing_driver,
                                       **kwargs)
 
-    def add_assignment(self, assignment, args):
-        """Add an assignment."""
-        assign = Assignment()
+    def add_assignment(self, assignment, args, backend=UI, assign=None):
+        """Add an assignment.
+
+        backend (string): Teacher.UI fills in the plan form; Teacher.API
+            creates the plan with direct requests using the browser's
+            session and returns the new plan record
+        assign (Assignment): Assignment instance to add with, so a caller
+            can share its exercise catalog cache between calls
+        """
+        if backend == Teacher.API:
+            return self.assignment_api().add(assignment,
+                                             self.get_course_id(), args)
+        assign = assign or Assignment()
         assign.add[assignment](
             driver=self.driver,
             name=args['title'],
@@ -585,6 +986,131 @@ class Teacher(User):
             feedback=args['feedback'] if 'feedback' in args else None
         )
 
+    def assignment_api(self):
+        """Return an AssignmentAPI client for the current course."""
+        if self.get_course_id() is None:
+            raise ValueError('Select a course before adding assignments')
+        parsed = urlparse(self.driver.current_url)
+        return AssignmentAPI.from_driver(
+            self.driver, '%s://%s' % (parsed.scheme, parsed.netloc)
+        )
+
+    def add_assignments(self, items, backend=UI, workers=1, pool=None,
+                        catalog_cache=None):
+        """Add several assignments and return a BatchReport.
+
+        items ([(string, dict)]): assignment type and add_assignment args
+        backend (string): Teacher.UI or Teacher.API
+        workers (int): assignments created at once; extra UI workers are
+            new browsers that log in as this teacher and open this course
+        pool (SessionPool): warm driver pool for the extra UI workers
+        catalog_cache (CatalogCache): exercise catalogs shared by the UI
+            workers; True uses the default directory
+        Items are handed to whichever worker is free. Workers that fail to
+        start or to open the course are listed in report.launch_errors and
+        their items go to the others.
+        """
+        items = list(items)
+        report = BatchReport(len(items))
+        if not items:
+            return report
+        start = time.time()
+        workers = max(1, min(workers, len(items)))
+        course = self.driver.current_url
+        pending = queue.Queue()
+        for index, item in enumerate(items):
+            pending.put((index, item))
+        if backend == Teacher.API:
+            course_id = self.get_course_id()
+            runners = [
+                (number, None,
+                 lambda kind, args, api=self.assignment_api():
+                    api.add(kind, course_id, args))
+                for number in range(workers)
+            ]
+        else:
+            launched = ConcurrentLauncher().launch(
+                (Teacher, {'username': self.username,
+                           'password': self.password,
+                           'site': self.url,
+                           'pool': pool,
+                           'session_store': self.session_store})
+                for _ in range(workers - 1)
+            )
+            for index, err in launched.errors.items():
+                print('Worker %s did not start: %s' % (index + 1, err))
+                report.record_launch_error(index + 1, err)
+            if catalog_cache is True:
+                catalog_cache = CatalogCache()
+            runners = [
+                (number, teacher,
+                 lambda kind, args, teacher=teacher,
+                    assign=Assignment(catalog_cache=catalog_cache):
+                    teacher.add_assignment(kind, args, assign=assign))
+                for number, teacher in enumerate([self] + launched.users)
+                if teacher is not None
+            ]
+
+        def work(number, teacher, runner):
+            extra = teacher is not None and teacher is not self
+            try:
+                if extra:
+                    teacher.login()
+                    teacher.get(course)
+            except Exception as err:
+                print('Worker %s could not open the course: %s' %
+                      (number, err))
+                report.record_launch_error(number, err)
+                return
+            while True:
+                try:
+                    index, (kind, args) = pending.get_nowait()
+                except queue.Empty:
+                    return
+                began = time.time()
+                try:
+                    result = runner(kind, args)
+                except Exception as err:
+                    print('Could not add %s "%s": %s' %
+                          (kind, args.get('title'), err))
+                    report.record(index, (kind, args), time.time() - began,
+                                  error=err)
+                    if extra:
+                        try:
+                            teacher.get(course)
+                        except Exception as lost:
+                            report.record_launch_error(number, lost)
+                            return
+                    continue
+                report.record(index, (kind, args), time.time() - began,
+                              result=result)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(runners)) as executor:
+                futures = [
+                    (number, executor.submit(work, number, teacher, runner))
+                    for number, teacher, runner in runners
+                ]
+                for number, future in futures:
+                    try:
+                        future.result()
+                    except Exception as err:
+                        report.record_launch_error(number, err)
+        finally:
+            for _, teacher, _ in runners:
+                if teacher is not None and teacher is not self:
+                    teacher.delete()
+        # items left when every worker stopped early
+        while not pending.empty():
+            index, item = pending.get_nowait()
+            report.record(index, item, 0.0,
+                          error=LaunchError('No worker left to add it'))
+        report.elapsed = time.time() - start
+        print('Added %s of %s assignments in %.1fs (%.1f per minute)' % (
+            len(report.completed), len(report), report.elapsed,
+            report.per_minute))
+        return report
+
     def change_assignment(self, assignment, args):
         """Alter an existing assignment."""
         assign = Assignment()
@@ -617,9 +1143,16 @@ class Teacher(User):
             feedback=args['feedback'] if 'feedback' in args else None,
         )
 
-    def goto_menu_item(self, item):
-        """Go to a specific user menu item."""
+    def goto_menu_item(self, item, use_route=False):
+        """Go to a specific user menu item.
+
+        use_route (bool): load the page by URL from ROUTES first, using the
+            user menu if the route's page does not appear
+        """
         print('Enter: goto_menu_item')
+        if use_route and self.goto_route(item):
+            print('Exit: goto_menu_item')
+            return
         if 'courses' in self.driver.current_url:
             self.open_user_menu()
             self.wait.until(
@@ -725,8 +1258,24 @@ class Teacher(User):
         print('Exit: get_enrollment_code')
         return '%s' % code.text.strip()
 
-    def get_book_sections(self):
-        """Return a list of book sections."""
+    def get_book_sections(self, bulk=True, book_version=None, refresh=False):
+        """Return a list of book sections.
+
+        bulk (bool): expand every chapter and read the labels with scripts
+            instead of one chapter and one label at a time
+        book_version (string): book or ecosystem version for the cache key;
+            defaults to the course's ecosystem ID, so a content update is
+            not served from the cache
+        refresh (bool): ignore a cached list for this course and version
+        """
+        if book_version is None:
+            catalog_key = Assignment.catalog_key(self.driver)
+            book_version = catalog_key[2] if catalog_key else None
+        key = (self.url, self.get_course_id(), book_version)
+        cached = Teacher.book_sections.get(key)
+        if cached and not refresh and \
+                time.time() - cached[0] < Teacher.BOOK_SECTION_TTL:
+            return list(cached[1])
         self.goto_calendar()
         self.page.wait_for_page_load()
         self.driver.find_element(By.ID, 'add-assignment').click()
@@ -738,9 +1287,38 @@ class Teacher(User):
         self.page.wait_for_page_load()
         selector = self.driver.find_element(By.ID, 'reading-select')
         Assignment.scroll_to(self.driver, selector)
-        sleep(1.0)
+        if bulk:
+            selector = self.wait.until(
+                expect.element_to_be_clickable((By.ID, 'reading-select'))
+            )
+        else:
+            sleep(1.0)
         selector.click()
         self.page.wait_for_page_load()
+        if bulk:
+            section_list = self.read_book_sections()
+        else:
+            section_list = self.scrape_book_sections()
+        Teacher.book_sections[key] = (time.time(), list(section_list))
+        self.goto_calendar()
+        return section_list
+
+    def read_book_sections(self):
+        """Expand all chapters and read every section label by script."""
+        self.wait.until(
+            lambda driver: driver.execute_script(
+                'return document.querySelector(\'a[href="#"] span\');'
+            )
+        )
+        self.driver.execute_script(Teacher.EXPAND_CHAPTERS_SCRIPT)
+        return self.wait.until(
+            lambda driver: driver.execute_script(
+                Teacher.SECTION_LABELS_SCRIPT
+            )
+        )
+
+    def scrape_book_sections(self):
+        """Expand each chapter and read each section label in turn."""
         for chapter in self.driver.find_elements(By.XPATH,
                                                  '//a[@href="#" and span]'):
             if chapter.get_attribute('aria-expanded') != 'true':
@@ -754,7 +1332,6 @@ class Teacher(User):
         section_list = []
         for section in sections:
             section_list.append(section.text)
-        self.goto_calendar()
         return section_list
 
     def get_month_number(self, month):
@@ -773,29 +1350,69 @@ class Teacher(User):
         month, year = calendar_heading.split(' ')
         return self.get_month_number(month), int(year)
 
-    def rotate_calendar(self, target):
-        """Rotate the teacher calendar to a specific month and year."""
+    def step_calendar(self, arrow):
+        """Move the calendar one month and wait for the heading to change."""
+        heading = (By.XPATH,
+                   '//div[contains(@class,"calendar-header-label")]/span')
+        shown = self.driver.find_element(*heading).text
+        self.driver.find_element(By.CLASS_NAME, arrow).click()
+        WaitStrategy.pause(
+            'calendar_rotate',
+            self.driver,
+            lambda driver: driver.find_element(*heading).text != shown
+        )
+
+    def jump_calendar(self, target_date):
+        """Load the calendar month for a date through its URL.
+
+        Return False if the current URL has no calendar date segment or the
+        heading never shows the target month.
+        """
+        url = self.driver.current_url
+        if not Teacher.CALENDAR_DATE.search(url):
+            return False
+        self.get(Teacher.CALENDAR_DATE.sub(
+            target_date.strftime('%Y-%m-%d'), url, count=1
+        ))
+        expected = (target_date.month, target_date.year)
+
+        def showing_target(_):
+            try:
+                return self.get_month_year() == expected
+            except (TimeoutException, ValueError, KeyError):
+                return False
+
+        try:
+            self.wait.until(showing_target)
+        except TimeoutException:
+            return False
+        return True
+
+    def rotate_calendar(self, target, use_url=True):
+        """Rotate the teacher calendar to a specific month and year.
+
+        use_url (bool): jump straight to the month through the calendar URL
+            and only click the month arrows if that is not possible
+        """
         cal_month, cal_year = self.get_month_year()
         target_date = datetime.datetime.strptime(target, '%m/%d/%Y').date()
         if cal_year == target_date.year and \
                 cal_month == target_date.month:
             return
+        if use_url and self.jump_calendar(target_date):
+            return
         cal_month, cal_year = self.get_month_year()
         while cal_year < target_date.year:
-            self.driver.find_element(By.CLASS_NAME, 'fa-caret-right').click()
-            sleep(0.2)
+            self.step_calendar('fa-caret-right')
             cal_month, cal_year = self.get_month_year()
         while cal_month < target_date.month:
-            self.driver.find_element(By.CLASS_NAME, 'fa-caret-right').click()
-            sleep(0.2)
+            self.step_calendar('fa-caret-right')
             cal_month, cal_year = self.get_month_year()
         while cal_year > target_date.year:
-            self.driver.find_element(By.CLASS_NAME, 'fa-caret-left').click()
-            sleep(0.2)
+            self.step_calendar('fa-caret-left')
             cal_month, cal_year = self.get_month_year()
         while cal_month > target_date.month:
-            self.driver.find_element(By.CLASS_NAME, 'fa-caret-left').click()
-            sleep(0.2)
+            self.step_calendar('fa-caret-left')
             cal_month, cal_year = self.get_month_year()
 
 
@@ -804,6 +1421,10 @@ class Student(User):
 
     CONDENSED_WIDTH = User.CONDENSED_WIDTH
     DEFAULT_WAIT_TIME = User.DEFAULT_WAIT_TIME
+    ROUTES = {
+        'Dashboard': ('list', (By.CLASS_NAME, 'student-dashboard')),
+        'Performance Forecast': ('guide', (By.CLASS_NAME, 'guide-container')),
+    }
 
     def __init__(self,
                  use_env_vars=False,
@@ -822,9 +1443,16 @@ class Student(User):
         super(Student, self).__init__(existing_driver=existing_driver,
                                       **kwargs)
 
-    def goto_menu_item(self, item):
-        """Go to a specific user menu item."""
+    def goto_menu_item(self, item, use_route=False):
+        """Go to a specific user menu item.
+
+        use_route (bool): load the page by URL from ROUTES first, using the
+            user menu if the route's page does not appear
+        """
         print('Enter: goto_menu_item')
+        if use_route and self.goto_route(item):
+            print('Exit: goto_menu_item')
+            return
         if 'courses' in self.driver.current_url:
             self.open_user_menu()
             self.wait.until(
@@ -948,7 +1576,13 @@ class Student(User):
         finally:
             self.page.wait_for_page_load()
         answers = self.driver.find_elements(By.CLASS_NAME, 'answer-letter')
-        self.sleep(0.8)
+        WaitStrategy.pause(
+            'answer_choices',
+            self.driver,
+            lambda _: answers and all(
+                letter.is_displayed() for letter in answers
+            )
+        )
         rand = randint(0, len(answers) - 1)
         answer = chr(ord('a') + rand)
         print('Selecting %s' % answer)
@@ -958,7 +1592,13 @@ class Student(User):
         elif answer == 'd':
             self.driver.execute_script('window.scrollBy(0, 160);')
         answers[rand].click()
-        self.sleep(1.0)
+        WaitStrategy.pause(
+            'answer_selected',
+            self.driver,
+            expect.element_to_be_clickable(
+                (By.XPATH, '//button[span[text()="Submit"]]')
+            )
+        )
         self.wait.until(
             expect.element_to_be_clickable(
                 (By.XPATH, '//button[span[text()="Submit"]]')
@@ -977,6 +1617,26 @@ class Admin(User):
 
     CONDENSED_WIDTH = User.CONDENSED_WIDTH
     DEFAULT_WAIT_TIME = User.DEFAULT_WAIT_TIME
+    # page name -> path from the site root
+    ADMIN_PAGES = {
+        'admin_control': 'admin',
+        'catalog_offerings': 'admin/catalog_offerings',
+        'courses': 'admin/courses',
+        'schools': 'admin/school',
+        'districts': 'admin/districts',
+        'tags': 'admin/tags',
+        'ecosystems': 'admin/ecosystems',
+        'fine_print': 'fine_print',
+        'targeted_contracts': 'admin/targeted_contracts',
+        'course_stats': 'admin/stats/courses',
+        'concept_coach_stats': 'admin/stats/concept_coach',
+        'users': 'admin/users',
+        'jobs': 'admin/jobs',
+        'research_data': 'admin/research_data',
+        'salesforce': 'admin/salesforce',
+        'settings': 'admin/settings',
+        'notifications': 'admin/notifications',
+    }
 
     def __init__(self, use_env_vars=False, existing_driver=None, **kwargs):
         """Administrator initialization with User pass-through."""
@@ -994,73 +1654,110 @@ class Admin(User):
         extension = '' if self.url.endswith('/') else '/'
         self.base = self.url + extension + 'admin'
 
+    def admin_url(self, page):
+        """Return the full URL for an administrator page name."""
+        extension = '' if self.url.endswith('/') else '/'
+        return self.url + extension + Admin.ADMIN_PAGES[page]
+
+    def smoke_check(self, pages=None, markers=None, open_failures=True,
+                    max_workers=8, timeout=30):
+        """Fetch administrator pages over HTTP with the browser's session.
+
+        pages (list): page names from Admin.ADMIN_PAGES; defaults to all of
+            them
+        markers (dict): page name -> text expected in the response
+        open_failures (bool): load the failing pages in the browser
+        Returns {page: result} from SmokeCheck.check.
+        """
+        markers = markers or {}
+        checks = {
+            page: (self.admin_url(page), markers.get(page, []))
+            for page in (pages or sorted(Admin.ADMIN_PAGES))
+        }
+        session = BrowserSession.from_driver(self.driver,
+                                             pool_size=max_workers)
+        try:
+            results = SmokeCheck(session, max_workers=max_workers,
+                                 timeout=timeout).check(checks)
+        finally:
+            session.close()
+        failures = SmokeCheck.failures(results)
+        for page in failures:
+            result = results[page]
+            print('Smoke check failed: %s (%s) %s' % (
+                page, result['status'], result['error'] or
+                'missing %s' % result['missing']))
+            if open_failures:
+                self.get(result['url'])
+        return results
+
     def goto_admin_control(self):
         """Access the administrator controls."""
-        self.get('%s' % self.base)
+        self.get(self.admin_url('admin_control'))
 
     def goto_catalog_offerings(self):
         """Access the catalog."""
-        self.get('%s%s' % (self.base, '/catalog_offerings'))
+        self.get(self.admin_url('catalog_offerings'))
 
     def goto_course_list(self):
         """Access the course list."""
-        self.get('%s%s' % (self.base, '/courses'))
+        self.get(self.admin_url('courses'))
 
     def goto_school_list(self):
         """Access the school list."""
-        self.get('%s%s' % (self.base, '/school'))
+        self.get(self.admin_url('schools'))
 
     def goto_district_list(self):
         """Access the district list."""
-        self.get('%s%s' % (self.base, '/districts'))
+        self.get(self.admin_url('districts'))
 
     def goto_tag_list(self):
         """Access the tag list."""
-        self.get('%s%s' % (self.base, '/tags'))
+        self.get(self.admin_url('tags'))
 
     def goto_ecosystems(self):
         """Access the ecosystem list."""
-        self.get('%s%s' % (self.base, '/ecosystems'))
+        self.get(self.admin_url('ecosystems'))
 
     def goto_terms_and_contracts(self):
         """Access the terms and contracts list."""
-        self.get('%s%s' % (self.url, '/fine_print'))
+        self.get(self.admin_url('fine_print'))
 
     def goto_contracts(self):
         """Access the targeted contracts."""
-        self.get('%s%s' % (self.base, '/targeted_contracts'))
+        self.get(self.admin_url('targeted_contracts'))
 
     def goto_course_stats(self):
         """Access the course stats."""
-        self.get('%s%s' % (self.base, '/stats/courses'))
+        self.get(self.admin_url('course_stats'))
 
     def goto_concept_coach_stats(self):
         """Access the Concept Coach stats."""
-        self.get('%s%s' % (self.base, '/stats/concept_coach'))
+        self.get(self.admin_url('concept_coach_stats'))
 
     def goto_user_list(self):
         """Access the user list."""
-        self.get('%s%s' % (self.base, '/users'))
+        self.get(self.admin_url('users'))
 
     def goto_jobs(self):
         """Access the jobs list."""
-        self.get('%s%s' % (self.base, '/jobs'))
+        self.get(self.admin_url('jobs'))
 
     def goto_research_data(self):
         """Access the researcher data."""
-        self.get('%s%s' % (self.base, '/research_data'))
+        self.get(self.admin_url('research_data'))
 
     def goto_salesforce_control(self):
         """Access the Salesforce controls."""
-        self.get('%s%s' % (self.base, '/salesforce'))
+        self.get(self.admin_url('salesforce'))
 
     def goto_system_settings(self):
         """Access the system settings."""
-        self.get('%s%s' % (self.base, '/settings'))
+        self.get(self.admin_url('settings'))
 
     def goto_system_notifications(self):
         """Access the system notifications."""
-        self.get('%s%s' % (self.base, '/notifications'))
+        self.get(self.admin_url('notifications'))
 
 
 class ContentQA(User):
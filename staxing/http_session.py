@@ -0,0 +1,123 @@
+"""HTTP access with the browser's logged-in session."""
+
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+
+__version__ = '0.0.1'
+
+
+class BrowserSession(object):
+    """Build pooled requests sessions that reuse a WebDriver login."""
+
+    POOL_SIZE = 10
+
+    @classmethod
+    def from_driver(cls, driver, pool_size=POOL_SIZE):
+        """Return a requests.Session carrying the driver's cookies."""
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=pool_size,
+                              pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        for cookie in driver.get_cookies():
+            session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/'),
+                secure=cookie.get('secure', False)
+            )
+        try:
+            agent = driver.execute_script('return navigator.userAgent;')
+        except Exception:
+            agent = None
+        if agent:
+            session.headers['User-Agent'] = agent
+        return session
+
+
+class SmokeCheck(object):
+    """Fetch pages concurrently and check status codes and markers."""
+
+    # paths of the sign-in pages a signed-out request is redirected to
+    LOGIN_PATHS = ('/accounts/login', '/login', '/signin')
+
+    def __init__(self, session, max_workers=8, timeout=30):
+        """Constructor.
+
+        session (requests.Session): logged-in HTTP session
+        max_workers (int): concurrent requests
+        timeout (int): seconds per request
+        """
+        self.session = session
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    def check(self, pages):
+        """Fetch every page and return {name: result}.
+
+        pages (dict): name -> (url, [text markers expected in the page])
+        Each result holds url, status, ok, missing markers, elapsed seconds
+        and any request error.
+        """
+        if not pages:
+            return {}
+        workers = min(self.max_workers, len(pages))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                name: executor.submit(self.fetch, url, markers)
+                for name, (url, markers) in pages.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    def fetch(self, url, markers=()):
+        """Fetch one page and compare it with the expected markers."""
+        result = {
+            'url': url,
+            'status': None,
+            'ok': False,
+            'missing': [],
+            'elapsed': 0.0,
+            'error': None,
+        }
+        start = time.time()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except Exception as err:
+            result['error'] = str(err)
+            result['elapsed'] = time.time() - start
+            return result
+        result['elapsed'] = time.time() - start
+        result['status'] = response.status_code
+        body = response.text
+        result['missing'] = [marker for marker in markers or ()
+                             if marker not in body]
+        signed_out = SmokeCheck.signed_out(response)
+        if signed_out:
+            result['error'] = 'Redirected to sign in: %s' % response.url
+        result['ok'] = response.status_code == 200 and \
+            not result['missing'] and not signed_out
+        return result
+
+    @classmethod
+    def signed_out(cls, response):
+        """Return True if a response ended on or passed a sign-in page.
+
+        Only the URLs are checked, since signed-in pages may link to the
+        sign-in page.
+        """
+        return any(
+            urlparse(url).path.rstrip('/').endswith(path)
+            for url in [hop.url for hop in response.history] + [response.url]
+            for path in SmokeCheck.LOGIN_PATHS
+        )
+
+    @classmethod
+    def failures(cls, results):
+        """Return the names of the pages that did not pass."""
+        return sorted(name for name, result in results.items()
+                      if not result['ok'])
@@ -0,0 +1,179 @@
+"""Concurrent browser launches for Helper-family objects."""
+
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+__version__ = '0.0.1'
+
+
+class LaunchReport(object):
+    """Results from a concurrent launch."""
+
+    def __init__(self, total):
+        """Constructor."""
+        self.users = [None] * total
+        self.timings = [0.0] * total
+        self.errors = {}
+        self.elapsed = 0.0
+
+    def __iter__(self):
+        """Iterate over the launched objects in request order."""
+        return iter(self.users)
+
+    def __len__(self):
+        """Return the number of requested launches."""
+        return len(self.users)
+
+    @property
+    def ready(self):
+        """Return the objects that launched successfully."""
+        return [user for user in self.users if user is not None]
+
+    @property
+    def slowest(self):
+        """Return the longest single launch time in seconds."""
+        return max(self.timings) if self.timings else 0.0
+
+    def raise_for_errors(self):
+        """Close every launched browser and raise if any launch failed."""
+        if not self.errors:
+            return
+        for user in self.ready:
+            user.delete()
+        index, err = sorted(self.errors.items())[0]
+        raise LaunchError(
+            '%s of %s launches failed; first (#%s): %s' %
+            (len(self.errors), len(self.users), index, err)
+        )
+
+
+class LaunchError(Exception):
+    """Concurrent launch error exception."""
+
+    def __init__(self, value):
+        """Exception initializer."""
+        self.value = value
+
+    def __str__(self):
+        """Return string of the exception text."""
+        return repr(self.value)
+
+
+class BatchReport(object):
+    """Per-item results and throughput for a bulk operation."""
+
+    def __init__(self, total):
+        """Constructor."""
+        self.results = [None] * total
+        self.launch_errors = {}
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        """Iterate over the item results in request order."""
+        return iter(self.results)
+
+    def __len__(self):
+        """Return the number of requested items."""
+        return len(self.results)
+
+    def record(self, index, item, duration, result=None, error=None):
+        """Store the outcome of one item."""
+        with self._lock:
+            self.results[index] = {
+                'item': item,
+                'ok': error is None,
+                'duration': duration,
+                'result': result,
+                'error': error,
+                'worker': threading.current_thread().name,
+            }
+
+    def record_launch_error(self, worker, error):
+        """Store why a worker could not start or had to stop."""
+        with self._lock:
+            self.launch_errors[worker] = error
+
+    @property
+    def completed(self):
+        """Return the results of the items that succeeded."""
+        return [result for result in self.results if result and result['ok']]
+
+    @property
+    def errors(self):
+        """Return {index: exception} for the items that failed."""
+        return {index: result['error']
+                for index, result in enumerate(self.results)
+                if result and not result['ok']}
+
+    @property
+    def per_minute(self):
+        """Return completed items per minute of wall-clock time."""
+        if not self.elapsed:
+            return 0.0
+        return len(self.completed) * 60.0 / self.elapsed
+
+    def raise_for_errors(self):
+        """Raise if any item failed."""
+        errors = self.errors
+        if not errors:
+            return
+        index, err = sorted(errors.items())[0]
+        raise LaunchError('%s of %s items failed; first (#%s): %s' %
+                          (len(errors), len(self.results), index, err))
+
+
+class ConcurrentLauncher(object):
+    """Construct several Helper-family objects in a thread pool.
+
+    Each launch blocks on its own browser start, so a scenario needing a
+    Teacher, some Students and an Admin waits for the slowest launch rather
+    than the sum of them.
+    """
+
+    def __init__(self, max_workers=None):
+        """Constructor.
+
+        max_workers (int): thread count; defaults to one per launch
+        """
+        self.max_workers = max_workers
+
+    def launch(self, specs):
+        """Launch every spec and return a LaunchReport.
+
+        specs ([(class, dict)]): Helper subclass and its constructor kwargs,
+            for example (Teacher, {'use_env_vars': True})
+        """
+        specs = list(specs)
+        report = LaunchReport(len(specs))
+        if not specs:
+            return report
+        start = time.time()
+        workers = self.max_workers or len(specs)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._launch_one, cls, kwargs or {})
+                for cls, kwargs in specs
+            ]
+            for index, future in enumerate(futures):
+                user, duration, err = future.result()
+                report.users[index] = user
+                report.timings[index] = duration
+                if err is not None:
+                    report.errors[index] = err
+        report.elapsed = time.time() - start
+        return report
+
+    @classmethod
+    def _launch_one(cls, user_class, kwargs):
+        """Construct one object and time it."""
+        start = time.time()
+        try:
+            user = user_class(**kwargs)
+            # force lazy helpers to start now
+            user.driver
+        except Exception as err:
+            return None, time.time() - start, err
+        return user, time.time() - start, None
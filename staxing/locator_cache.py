@@ -0,0 +1,108 @@
+"""Per-page cache for repeated element lookups."""
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+__version__ = '0.0.1'
+
+
+class CachedElement(WebElement):
+    """WebElement that finds itself again when it goes stale."""
+
+    def __init__(self, element, locate, clicked=None):
+        """Constructor.
+
+        element (WebElement): the element returned by the driver
+        locate (callable): returns a fresh element for the same locator
+        clicked (callable): called after a click, which may navigate
+        """
+        WebElement.__init__(self, element.parent, element.id)
+        self._w3c = getattr(element, '_w3c', False)
+        self._locate = locate
+        self._clicked = clicked
+
+    def _execute(self, command, params=None):
+        """Run an element command, refreshing a stale reference once."""
+        try:
+            result = WebElement._execute(self, command, params)
+        except StaleElementReferenceException:
+            self._id = self._locate().id
+            result = WebElement._execute(self, command, params)
+        if command == Command.CLICK_ELEMENT and self._clicked is not None:
+            self._clicked()
+        return result
+
+
+class LocatorCache(object):
+    """Cache find results by (By, value) until the page changes.
+
+    The cache is cleared when Helper records a navigation (get, back and
+    page loads) and when a cached element is clicked, without asking the
+    browser for its URL. A cached element that has gone stale anyway finds
+    itself again, which counts as a miss. find_all results are never cached,
+    since a single-page app may render more matches later.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self.hits = 0
+        self.misses = 0
+        self._elements = {}
+        self._navigation = None
+
+    def clear(self):
+        """Forget every cached element."""
+        self._elements = {}
+
+    def sync(self, page=None):
+        """Clear the cache if the page has navigated since it was filled."""
+        navigations = page.navigations if page is not None else None
+        if navigations != self._navigation:
+            self.clear()
+            self._navigation = navigations
+
+    def find(self, driver, by, value, page=None):
+        """Return a cached element or find and cache it."""
+        self.sync(page)
+        key = (by, value)
+        if key in self._elements:
+            self.hits += 1
+            return self._elements[key]
+        self.misses += 1
+        element = CachedElement(
+            driver.find_element(by=by, value=value),
+            self._refind(driver, by, value),
+            self.clear
+        )
+        self._elements[key] = element
+        return element
+
+    def find_all(self, driver, by, value, page=None):
+        """Find every match now; the result is not cached."""
+        self.sync(page)
+        return [
+            CachedElement(element, self._relocate(driver, by, value, index),
+                          self.clear)
+            for index, element in enumerate(
+                driver.find_elements(by=by, value=value))
+        ]
+
+    def _refind(self, driver, by, value):
+        """Return a locator that counts a stale cached element as a miss."""
+        def locate():
+            self.misses += 1
+            return driver.find_element(by=by, value=value)
+        return locate
+
+    @classmethod
+    def _relocate(cls, driver, by, value, index):
+        """Return a locator for one entry of a find_elements result."""
+        def locate():
+            found = driver.find_elements(by=by, value=value)
+            if index >= len(found):
+                raise StaleElementReferenceException(
+                    'Element %s of %s=%s is gone' % (index, by, value)
+                )
+            return found[index]
+        return locate
@@ -21,6 +21,7 @@ class SeleniumWait(object):
         """Constructor."""
         self.browser = driver
         self.wait = wait
+        self.navigations = 0
         self.pseudos = [
             '::after', '::before', '::first-letter', '::first-line',
             '::selection', '::backdrop', '::placeholder', '::marker',
@@ -35,6 +36,11 @@ class SeleniumWait(object):
         WebDriverWait(self.browser, self.wait).until(
             staleness_of(old_page)
         )
+        self.mark_navigation()
+
+    def mark_navigation(self):
+        """Record that the browser moved to a new document."""
+        self.navigations += 1
 
     @contextmanager
     def wait_for_loading_staleness(self, style, pseudo_element):
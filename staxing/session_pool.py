@@ -0,0 +1,143 @@
+"""Reusable WebDriver session pool for Helper and its User subclasses."""
+
+import json
+import threading
+import time
+
+from collections import deque
+
+__version__ = '0.0.1'
+
+
+class SessionPool(object):
+    """Keep warm WebDriver sessions available for reuse.
+
+    Drivers are grouped by capability set and account; a Helper checks a
+    driver out when it is created and checks it back in when it is deleted
+    instead of quitting the browser. Check-in only clears the cookies and
+    storage of the page the driver is on, so a driver is only handed back to
+    the account that used it.
+    """
+
+    DEFAULT_SIZE = 4  # drivers kept per capability set
+    DEFAULT_IDLE_TIMEOUT = 300  # seconds
+    CLEAR_STORAGE = '''
+        try {
+            window.localStorage.clear();
+            window.sessionStorage.clear();
+        } catch (err) {}
+    '''
+
+    def __init__(self, size=DEFAULT_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        """Constructor.
+
+        size (int): maximum idle drivers kept per capability set
+        idle_timeout (int): seconds before an idle driver is quit
+        """
+        if size < 1:
+            raise ValueError('Pool size must be 1 or higher.')
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.hits = 0
+        self.misses = 0
+        self.launch_time = 0.0
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Entry point."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close every idle driver."""
+        self.close()
+
+    @classmethod
+    def key(cls, driver_type='chrome', capabilities=None, profile=None,
+            account=None):
+        """Return the pool key for a driver type, capability set and user."""
+        return '%s|%s|%s|%s' % (
+            driver_type,
+            json.dumps(capabilities or {}, sort_keys=True, default=str),
+            profile or '',
+            account or ''
+        )
+
+    def checkout(self, key, launcher):
+        """Return an idle driver for key or start a new one with launcher."""
+        self.purge()
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                driver, _ = idle.pop()
+                self.hits += 1
+                return driver
+            self.misses += 1
+        start = time.time()
+        driver = launcher()
+        with self._lock:
+            self.launch_time += time.time() - start
+        return driver
+
+    def checkin(self, key, driver):
+        """Return a driver to the pool; quit it if the pool is full."""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script(SessionPool.CLEAR_STORAGE)
+            driver.get('about:blank')
+        except Exception:
+            # broken session, so don't hand it out again
+            self._quit(driver)
+            return
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.size:
+                idle.append((driver, time.time()))
+                return
+        self._quit(driver)
+
+    def purge(self):
+        """Quit drivers that have been idle longer than the timeout."""
+        expired = []
+        cutoff = time.time() - self.idle_timeout
+        with self._lock:
+            for idle in self._idle.values():
+                while idle and idle[0][1] < cutoff:
+                    expired.append(idle.popleft()[0])
+        for driver in expired:
+            self._quit(driver)
+
+    def close(self):
+        """Quit every idle driver."""
+        with self._lock:
+            drivers = [driver for idle in self._idle.values()
+                       for driver, _ in idle]
+            self._idle = {}
+        for driver in drivers:
+            self._quit(driver)
+
+    def idle_count(self, key=None):
+        """Return the number of idle drivers for a key or the whole pool."""
+        with self._lock:
+            if key is not None:
+                return len(self._idle.get(key, ()))
+            return sum(len(idle) for idle in self._idle.values())
+
+    def stats(self):
+        """Return pool counters and the estimated launch time saved."""
+        with self._lock:
+            average = self.launch_time / self.misses if self.misses else 0.0
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'idle': sum(len(idle) for idle in self._idle.values()),
+                'launch_time': round(self.launch_time, 3),
+                'time_saved': round(average * self.hits, 3),
+            }
+
+    def _quit(self, driver):
+        """Quit a driver and ignore an already closed session."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,136 @@
+"""On-disk store for authenticated browser sessions."""
+
+import hashlib
+import json
+import os
+import time
+
+from urllib.parse import urlparse
+
+__version__ = '0.0.1'
+
+
+class SessionStore(object):
+    """Save and restore login cookies and localStorage by site and user."""
+
+    DEFAULT_DIRECTORY = os.path.join(
+        os.path.expanduser('~'), '.staxing', 'sessions'
+    )
+    DEFAULT_MAX_AGE = 8 * 60 * 60  # seconds
+
+    READ_STORAGE = '''
+        var data = {};
+        for (var i = 0; i < window.localStorage.length; i++) {
+            var key = window.localStorage.key(i);
+            data[key] = window.localStorage.getItem(key);
+        }
+        return data;
+    '''
+    WRITE_STORAGE = '''
+        var data = arguments[0];
+        for (var key in data) {
+            window.localStorage.setItem(key, data[key]);
+        }
+    '''
+
+    def __init__(self, directory=None, max_age=DEFAULT_MAX_AGE):
+        """Constructor.
+
+        directory (string): folder holding the session files
+        max_age (int): seconds a saved session is trusted
+        """
+        self.directory = directory or os.getenv(
+            'STAXING_SESSION_DIR',
+            SessionStore.DEFAULT_DIRECTORY
+        )
+        self.max_age = max_age
+
+    @classmethod
+    def origin(cls, site):
+        """Return the scheme and host for a site URL."""
+        parsed = urlparse(site if '//' in site else '//' + site)
+        return '%s://%s' % (parsed.scheme or 'https', parsed.netloc)
+
+    def path(self, site, username):
+        """Return the session file for a site and username."""
+        key = '%s|%s' % (SessionStore.origin(site), username)
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, '%s.json' % digest)
+
+    def save(self, driver, site, username):
+        """Store the current browser session for a site and username."""
+        record = {
+            'site': SessionStore.origin(site),
+            'username': username,
+            'saved': time.time(),
+            'cookies': driver.get_cookies(),
+            'local_storage': driver.execute_script(
+                SessionStore.READ_STORAGE
+            ) or {},
+        }
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, mode=0o700)
+        path = self.path(site, username)
+        temp = '%s.%s.tmp' % (path, os.getpid())
+        with open(temp, 'w') as session_file:
+            json.dump(record, session_file)
+        os.chmod(temp, 0o600)
+        os.replace(temp, path)
+
+    def load(self, site, username):
+        """Return a saved session record or None if missing or expired."""
+        path = self.path(site, username)
+        try:
+            with open(path) as session_file:
+                record = json.load(session_file)
+        except (IOError, OSError, ValueError):
+            return None
+        now = time.time()
+        if now - record.get('saved', 0) > self.max_age:
+            self.discard(site, username)
+            return None
+        cookies = [
+            cookie for cookie in record.get('cookies', [])
+            if 'expiry' not in cookie or cookie['expiry'] > now
+        ]
+        if not cookies:
+            self.discard(site, username)
+            return None
+        record['cookies'] = cookies
+        return record
+
+    def restore(self, driver, site, username):
+        """Load a saved session into the browser.
+
+        Return False when nothing usable is stored; the caller still has to
+        confirm the restored session is accepted by the server.
+        """
+        record = self.load(site, username)
+        if record is None:
+            return False
+        # cookies can only be set for the page's own domain, so open the
+        # smallest page on the site first
+        driver.get('%s/robots.txt' % record['site'])
+        driver.delete_all_cookies()
+        for cookie in record['cookies']:
+            cookie = dict(cookie)
+            cookie.pop('sameSite', None)
+            if 'expiry' in cookie:
+                cookie['expiry'] = int(cookie['expiry'])
+            try:
+                driver.add_cookie(cookie)
+            except Exception:
+                return False
+        if record['local_storage']:
+            driver.execute_script(
+                SessionStore.WRITE_STORAGE,
+                record['local_storage']
+            )
+        return True
+
+    def discard(self, site, username):
+        """Remove a saved session."""
+        try:
+            os.remove(self.path(site, username))
+        except OSError:
+            pass
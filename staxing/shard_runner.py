@@ -0,0 +1,251 @@
+"""Run CASELIST-selected test cases in balanced parallel shards."""
+
+import argparse
+import ast
+import heapq
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from xml.etree import ElementTree
+
+__version__ = '0.0.1'
+
+
+class ShardRunner(object):
+    """Split test cases across pytest processes and merge their results.
+
+    Test cases are the methods marked with
+    skipif(str(<case ID>) not in TESTS, ...). Every shard is a separate
+    pytest process, so each holds its own browser. Shards are filled longest
+    case first using the durations recorded by earlier runs, which keeps the
+    wall-clock time close to the slowest shard.
+    """
+
+    TEST_FILE = os.path.join('tests', 'test_staxing.py')
+    DURATIONS = os.getenv('STAXING_DURATIONS', '.staxing_durations.json')
+    DEFAULT_DURATION = 60.0  # seconds, for cases never timed before
+
+    def __init__(self, test_file=TEST_FILE, workers=4, durations=DURATIONS,
+                 pytest_args=None):
+        """Constructor.
+
+        test_file (string): test module holding the cases
+        workers (int): number of pytest processes
+        durations (string): JSON file of recorded case durations
+        pytest_args (list): extra pytest command-line arguments
+        """
+        self.test_file = test_file
+        self.workers = max(1, workers)
+        self.durations_file = durations
+        self.pytest_args = list(pytest_args or [])
+        self.cases = ShardRunner.find_cases(test_file)
+        self.durations = self.load_durations()
+
+    @classmethod
+    def find_cases(cls, test_file):
+        """Return {case ID: 'Class::test_name'} for a test module."""
+        with open(test_file) as source:
+            tree = ast.parse(source.read())
+        cases = {}
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            for method in node.body:
+                if not isinstance(method, ast.FunctionDef):
+                    continue
+                for decorator in method.decorator_list:
+                    case = cls.case_id(decorator)
+                    if case is not None:
+                        cases[case] = '%s::%s' % (node.name, method.name)
+        return cases
+
+    @classmethod
+    def case_id(cls, decorator):
+        """Return the case ID from a str(<int>) call inside a decorator."""
+        for node in ast.walk(decorator):
+            if isinstance(node, ast.Call) and \
+                    getattr(node.func, 'id', None) == 'str' and \
+                    len(node.args) == 1:
+                value = node.args[0]
+                number = value.value if hasattr(ast, 'Constant') and \
+                    isinstance(value, ast.Constant) else getattr(value, 'n',
+                                                                 None)
+                if isinstance(number, int) and not isinstance(number, bool):
+                    return number
+        return None
+
+    @classmethod
+    def default_cases(cls, test_file):
+        """Return the case IDs in the module's default CASELIST."""
+        with open(test_file) as source:
+            tree = ast.parse(source.read())
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and \
+                    getattr(node.targets[0], 'id', None) == 'TESTS':
+                for call in ast.walk(node.value):
+                    if isinstance(call, ast.List):
+                        return ast.literal_eval(call)
+        return []
+
+    def selected(self, cases=None):
+        """Return the case IDs to run.
+
+        cases (list): explicit case IDs; otherwise CASELIST from the
+            environment, then the module's default list
+        """
+        if cases is None and os.getenv('CASELIST'):
+            cases = [int(case) for case in
+                     re.findall(r'\d+', os.getenv('CASELIST'))]
+        if cases is None:
+            cases = ShardRunner.default_cases(self.test_file)
+        unknown = [case for case in cases if case not in self.cases]
+        if unknown:
+            print('No test found for cases: %s' % unknown)
+        return [case for case in cases if case in self.cases]
+
+    def load_durations(self):
+        """Return {case ID: seconds} from earlier runs."""
+        try:
+            with open(self.durations_file) as record:
+                return {int(case): duration
+                        for case, duration in json.load(record).items()}
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def save_durations(self):
+        """Write the recorded case durations."""
+        with open(self.durations_file, 'w') as record:
+            json.dump({str(case): duration for case, duration
+                       in sorted(self.durations.items())}, record, indent=2)
+
+    def estimate(self, case):
+        """Return the expected duration of a case."""
+        if case in self.durations:
+            return self.durations[case]
+        known = sorted(self.durations.values())
+        return known[len(known) // 2] if known else \
+            ShardRunner.DEFAULT_DURATION
+
+    def shards(self, cases):
+        """Split cases into balanced shards, longest case first."""
+        count = min(self.workers, len(cases))
+        if not count:
+            return []
+        heap = [(0.0, index, []) for index in range(count)]
+        for case in sorted(cases, key=lambda case: -self.estimate(case)):
+            total, index, shard = heapq.heappop(heap)
+            shard.append(case)
+            heapq.heappush(heap, (total + self.estimate(case), index, shard))
+        return [shard for _, _, shard in sorted(heap, key=lambda s: s[1])]
+
+    def command(self, shard, report):
+        """Return the pytest command for one shard."""
+        nodes = ['%s::%s' % (self.test_file, self.cases[case])
+                 for case in shard]
+        return [sys.executable, '-m', 'pytest', '-q', '-p',
+                'no:cacheprovider', '--junitxml=%s' % report] + \
+            self.pytest_args + nodes
+
+    def run(self, cases=None, junitxml=None):
+        """Run the shards in parallel and return the merged report.
+
+        The return value is (exit code, merged XML element); the report is
+        also written to junitxml when given.
+        """
+        shards = self.shards(self.selected(cases))
+        directory = tempfile.mkdtemp(prefix='staxing-shards-')
+        start = time.time()
+        processes = []
+        try:
+            for number, shard in enumerate(shards):
+                report = os.path.join(directory, 'shard-%s.xml' % number)
+                env = dict(os.environ, CASELIST=str(shard))
+                print('Shard %s: %s (about %.0fs)' % (
+                    number, shard, sum(self.estimate(case) for case in shard)
+                ))
+                processes.append((
+                    shard, report,
+                    subprocess.Popen(self.command(shard, report), env=env)
+                ))
+            code = 0
+            for shard, report, process in processes:
+                code = process.wait() or code
+            elapsed = time.time() - start
+            merged = self.merge([report for _, report, _ in processes],
+                                elapsed)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        self.save_durations()
+        if junitxml:
+            ElementTree.ElementTree(merged).write(junitxml,
+                                                  encoding='utf-8',
+                                                  xml_declaration=True)
+        suite = merged.find('testsuite')
+        print('%s cases in %s shards: %.1fs wall clock, %.1fs of tests' % (
+            suite.get('tests'), len(shards), elapsed,
+            float(suite.get('time'))
+        ))
+        return code, merged
+
+    def merge(self, reports, elapsed):
+        """Combine shard JUnit reports and record the case durations."""
+        names = {name: case for case, name in self.cases.items()}
+        suite = ElementTree.Element('testsuite', name='staxing')
+        totals = {'tests': 0, 'failures': 0, 'errors': 0, 'skipped': 0}
+        test_time = 0.0
+        for report in reports:
+            try:
+                root = ElementTree.parse(report).getroot()
+            except (IOError, OSError, ElementTree.ParseError):
+                continue
+            for testcase in root.iter('testcase'):
+                suite.append(testcase)
+                duration = float(testcase.get('time', 0))
+                test_time += duration
+                totals['tests'] += 1
+                for kind, total in (('failure', 'failures'),
+                                    ('error', 'errors'),
+                                    ('skipped', 'skipped')):
+                    if testcase.find(kind) is not None:
+                        totals[total] += 1
+                case = names.get('%s::%s' % (
+                    testcase.get('classname', '').split('.')[-1],
+                    testcase.get('name')
+                ))
+                if case is not None and testcase.find('skipped') is None:
+                    self.durations[case] = duration
+        for key, value in totals.items():
+            suite.set(key, str(value))
+        suite.set('time', '%.3f' % test_time)
+        merged = ElementTree.Element('testsuites')
+        merged.set('time', '%.3f' % elapsed)
+        merged.append(suite)
+        return merged
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description='Run staxing test cases in parallel shards.'
+    )
+    parser.add_argument('cases', nargs='*', type=int,
+                        help='case IDs (default: CASELIST or the file list)')
+    parser.add_argument('-n', '--workers', type=int, default=4)
+    parser.add_argument('--test-file', default=ShardRunner.TEST_FILE)
+    parser.add_argument('--durations', default=ShardRunner.DURATIONS)
+    parser.add_argument('--junitxml', default=None)
+    args, pytest_args = parser.parse_known_args(argv)
+    runner = ShardRunner(args.test_file, args.workers, args.durations,
+                         pytest_args)
+    code, _ = runner.run(args.cases or None, args.junitxml)
+    return code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
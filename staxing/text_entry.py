@@ -0,0 +1,153 @@
+"""Bulk text entry for inputs and text areas."""
+
+from selenium.common.exceptions import WebDriverException
+
+__version__ = '0.0.1'
+
+
+class TextEntry(object):
+    """Enter text with the fastest strategy a field accepts.
+
+    Strategies are tried in order and the field value is checked after each
+    one; the first that produces the expected value wins and, when a key is
+    given, is tried first for that field next time.
+    """
+
+    REACT = 'react'
+    PASTE = 'paste'
+    CHUNKED = 'chunked'
+
+    STRATEGIES = (REACT, PASTE, CHUNKED)  # fastest first
+    CHUNK_SIZE = 64  # characters per send_keys call
+
+    SET_VALUE_SCRIPT = '''
+        var element = arguments[0];
+        var prototype = element.tagName == 'TEXTAREA' ?
+            window.HTMLTextAreaElement.prototype :
+            window.HTMLInputElement.prototype;
+        var setter = Object.getOwnPropertyDescriptor(prototype, 'value').set;
+        element.focus();
+        setter.call(element, arguments[1]);
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+        return element.value;
+    '''
+    PASTE_SCRIPT = '''
+        var element = arguments[0];
+        element.focus();
+        element.select();
+        var data = new DataTransfer();
+        data.setData('text/plain', arguments[1]);
+        var paste = new ClipboardEvent('paste', {
+            clipboardData: data, bubbles: true, cancelable: true
+        });
+        if (element.dispatchEvent(paste)) {
+            document.execCommand('insertText', false, arguments[1]);
+        }
+        return element.value;
+    '''
+    FILL_SCRIPT = '''
+        var fields = arguments[0];
+        var missed = [];
+        for (var id in fields) {
+            var element = document.getElementById(id);
+            if (!element) { missed.push(id); continue; }
+            var prototype = element.tagName == 'TEXTAREA' ?
+                window.HTMLTextAreaElement.prototype :
+                window.HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(prototype, 'value')
+                .set.call(element, fields[id]);
+            element.dispatchEvent(new Event('input', {bubbles: true}));
+            element.dispatchEvent(new Event('change', {bubbles: true}));
+            if (element.value != fields[id]) { missed.push(id); }
+        }
+        return missed;
+    '''
+
+    # field key -> strategy that last worked
+    learned = {}
+
+    def __init__(self, driver, strategies=STRATEGIES, chunk_size=CHUNK_SIZE,
+                 verify=None):
+        """Constructor.
+
+        driver (WebDriver): browser holding the fields
+        strategies (tuple): strategies to try, in order
+        chunk_size (int): characters per send_keys call when chunked
+        verify (callable): verify(value, text) returns True when the field
+            value is acceptable; defaults to equality
+        """
+        self.driver = driver
+        self.strategies = tuple(strategies)
+        self.chunk_size = max(1, chunk_size)
+        self.verify = verify or (lambda value, text: value == text)
+
+    def enter(self, element, text, key=None):
+        """Replace the element's value with text and return the strategy."""
+        text = '%s' % text
+        order = list(self.strategies)
+        if key in TextEntry.learned and TextEntry.learned[key] in order:
+            order.remove(TextEntry.learned[key])
+            order.insert(0, TextEntry.learned[key])
+        value = None
+        for strategy in order:
+            try:
+                value = self.apply(strategy, element, text)
+            except WebDriverException:
+                continue
+            if self.verify(value, text):
+                if key is not None:
+                    TextEntry.learned[key] = strategy
+                return strategy
+        raise TextEntryError('Field value "%s" does not match "%s"' %
+                             (value, text))
+
+    def apply(self, strategy, element, text):
+        """Run one strategy and return the resulting field value."""
+        if strategy == TextEntry.REACT:
+            return self.driver.execute_script(
+                TextEntry.SET_VALUE_SCRIPT, element, text
+            )
+        if strategy == TextEntry.PASTE:
+            return self.driver.execute_script(
+                TextEntry.PASTE_SCRIPT, element, text
+            )
+        if strategy == TextEntry.CHUNKED:
+            element.clear()
+            for start in range(0, len(text), self.chunk_size):
+                element.send_keys(text[start:start + self.chunk_size])
+            return element.get_attribute('value')
+        raise ValueError('Unknown text entry strategy: %s' % strategy)
+
+    def fill(self, fields, find=None):
+        """Set several fields by ID with one script.
+
+        Fields the script could not set are typed with send_keys after
+        finding them with find(id), which defaults to the driver lookup.
+        Values are compared in the browser so secrets are not sent back.
+        """
+        try:
+            missed = self.driver.execute_script(TextEntry.FILL_SCRIPT, fields)
+        except WebDriverException:
+            missed = None
+        if missed is None:
+            # the script did not run, so nothing was set
+            missed = list(fields)
+        find = find or (lambda field: self.driver.find_element('id', field))
+        for field in missed:
+            element = find(field)
+            element.clear()
+            element.send_keys(fields[field])
+        return missed
+
+
+class TextEntryError(Exception):
+    """Text entry error exception."""
+
+    def __init__(self, value):
+        """Exception initializer."""
+        self.value = value
+
+    def __str__(self):
+        """Return string of the exception text."""
+        return repr(self.value)
@@ -0,0 +1,255 @@
+"""Opt-in ledger of every sleep and wait with its staxing call site."""
+
+import atexit
+import os
+import sys
+import threading
+import time
+
+from contextlib import contextmanager
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+__version__ = '0.0.1'
+
+
+class WaitLedger(object):
+    """Record time blocked in sleeps, explicit, implicit and page waits.
+
+    Enabling the ledger patches time.sleep, the sleep used by helper.py,
+    WebDriverWait.until/until_not, SeleniumWait.wait_for_page_load and the
+    WebDriver find methods (a failed or empty find is where an implicit wait
+    blocks). Only the outermost wait is recorded, so a page-load wait is not
+    also counted as the WebDriverWait inside it.
+    """
+
+    SLEEP = 'sleep'
+    EXPLICIT = 'explicit'
+    IMPLICIT = 'implicit'
+    PAGE_LOAD = 'page_load'
+
+    SOURCES = ('helper.py', 'assignment.py', 'page_load.py')
+    # pass-through methods whose caller is the interesting site
+    WRAPPERS = ('sleep', 'find', 'find_all')
+
+    active = None
+
+    def __init__(self):
+        """Constructor."""
+        self.records = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._restore = []
+
+    @classmethod
+    def from_env(cls):
+        """Enable a ledger when STAXING_WAIT_LEDGER is set."""
+        if not os.getenv('STAXING_WAIT_LEDGER') or cls.active is not None:
+            return cls.active
+        ledger = cls()
+        ledger.enable(report_at_exit=True)
+        return ledger
+
+    def enable(self, report_at_exit=False):
+        """Install the timing patches."""
+        if WaitLedger.active is not None:
+            raise RuntimeError('A wait ledger is already enabled.')
+        try:
+            from staxing import helper
+            from staxing.page_load import SeleniumWait
+        except ImportError:
+            import helper
+            from page_load import SeleniumWait
+        ledger = self
+        real_sleep = time.sleep
+
+        def sleep(seconds):
+            with ledger.measure(WaitLedger.SLEEP, seconds):
+                real_sleep(seconds)
+
+        def wrap_until(original):
+            def until(wait, method, message=''):
+                with ledger.measure(WaitLedger.EXPLICIT, wait._timeout):
+                    return original(wait, method, message)
+            return until
+
+        def wrap_find(original):
+            def find(target, *args, **kwargs):
+                driver = target.parent if isinstance(target, WebElement) \
+                    else target
+                timeout = getattr(driver, '_ledger_implicit_wait', None)
+                start = time.time()
+                blocked = True
+                ledger._enter()
+                try:
+                    found = original(target, *args, **kwargs)
+                    blocked = found == []
+                    return found
+                except NoSuchElementException:
+                    raise
+                except Exception:
+                    blocked = False
+                    raise
+                finally:
+                    if ledger._exit() and blocked:
+                        ledger.record(WaitLedger.IMPLICIT, timeout,
+                                      time.time() - start)
+            return find
+
+        def wrap_implicitly_wait(original):
+            def implicitly_wait(driver, time_to_wait):
+                driver._ledger_implicit_wait = time_to_wait
+                return original(driver, time_to_wait)
+            return implicitly_wait
+
+        original_page_load = SeleniumWait.wait_for_page_load
+
+        @contextmanager
+        def wait_for_page_load(page):
+            context = original_page_load(page)
+            context.__enter__()
+            try:
+                yield
+            except BaseException:
+                if not context.__exit__(*sys.exc_info()):
+                    raise
+                return
+            with ledger.measure(WaitLedger.PAGE_LOAD, page.wait):
+                context.__exit__(None, None, None)
+
+        self._patch(time, 'sleep', sleep)
+        self._patch(helper, 'sleep', sleep)
+        self._patch(WebDriverWait, 'until', wrap_until(WebDriverWait.until))
+        self._patch(WebDriverWait, 'until_not',
+                    wrap_until(WebDriverWait.until_not))
+        self._patch(SeleniumWait, 'wait_for_page_load', wait_for_page_load)
+        self._patch(WebDriver, 'implicitly_wait',
+                    wrap_implicitly_wait(WebDriver.implicitly_wait))
+        for target in (WebDriver, WebElement):
+            self._patch(target, 'find_element',
+                        wrap_find(target.find_element))
+            self._patch(target, 'find_elements',
+                        wrap_find(target.find_elements))
+        WaitLedger.active = self
+        if report_at_exit:
+            atexit.register(self.report)
+        return self
+
+    def disable(self):
+        """Remove the timing patches."""
+        while self._restore:
+            target, name, original = self._restore.pop()
+            setattr(target, name, original)
+        if WaitLedger.active is self:
+            WaitLedger.active = None
+
+    def __enter__(self):
+        """Entry point."""
+        return self.enable()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Class exitor."""
+        self.disable()
+
+    @contextmanager
+    def measure(self, kind, timeout):
+        """Time a block and record it unless it is inside another wait."""
+        start = time.time()
+        self._enter()
+        try:
+            yield
+        finally:
+            if self._exit():
+                self.record(kind, timeout, time.time() - start)
+
+    def record(self, kind, timeout, duration):
+        """Add one wait to the ledger."""
+        entry = {
+            'kind': kind,
+            'site': self.call_site(),
+            'timeout': timeout,
+            'duration': duration,
+        }
+        with self._lock:
+            self.records.append(entry)
+
+    def call_site(self):
+        """Return 'file:line function' for the nearest staxing caller."""
+        frame = sys._getframe(1)
+        fallback = None
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            source = os.path.basename(filename) in WaitLedger.SOURCES
+            if source and frame.f_code.co_name in WaitLedger.WRAPPERS:
+                frame = frame.f_back
+                continue
+            if source:
+                return '%s:%s %s' % (os.path.basename(filename),
+                                     frame.f_lineno, frame.f_code.co_name)
+            if fallback is None and filename != __file__ and \
+                    'contextlib' not in filename:
+                fallback = '%s:%s %s' % (os.path.basename(filename),
+                                         frame.f_lineno,
+                                         frame.f_code.co_name)
+            frame = frame.f_back
+        return fallback or 'unknown'
+
+    def summary(self, top=10):
+        """Return the call sites with the most blocked time."""
+        sites = {}
+        with self._lock:
+            records = list(self.records)
+        for entry in records:
+            key = (entry['site'], entry['kind'])
+            site = sites.setdefault(key, {
+                'site': entry['site'],
+                'kind': entry['kind'],
+                'calls': 0,
+                'total': 0.0,
+                'longest': 0.0,
+                'timeout': entry['timeout'],
+            })
+            site['calls'] += 1
+            site['total'] += entry['duration']
+            site['longest'] = max(site['longest'], entry['duration'])
+        ranked = sorted(sites.values(), key=lambda site: -site['total'])
+        return ranked[:top] if top else ranked
+
+    def total(self, kind=None):
+        """Return the blocked time in seconds, optionally for one kind."""
+        with self._lock:
+            return sum(entry['duration'] for entry in self.records
+                       if kind is None or entry['kind'] == kind)
+
+    def report(self, top=10, stream=None):
+        """Print the top call sites by total blocked time."""
+        stream = stream or sys.stdout
+        stream.write('\nWait ledger: %.2fs blocked in %s waits\n' %
+                     (self.total(), len(self.records)))
+        for kind in (WaitLedger.SLEEP, WaitLedger.EXPLICIT,
+                     WaitLedger.IMPLICIT, WaitLedger.PAGE_LOAD):
+            stream.write('  %-10s %8.2fs\n' % (kind, self.total(kind)))
+        stream.write('%9s %6s %8s %8s  %-10s %s\n' %
+                     ('total', 'calls', 'longest', 'timeout', 'kind', 'site'))
+        for site in self.summary(top):
+            stream.write('%8.2fs %6d %7.2fs %8s  %-10s %s\n' % (
+                site['total'], site['calls'], site['longest'],
+                site['timeout'] if site['timeout'] is not None else '-',
+                site['kind'], site['site']
+            ))
+
+    def _patch(self, target, name, replacement):
+        """Replace an attribute and remember how to restore it."""
+        self._restore.append((target, name, getattr(target, name)))
+        setattr(target, name, replacement)
+
+    def _enter(self):
+        """Increase the wait nesting depth for this thread."""
+        self._local.depth = getattr(self._local, 'depth', 0) + 1
+
+    def _exit(self):
+        """Decrease the nesting depth; True when leaving the outermost."""
+        self._local.depth -= 1
+        return self._local.depth == 0
@@ -0,0 +1,78 @@
+"""Named waits that replace fixed sleeps with page conditions."""
+
+import os
+import time
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+__version__ = '0.0.1'
+
+
+class WaitStrategy(object):
+    """Switch between the legacy fixed delays and fast condition waits.
+
+    Each pause has a name and a legacy delay. In LEGACY mode the pause sleeps
+    for that delay; in FAST mode it polls the supplied condition and returns
+    as soon as it holds, or after the legacy delay if it never does, so a
+    fast pause is never longer than the legacy one.
+    """
+
+    LEGACY = 'legacy'
+    FAST = 'fast'
+
+    MODE = os.getenv('STAXING_WAIT_MODE', FAST)
+    POLL = 0.05  # seconds
+
+    DELAYS = {
+        'answer_choices': 0.8,
+        'answer_selected': 1.0,
+        'assignment_form': 1.0,
+        'calendar_rotate': 0.2,
+        'date_picker_month': 1.0,
+        'date_picker_open': 0.15,
+        'exercise_select': 0.5,
+        'plan_open': 0.3,
+        'section_select': 0.5,
+        'status_select': 1.0,
+        'window_move': 1.0,
+        'window_resize': 1.0,
+    }
+
+    IGNORED = (NoSuchElementException, StaleElementReferenceException)
+
+    @classmethod
+    def set_mode(cls, mode):
+        """Select LEGACY or FAST waits for every pause."""
+        if mode not in (cls.LEGACY, cls.FAST):
+            raise ValueError('Unknown wait mode: %s' % mode)
+        cls.MODE = mode
+
+    @classmethod
+    def pause(cls, name, driver=None, condition=None, timeout=None):
+        """Wait at a named point.
+
+        name (string): key in WaitStrategy.DELAYS
+        driver (WebDriver): browser polled by the condition
+        condition (callable): receives the driver and returns a truthy value
+            once the page is ready; without one a fast pause returns at once
+        timeout (float): fast-mode limit; defaults to the legacy delay
+        """
+        delay = cls.DELAYS[name]
+        if cls.MODE == cls.LEGACY:
+            time.sleep(delay)
+            return None
+        if condition is None or driver is None:
+            return None
+        limit = timeout if timeout is not None else delay
+        try:
+            return WebDriverWait(
+                driver,
+                limit,
+                poll_frequency=cls.POLL,
+                ignored_exceptions=cls.IGNORED
+            ).until(condition)
+        except TimeoutException:
+            return None
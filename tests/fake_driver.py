@@ -0,0 +1,462 @@
+"""In-memory WebDriver stand-in for browserless logic tests."""
+
+import collections
+
+from lxml import html
+from selenium.common.exceptions import InvalidSelectorException
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from urllib.parse import urljoin
+
+from staxing.text_entry import TextEntry
+
+__version__ = '0.0.1'
+
+
+class FakeElement(object):
+    """Element handle into a FakeDriver document."""
+
+    def __init__(self, driver, node, element_id):
+        """Constructor."""
+        self.parent = driver
+        self.node = node
+        self.id = element_id
+
+    def __eq__(self, element):
+        """Return True for handles to the same node."""
+        return isinstance(element, FakeElement) and element.node is self.node
+
+    def __hash__(self):
+        """Hash by node."""
+        return hash(self.node)
+
+    def _execute(self, command, params=None):
+        """Send an element command through the driver."""
+        params = dict(params or {}, id=self.id)
+        return self.parent.execute(command, params)['value']
+
+    @property
+    def tag_name(self):
+        """Return the element tag."""
+        return self._execute(Command.GET_ELEMENT_TAG_NAME)
+
+    @property
+    def text(self):
+        """Return the visible text."""
+        return self._execute(Command.GET_ELEMENT_TEXT)
+
+    def get_attribute(self, name):
+        """Return an attribute or input property."""
+        return self._execute(Command.GET_ELEMENT_ATTRIBUTE, {'name': name})
+
+    def is_displayed(self):
+        """Return False when the element or an ancestor is hidden."""
+        return self._execute(Command.IS_ELEMENT_DISPLAYED)
+
+    def is_enabled(self):
+        """Return False for disabled controls."""
+        return self._execute(Command.IS_ELEMENT_ENABLED)
+
+    def is_selected(self):
+        """Return True for checked or selected controls."""
+        return self._execute(Command.IS_ELEMENT_SELECTED)
+
+    def click(self):
+        """Click the element."""
+        self._execute(Command.CLICK_ELEMENT)
+
+    def clear(self):
+        """Empty an input or text area."""
+        self._execute(Command.CLEAR_ELEMENT)
+
+    def send_keys(self, *value):
+        """Append text to an input or text area."""
+        self._execute(Command.SEND_KEYS_TO_ELEMENT,
+                      {'text': ''.join('%s' % part for part in value)})
+
+    def find_element(self, by=By.ID, value=None):
+        """Find the first matching descendant."""
+        return self._execute(Command.FIND_CHILD_ELEMENT,
+                             {'using': by, 'value': value})
+
+    def find_elements(self, by=By.ID, value=None):
+        """Find every matching descendant."""
+        return self._execute(Command.FIND_CHILD_ELEMENTS,
+                             {'using': by, 'value': value})
+
+
+class FakeDriver(object):
+    """WebDriver stand-in backed by an lxml document.
+
+    Supports the find, element, navigation and legacy action commands that
+    staxing uses. Every call goes through execute() and is counted in
+    calls, so CommandTracer works on it unchanged. Scripts are answered by
+    the handlers in scripts; any other script returns None, which sends the
+    batched code paths to their element-by-element fallbacks.
+    """
+
+    w3c = False
+
+    def __init__(self, source='<html><body></body></html>',
+                 url='about:blank', pages=None):
+        """Constructor.
+
+        source (string): HTML for the first page
+        url (string): URL reported for the first page
+        pages (dict): URL -> HTML served by get() and link clicks
+        """
+        self.pages = dict(pages or {})
+        self.history = []
+        self.calls = collections.Counter()
+        self.cookies = []
+        self.window = {'width': 1300, 'height': 768}
+        self.scripts = {
+            TextEntry.SET_VALUE_SCRIPT: self._set_value,
+            'return arguments[0].scrollIntoView();': lambda element: None,
+        }
+        self.click_handlers = []
+        self.transients = []
+        self._leaving = []
+        self._elements = {}
+        self._hovered = None
+        self._handlers = {
+            Command.GET: self._get,
+            Command.GET_CURRENT_URL: lambda params: self._url,
+            Command.GET_PAGE_SOURCE: lambda params: html.tostring(
+                self.document, encoding='unicode'),
+            Command.GET_TITLE: lambda params: self.document.findtext(
+                './/title') or '',
+            Command.REFRESH: lambda params: self._load(
+                self._url, self._source),
+            Command.GO_BACK: self._back,
+            Command.FIND_ELEMENT: self._find,
+            Command.FIND_ELEMENTS: self._find_all,
+            Command.FIND_CHILD_ELEMENT: self._find,
+            Command.FIND_CHILD_ELEMENTS: self._find_all,
+            Command.EXECUTE_SCRIPT: self._script,
+            Command.GET_ELEMENT_TAG_NAME: lambda params: self._node(
+                params).tag,
+            Command.GET_ELEMENT_TEXT: self._text,
+            Command.GET_ELEMENT_ATTRIBUTE: self._attribute,
+            Command.IS_ELEMENT_DISPLAYED: lambda params: self.displayed(
+                self._node(params)),
+            Command.IS_ELEMENT_ENABLED: lambda params: self._node(
+                params).get('disabled') is None,
+            Command.IS_ELEMENT_SELECTED: lambda params: self._checked(
+                self._node(params)),
+            Command.CLICK_ELEMENT: lambda params: self._click(
+                self._node(params)),
+            Command.CLEAR_ELEMENT: lambda params: self._set(
+                self._node(params), ''),
+            Command.SEND_KEYS_TO_ELEMENT: self._send_keys,
+            Command.MOVE_TO: self._move_to,
+            Command.CLICK: lambda params: self._click(self._hovered),
+            Command.GET_ALL_COOKIES: lambda params: list(self.cookies),
+            Command.ADD_COOKIE: lambda params: self.cookies.append(
+                params['cookie']),
+            Command.DELETE_ALL_COOKIES: lambda params: self.cookies.clear(),
+            Command.IMPLICIT_WAIT: lambda params: None,
+            Command.SET_TIMEOUTS: lambda params: None,
+            Command.SET_WINDOW_SIZE: lambda params: self.window.update(
+                width=params['width'], height=params['height']),
+            Command.GET_WINDOW_SIZE: lambda params: dict(self.window),
+            Command.QUIT: lambda params: None,
+        }
+        self._load(url, source)
+
+    def execute(self, driver_command, params=None):
+        """Count and run one command; returns {'value': result}."""
+        self.calls[driver_command] += 1
+        handler = self._handlers.get(driver_command)
+        if handler is None:
+            raise NotImplementedError('FakeDriver: %s' % driver_command)
+        leaving, self._leaving = self._leaving, []
+        try:
+            return {'value': handler(params or {})}
+        finally:
+            for node in leaving:
+                if node.getparent() is not None:
+                    node.getparent().remove(node)
+
+    # WebDriver API
+
+    @property
+    def current_url(self):
+        """Return the page URL."""
+        return self.execute(Command.GET_CURRENT_URL)['value']
+
+    @property
+    def page_source(self):
+        """Return the serialized document."""
+        return self.execute(Command.GET_PAGE_SOURCE)['value']
+
+    @property
+    def title(self):
+        """Return the page title."""
+        return self.execute(Command.GET_TITLE)['value']
+
+    def get(self, url):
+        """Load a page from pages."""
+        self.execute(Command.GET, {'url': url})
+
+    def refresh(self):
+        """Reload the current page source."""
+        self.execute(Command.REFRESH)
+
+    def back(self):
+        """Return to the previous page."""
+        self.execute(Command.GO_BACK)
+
+    def find_element(self, by=By.ID, value=None):
+        """Find the first matching element."""
+        return self.execute(Command.FIND_ELEMENT,
+                            {'using': by, 'value': value})['value']
+
+    def find_elements(self, by=By.ID, value=None):
+        """Find every matching element."""
+        return self.execute(Command.FIND_ELEMENTS,
+                            {'using': by, 'value': value})['value']
+
+    def find_element_by_tag_name(self, name):
+        """Find the first element with a tag name."""
+        return self.find_element(By.TAG_NAME, name)
+
+    def execute_script(self, script, *args):
+        """Run a registered script handler or return None."""
+        return self.execute(Command.EXECUTE_SCRIPT,
+                            {'script': script, 'args': list(args)})['value']
+
+    def get_cookies(self):
+        """Return the stored cookies."""
+        return self.execute(Command.GET_ALL_COOKIES)['value']
+
+    def add_cookie(self, cookie):
+        """Store a cookie."""
+        self.execute(Command.ADD_COOKIE, {'cookie': cookie})
+
+    def delete_all_cookies(self):
+        """Remove every cookie."""
+        self.execute(Command.DELETE_ALL_COOKIES)
+
+    def implicitly_wait(self, time_to_wait):
+        """Accept and ignore the implicit wait."""
+        self.execute(Command.IMPLICIT_WAIT, {'ms': time_to_wait * 1000})
+
+    def set_window_size(self, width, height, windowHandle='current'):
+        """Store the window size."""
+        self.execute(Command.SET_WINDOW_SIZE,
+                     {'width': int(width), 'height': int(height)})
+
+    def get_window_size(self, windowHandle='current'):
+        """Return the stored window size."""
+        return self.execute(Command.GET_WINDOW_SIZE)['value']
+
+    def quit(self):
+        """Close the fake browser."""
+        self.execute(Command.QUIT)
+
+    # test hooks
+
+    def on_click(self, by, value, handler):
+        """Call handler(driver, element) when a matching element is clicked."""
+        self.click_handlers.append((by, value, handler))
+
+    def transient(self, by, value):
+        """Remove matching elements one command after a find returns them.
+
+        This stands in for spinners that appear and then leave the page.
+        """
+        self.transients.append((by, value))
+
+    def remove(self, element):
+        """Delete an element from the document."""
+        element.node.getparent().remove(element.node)
+
+    def displayed(self, node):
+        """Return False when the node or an ancestor is hidden."""
+        while node is not None:
+            style = (node.get('style') or '').replace(' ', '')
+            if node.get('hidden') is not None or 'display:none' in style or \
+                    (node.tag == 'input' and node.get('type') == 'hidden'):
+                return False
+            node = node.getparent()
+        return True
+
+    # command handlers
+
+    def _load(self, url, source):
+        """Replace the document."""
+        self._url = url
+        self._source = source
+        self.document = html.document_fromstring(source)
+        self._elements = {}
+        self._hovered = None
+
+    def _get(self, params):
+        """Navigate to a known page."""
+        url = params['url']
+        if url not in self.pages:
+            raise KeyError('FakeDriver has no page for %s' % url)
+        self._visit(url)
+
+    def _visit(self, url):
+        """Load a known page and remember the one it replaces."""
+        self.history.append((self._url, self._source))
+        self._load(url, self.pages[url])
+
+    def _back(self, params):
+        """Reload the previous page, if any."""
+        if self.history:
+            self._load(*self.history.pop())
+
+    def _node(self, params):
+        """Return the live node for an element ID."""
+        node = self._elements.get(params['id'])
+        root = node
+        while root is not None and root.getparent() is not None:
+            root = root.getparent()
+        if root is not self.document:
+            raise StaleElementReferenceException(
+                'Element %s is no longer attached' % params['id'])
+        return node
+
+    def _wrap(self, node):
+        """Return an element handle for a node."""
+        element_id = 'fake-%s' % id(node)
+        self._elements[element_id] = node
+        return FakeElement(self, node, element_id)
+
+    def _match(self, context, by, value, relative):
+        """Return the nodes matching a locator."""
+        prefix = './/' if relative else '//'
+        if by == By.XPATH:
+            path = value
+        elif by == By.ID:
+            path = '%s*[@id="%s"]' % (prefix, value)
+        elif by == By.NAME:
+            path = '%s*[@name="%s"]' % (prefix, value)
+        elif by == By.TAG_NAME:
+            path = '%s%s' % (prefix, value)
+        elif by == By.CLASS_NAME:
+            path = '%s*[contains(concat(" ", normalize-space(@class), " "),' \
+                ' " %s ")]' % (prefix, value)
+        elif by == By.LINK_TEXT:
+            path = '%sa[normalize-space(.)="%s"]' % (prefix, value)
+        elif by == By.PARTIAL_LINK_TEXT:
+            path = '%sa[contains(., "%s")]' % (prefix, value)
+        elif by == By.CSS_SELECTOR:
+            from lxml.cssselect import CSSSelector
+            return CSSSelector(value)(context)
+        else:
+            raise InvalidSelectorException('Unsupported locator: %s' % by)
+        return [node for node in context.xpath(path)
+                if isinstance(node.tag, str)]
+
+    def _find_all(self, params):
+        """Return handles for every match."""
+        relative = 'id' in params
+        context = self._node(params) if relative else self.document
+        nodes = self._match(context, params['using'], params['value'],
+                            relative)
+        elements = [self._wrap(node) for node in nodes]
+        for by, value in self.transients:
+            self._leaving.extend(
+                node for node in self._match(self.document, by, value, False)
+                if node in nodes
+            )
+        return elements
+
+    def _find(self, params):
+        """Return a handle for the first match."""
+        elements = self._find_all(params)
+        if not elements:
+            raise NoSuchElementException(
+                'Unable to locate element: %s=%s' %
+                (params['using'], params['value']))
+        return elements[0]
+
+    def _script(self, params):
+        """Answer a registered script."""
+        handler = self.scripts.get(params['script'])
+        return handler(*params['args']) if handler else None
+
+    def _set_value(self, element, text):
+        """Handle TextEntry.SET_VALUE_SCRIPT."""
+        self._set(element.node, text)
+        return self._value(element.node)
+
+    def _text(self, params):
+        """Return the whitespace-normalized visible text."""
+        node = self._node(params)
+        if not self.displayed(node):
+            return ''
+        return ' '.join(node.text_content().split())
+
+    def _value(self, node):
+        """Return an input or text area value."""
+        if node.tag == 'textarea':
+            return node.text or ''
+        return node.get('value', '')
+
+    def _set(self, node, value):
+        """Set an input or text area value."""
+        if node.tag == 'textarea':
+            node.text = value
+        else:
+            node.set('value', value)
+
+    def _checked(self, node):
+        """Return True for checked inputs and selected options."""
+        return node.get('checked') is not None or \
+            node.get('selected') is not None
+
+    def _attribute(self, params):
+        """Return an attribute, using property rules for common names."""
+        node = self._node(params)
+        name = params['name']
+        if name == 'value':
+            return self._value(node)
+        if name in ('checked', 'selected'):
+            return 'true' if self._checked(node) else None
+        return node.get(name)
+
+    def _send_keys(self, params):
+        """Append typed text to a field."""
+        node = self._node(params)
+        self._set(node, self._value(node) + params['text'])
+
+    def _move_to(self, params):
+        """Remember the element under the pointer."""
+        if params.get('element'):
+            self._hovered = self._node({'id': params['element']})
+
+    def _click(self, node):
+        """Apply the default action for a click and run click handlers."""
+        if node is None or node.get('disabled') is not None:
+            return
+        if node.tag == 'input' and node.get('type') == 'checkbox':
+            if node.get('checked') is None:
+                node.set('checked', 'checked')
+            else:
+                del node.attrib['checked']
+        elif node.tag == 'input' and node.get('type') == 'radio':
+            for other in self.document.xpath(
+                    '//input[@type="radio"][@name="%s"]' % node.get('name')):
+                other.attrib.pop('checked', None)
+            node.set('checked', 'checked')
+        elif node.tag == 'option':
+            for other in node.getparent().iter('option'):
+                other.attrib.pop('selected', None)
+            node.set('selected', 'selected')
+        for by, value, handler in list(self.click_handlers):
+            if node in self._match(self.document, by, value, False):
+                handler(self, self._wrap(node))
+        link = node if node.tag == 'a' else next(
+            (parent for parent in node.iterancestors() if parent.tag == 'a'),
+            None)
+        if link is not None and link.get('href'):
+            target = urljoin(self._url, link.get('href'))
+            if target in self.pages:
+                self._visit(target)
@@ -1,35 +1,123 @@
 """Staxing test files."""
 
 import os
+import calendar
 import datetime
+import json
+import tempfile
+import threading
 import pytest
+import shutil
 import time
 import unittest
 
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from lxml.html import fragment_fromstring
 from random import randint
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as expect
 from selenium.webdriver.support.ui import WebDriverWait
-from staxing.assignment import Assignment
+from staxing.assignment import Assignment, AssignmentError
+from staxing.assignment_api import AssignmentAPI
+from staxing.exercise_catalog import CatalogCache, ExerciseCatalog
+from staxing.http_session import SmokeCheck
 from staxing.helper import Helper, Teacher, Student, Admin, ContentQA, User
+from staxing.launcher import ConcurrentLauncher, LaunchError, LaunchReport
+from staxing.session_pool import SessionPool
+from staxing.session_store import SessionStore
+from staxing.shard_runner import ShardRunner
+from staxing.text_entry import TextEntry
+from staxing.wait_ledger import WaitLedger
+from staxing.wait_strategy import WaitStrategy
+from requests import Session
+from urllib.parse import unquote
+
+from fake_driver import FakeDriver
 
 __version__ = '0.0.4'
 TESTS = os.getenv(
     'CASELIST',
     str([
-        101, 102, 103, 104, 105, 106,
-        201, 202, 203, 204, 205, 206, 207, 208,
-        301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311,
+        101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114,
+        115, 116, 117, 118,
+        201, 202, 203, 204, 205, 206, 207, 208, 209,
+        301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 316, 317, 318,
         # 401,
         # 501,
         # 601,
-        # 701,
+        702,
         # 801,
+        901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914,
+        915, 916, 917, 918, 919, 920,
+        921, 922, 923, 924,
     ])
 )
 
 
+def serve(handler):
+    """Start a local stand-in server on a free port."""
+    server = HTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+class TutorStub(BaseHTTPRequestHandler):
+    """Local stand-in for the Tutor pages and API."""
+
+    plans = []
+    routes = {
+        '/courses/1/t/calendar':
+            '<meta name="csrf-token" content="token">',
+        '/api/courses/1': {
+            'id': 1, 'ecosystem_id': 5,
+            'periods': [{'id': 11, 'name': 'First'},
+                        {'id': 12, 'name': 'Second'}],
+        },
+        '/api/ecosystems/5/readings': [
+            {'chapter_section': [1], 'children': [
+                {'id': 101, 'type': 'page', 'chapter_section': [1, 1]},
+                {'id': 102, 'type': 'page', 'chapter_section': [1, 2]},
+            ]},
+        ],
+        '/api/ecosystems/5/exercises/homework_core?page_ids[]=102': {
+            'items': [{'id': 7, 'content': {'uid': '4321@2'}},
+                      {'id': 8, 'content': {'uid': '4322@1'}}],
+        },
+    }
+
+    def do_GET(self):
+        """Serve a canned page or API record."""
+        path = unquote(self.path)
+        body = self.routes.get(path)
+        if not isinstance(body, str):
+            body = json.dumps(body)
+        self.reply(200 if path in self.routes else 404, body)
+
+    def do_POST(self):
+        """Record a created plan."""
+        length = int(self.headers['Content-Length'])
+        TutorStub.plans.append((
+            self.path,
+            self.headers.get('X-CSRF-Token'),
+            json.loads(self.rfile.read(length).decode())
+        ))
+        self.reply(201, json.dumps({'id': len(TutorStub.plans)}))
+
+    def reply(self, status, body):
+        """Send a response body."""
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+        pass
+
+
 class TestStaxingHelper(unittest.TestCase):
     """Staxing case tests for Helper."""
 
@@ -131,6 +219,238 @@ class TestStaxingHelper(unittest.TestCase):
             'Sleep longer than expected: %s > %s' % \
             (duration, sleep_length * 1.02)
 
+    @pytest.mark.skipif(str(107) not in TESTS, reason='Excluded')
+    def test_helper_pooled_driver_is_reused(self):
+        """Check a pooled driver back in and reuse it."""
+        with SessionPool(size=1) as pool:
+            first = Helper(pool=pool)
+            driver = first.driver
+            first.delete()
+            assert(pool.idle_count() == 1), 'Driver not returned to the pool'
+            second = Helper(pool=pool)
+            assert(second.driver is driver), 'Pooled driver not reused'
+            stats = pool.stats()
+            assert(stats['hits'] == 1 and stats['misses'] == 1), \
+                'Unexpected pool counters: %s' % stats
+            second.delete()
+
+    @pytest.mark.skipif(str(108) not in TESTS, reason='Excluded')
+    def test_helper_lazy_driver_launch(self):
+        """Delay the browser launch until the driver is used."""
+        lazy = Helper(lazy=True, wait_time=5)
+        assert(lazy._driver is None), 'Lazy helper launched a browser'
+        assert(lazy.date_string() == self.helper.date_string()), \
+            'Pure helper failed without a browser'
+        lazy.change_wait_time(3)
+        assert(lazy._driver is None), 'Wait time change launched a browser'
+        assert(lazy.wait._timeout == 3), 'Wait time not applied on launch'
+        assert(lazy._driver is not None), 'Driver not launched on first use'
+        lazy.delete()
+
+    @pytest.mark.skipif(str(109) not in TESTS, reason='Excluded')
+    def test_helper_concurrent_launch(self):
+        """Launch several browsers at the same time."""
+        report = ConcurrentLauncher().launch([(Helper, {})] * 3)
+        try:
+            assert(not report.errors), 'Launch failed: %s' % report.errors
+            assert(len(report.ready) == 3), 'Missing launched helpers'
+            assert(report.elapsed < sum(report.timings)), \
+                'Launches were not concurrent: %s >= %s' % \
+                (report.elapsed, sum(report.timings))
+        finally:
+            for helper in report.ready:
+                helper.delete()
+
+    @pytest.mark.skipif(str(110) not in TESTS, reason='Excluded')
+    def test_helper_headless_launch_profile(self):
+        """Launch a browser with the headless-fast profile."""
+        with Helper(profile='headless-fast') as headless:
+            width, height = Helper.PROFILES['headless-fast']['window_size']
+            assert(headless.get_window_size('width') == width), \
+                'Profile window width not applied'
+            headless.get('https://www.google.com/')
+            assert('Google' in headless.driver.title), 'Page did not render'
+        with pytest.raises(ValueError):
+            Helper(profile='unknown-profile')
+
+    @pytest.mark.skipif(str(111) not in TESTS, reason='Excluded')
+    def test_helper_wait_strategy_modes(self):
+        """Fast waits return on their condition; legacy waits sleep."""
+        old_mode = WaitStrategy.MODE
+        try:
+            WaitStrategy.set_mode(WaitStrategy.FAST)
+            start_time = time.time()
+            self.helper.set_window_size(1000, 700)
+            fast = time.time() - start_time
+            WaitStrategy.set_mode(WaitStrategy.LEGACY)
+            start_time = time.time()
+            self.helper.set_window_size(1100, 700)
+            legacy = time.time() - start_time
+            assert(legacy >= WaitStrategy.DELAYS['window_resize']), \
+                'Legacy resize did not pause: %s' % legacy
+            assert(fast < legacy), \
+                'Fast resize was not faster: %s >= %s' % (fast, legacy)
+            with pytest.raises(ValueError):
+                WaitStrategy.set_mode('unknown')
+        finally:
+            WaitStrategy.set_mode(old_mode)
+
+    @pytest.mark.skipif(str(112) not in TESTS, reason='Excluded')
+    def test_helper_wait_ledger_records_call_sites(self):
+        """Record sleeps and waits by call site."""
+        with WaitLedger() as ledger:
+            self.helper.sleep(0.2)
+            self.helper.get('https://www.google.com/')
+        assert(ledger.total(WaitLedger.SLEEP) >= 0.2), \
+            'Sleep not recorded: %s' % ledger.records
+        sites = [site['site'] for site in ledger.summary()]
+        assert(any('test_staxing.py' in site for site in sites)), \
+            'Call site not recorded: %s' % sites
+        assert(WaitLedger.active is None), 'Ledger still enabled'
+
+    @pytest.mark.skipif(str(113) not in TESTS, reason='Excluded')
+    def test_helper_command_tracer(self):
+        """Count WebDriver commands per staxing operation."""
+        with self.helper.trace_commands() as tracer:
+            self.helper.get('https://www.google.com/')
+            self.helper.get_window_size()
+        counts = tracer.counts()
+        assert('Helper.get' in counts), 'Operation missing: %s' % counts
+        assert(counts['Helper.get'].get('get') == 1), \
+            'Navigation not counted: %s' % counts
+        events = json.loads(tracer.to_chrome_trace())['traceEvents']
+        assert(len(events) == len(tracer.commands)), 'Trace events missing'
+
+    @pytest.mark.skipif(str(114) not in TESTS, reason='Excluded')
+    def test_helper_locator_cache(self):
+        """Reuse element lookups until the page navigates."""
+        with Helper(cache_locators=True) as cached:
+            cached.get('https://www.google.com/')
+            first = cached.find(By.TAG_NAME, 'body')
+            assert(cached.find(By.TAG_NAME, 'body') is first), \
+                'Repeated lookup not cached'
+            cached.driver.refresh()
+            assert(first.tag_name == 'body'), 'Stale element not refreshed'
+            cached.get('https://www.google.com/')
+            assert(cached.find(By.TAG_NAME, 'body') is not first), \
+                'Cache not cleared after navigation'
+
+    @pytest.mark.skipif(str(115) not in TESTS, reason='Excluded')
+    def test_helper_bulk_text_entry(self):
+        """Enter long text without typing one key at a time."""
+        self.helper.driver.get(
+            'data:text/html,<input id="short"><textarea id="long"></textarea>'
+        )
+        text = ' '.join(Assignment.rword(8) for _ in range(300))
+        long_field = self.helper.find(By.ID, 'long')
+        strategy = Assignment.send_keys(self.helper.driver, long_field, text)
+        assert(strategy in TextEntry.STRATEGIES), 'Unknown strategy used'
+        assert(long_field.get_attribute('value') == text), 'Text not entered'
+        TextEntry(self.helper.driver).fill({'short': 'user name'})
+        assert(self.helper.find(By.ID, 'short').get_attribute('value') ==
+               'user name'), 'Field not filled'
+
+    @pytest.mark.skipif(str(116) not in TESTS, reason='Excluded')
+    def test_helper_assignment_api_backend(self):
+        """Create a homework through a local stand-in for the Tutor API."""
+        server = serve(TutorStub)
+        TutorStub.plans = []
+        site = 'http://127.0.0.1:%s' % server.server_port
+        try:
+            teacher = Teacher(username='', password='', site=site,
+                              existing_driver=self.helper.driver)
+            teacher.get('%s/courses/1/t/calendar' % site)
+            plan = teacher.add_assignment(
+                assignment='homework',
+                args={
+                    'title': 'Homework-API',
+                    'periods': {
+                        'First': ('10/01/2026', ('10/08/2026', '11:59 pm')),
+                    },
+                    'problems': {'1.2': ['4322'], 'tutor': 2},
+                    'status': 'publish',
+                    'feedback': 'immediate',
+                },
+                backend=Teacher.API
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert(plan == {'id': 1}), 'Plan not returned'
+        path, token, payload = TutorStub.plans[0]
+        assert(path == '/api/courses/1/plans'), 'Wrong plan endpoint'
+        assert(token == 'token'), 'CSRF token not sent'
+        assert(payload['settings']['exercise_ids'] == ['8'])
+        assert(payload['settings']['exercises_count_dynamic'] == 2)
+        assert(payload['tasking_plans'] == [{
+            'target_id': '11', 'target_type': 'period',
+            'opens_at': '2026-10-01 00:01', 'due_at': '2026-10-08 23:59',
+        }])
+        assert(payload['is_publish'])
+
+    @pytest.mark.skipif(str(117) not in TESTS, reason='Excluded')
+    def test_helper_bulk_assignments(self):
+        """Add several assignments and report each one."""
+        server = serve(TutorStub)
+        TutorStub.plans = []
+        site = 'http://127.0.0.1:%s' % server.server_port
+        period = {'all': ('10/01/2026', '10/08/2026')}
+        items = [
+            ('event', {'title': 'Event-%s' % number, 'periods': period,
+                       'status': 'draft'})
+            for number in range(5)
+        ]
+        items.append(('event', {'title': 'Event-bad', 'status': 'draft',
+                                'periods': {'Fourth': period['all']}}))
+        try:
+            teacher = Teacher(username='', password='', site=site,
+                              existing_driver=self.helper.driver)
+            teacher.get('%s/courses/1/t/calendar' % site)
+            report = teacher.add_assignments(items, backend=Teacher.API,
+                                             workers=3)
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert(len(report.completed) == 5), 'Assignments not added'
+        assert(list(report.errors) == [5]), 'Bad period not reported'
+        assert(len(TutorStub.plans) == 5), 'Wrong number of plans posted'
+        assert(report.per_minute > 0), 'Throughput not reported'
+        titles = sorted(payload['title'] for _, _, payload in TutorStub.plans)
+        assert(titles == ['Event-%s' % number for number in range(5)])
+
+    @pytest.mark.skipif(str(118) not in TESTS, reason='Excluded')
+    def test_helper_sharded_runner(self):
+        """Run cases in balanced shards and merge the results."""
+        directory = tempfile.mkdtemp()
+        test_file = os.path.join(directory, 'test_shards.py')
+        with open(test_file, 'w') as cases:
+            cases.write('\n'.join([
+                'import os, pytest, time, unittest',
+                "TESTS = os.getenv('CASELIST', str([1, 2, 3]))",
+                'class TestShards(unittest.TestCase):',
+            ] + [
+                "    @pytest.mark.skipif(str(%s) not in TESTS, reason='x')\n"
+                '    def test_case_%s(self):\n'
+                '        time.sleep(0.%s)' % (case, case, case)
+                for case in (1, 2, 3)
+            ]) + '\n')
+        durations = os.path.join(directory, 'durations.json')
+        with open(durations, 'w') as record:
+            json.dump({'1': 1.0, '2': 2.0, '3': 3.0}, record)
+        runner = ShardRunner(test_file, workers=2, durations=durations)
+        assert(runner.cases == {case: 'TestShards::test_case_%s' % case
+                                for case in (1, 2, 3)})
+        assert(runner.shards([1, 2, 3]) == [[3], [2, 1]]), 'Not balanced'
+        report = os.path.join(directory, 'report.xml')
+        code, merged = runner.run([1, 2, 3], junitxml=report)
+        assert(code == 0), 'Shard failed'
+        suite = merged.find('testsuite')
+        assert(suite.get('tests') == '3' and suite.get('skipped') == '0')
+        assert(os.path.exists(report)), 'Merged report not written'
+        with open(durations) as record:
+            recorded = json.load(record)
+        assert(recorded['3'] < 3.0), 'Durations not updated'
+
 
 class TestStaxingUser(unittest.TestCase):
     """Staxing case tests for User."""
@@ -307,6 +627,22 @@ class TestStaxingUser(unittest.TestCase):
             'calendar' in self.user.driver.current_url
         assert(was_successful), 'Failed to return to the primary browser tab'
 
+    @pytest.mark.skipif(str(209) not in TESTS, reason='Excluded')
+    def test_user_login_restores_saved_session(self):
+        """Skip the Accounts flow with a saved session."""
+        store = SessionStore(directory=tempfile.mkdtemp())
+        self.user.session_store = store
+        self.user.login(self.server, self.login, self.password)
+        assert(store.load(self.server, self.login)), 'Session not saved'
+        self.user.driver.delete_all_cookies()
+        with User('', '', '', session_store=store) as returning:
+            assert(returning.resume_session(self.server, self.login)), \
+                'Saved session not accepted'
+            was_successful = 'dashboard' in returning.current_url() or \
+                'list' in returning.current_url() or \
+                'calendar' in returning.current_url()
+            assert(was_successful), 'Restored session not logged in'
+
 
 class TestStaxingTutorTeacher(unittest.TestCase):
     """Staxing case tests."""
@@ -630,6 +966,48 @@ class TestStaxingTutorTeacher(unittest.TestCase):
         """No test placeholder."""
         pass
 
+    @pytest.mark.skipif(str(316) not in TESTS, reason='Excluded')
+    def test_get_book_sections_bulk_and_cached(self):
+        """Read book sections in bulk and reuse the cached list."""
+        sections = self.teacher.get_book_sections(refresh=True)
+        assert(sections), 'No book sections found'
+        assert('1.1' in sections), 'Section 1.1 missing: %s' % sections
+        start_time = time.time()
+        cached = self.teacher.get_book_sections()
+        assert(time.time() - start_time < 1), 'Cached sections not reused'
+        assert(cached == sections), 'Cached sections differ'
+        scraped = self.teacher.get_book_sections(bulk=False, refresh=True)
+        assert(scraped == sections), \
+            'Bulk and per-chapter reads differ: %s != %s' % \
+            (sections, scraped)
+
+    @pytest.mark.skipif(str(317) not in TESTS, reason='Excluded')
+    def test_rotate_calendar_by_url(self):
+        """Jump the calendar to a month through its URL."""
+        target = self.teacher.date_string(day_delta=200)
+        self.teacher.rotate_calendar(target)
+        month, year = self.teacher.get_month_year()
+        target_date = datetime.datetime.strptime(target, '%m/%d/%Y').date()
+        assert((month, year) == (target_date.month, target_date.year)), \
+            'Calendar at %s/%s, not %s' % (month, year, target)
+        today = self.teacher.date_string()
+        self.teacher.rotate_calendar(today, use_url=False)
+        month, year = self.teacher.get_month_year()
+        assert('%02d' % month == today[:2]), 'Arrow rotation failed'
+
+    @pytest.mark.skipif(str(318) not in TESTS, reason='Excluded')
+    def test_goto_menu_item_by_route(self):
+        """Load course pages by URL and by the user menu."""
+        course_id = self.teacher.get_course_id()
+        assert(course_id), 'No course open: %s' % self.teacher.current_url()
+        self.teacher.goto_menu_item('Student Scores', use_route=True)
+        assert(self.teacher.current_url().endswith(
+            '/courses/%s/t/scores' % course_id)), \
+            'Scores page not loaded: %s' % self.teacher.current_url()
+        self.teacher.goto_course_roster()
+        assert('settings' in self.teacher.current_url()), \
+            'Menu navigation failed: %s' % self.teacher.current_url()
+
 
 class TestStaxingConceptCoachTeacher(unittest.TestCase):
     """Staxing case tests."""
@@ -714,6 +1092,41 @@ class TestStaxingAdmin(unittest.TestCase):
     #     """No test placeholder."""
     #     pass
 
+    @pytest.mark.skipif(str(702) not in TESTS, reason='Excluded')
+    def test_admin_smoke_check(self):
+        """Fetch the admin pages over HTTP and report the failing ones."""
+        class StubHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status = 500 if self.path == '/admin/jobs' else 200
+                body = ('<h1>%s</h1>' % self.path).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = serve(StubHandler)
+        try:
+            self.admin.url = 'http://127.0.0.1:%s/' % server.server_port
+            results = self.admin.smoke_check(
+                markers={'courses': ['/admin/courses'],
+                         'tags': ['Missing marker']},
+                open_failures=False
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert(set(results) == set(Admin.ADMIN_PAGES))
+        assert(results['courses']['ok'])
+        assert(results['jobs']['status'] == 500)
+        assert(results['tags']['missing'] == ['Missing marker'])
+        failures = sorted(page for page in results
+                          if not results[page]['ok'])
+        assert(failures == ['jobs', 'tags'])
+
 
 class TestStaxingContentQA(unittest.TestCase):
     """Staxing case tests."""
@@ -734,3 +1147,624 @@ class TestStaxingContentQA(unittest.TestCase):
     # def test_base_case(self):
     #     """No test placeholder."""
     #     pass
+
+
+class TestStaxingAssignmentLogic(unittest.TestCase):
+    """Staxing case tests for Assignment logic on an in-memory driver."""
+
+    PERIOD_PAGE = '''<html><body>
+        <input type="radio" name="tasking" id="hide-periods-radio">
+        <input type="radio" name="tasking" id="show-periods-radio">
+        %s
+        </body></html>'''
+    PERIOD_ROW = '''<div class="tasking-plan">
+        <div><input type="checkbox" id="period-toggle-period-%(n)s" checked>
+        <label for="period-toggle-period-%(n)s">%(name)s</label></div>
+        <div class="-assignment-open-date"><div class="datepicker__input">
+        <input></div></div>
+        <div class="-assignment-due-date"><div class="datepicker__input">
+        <input></div></div>
+        <div class="-assignment-open-time"><input></div>
+        <div class="-assignment-due-time"><input></div>
+        </div>'''
+    CATALOG_PAGE = '''<html><body><span>Loading...</span>%s</body></html>'''
+    CATALOG_ROW = '''<div class="exercise-sections">
+        <label><span class="chapter-section">%s</span></label>
+        <div class="exercises">%s</div></div>'''
+
+    def periods_page(self, names, disabled=()):
+        """Return a tasking page with one row per period name."""
+        driver = FakeDriver(TestStaxingAssignmentLogic.PERIOD_PAGE % ''.join(
+            TestStaxingAssignmentLogic.PERIOD_ROW % {'n': n, 'name': name}
+            for n, name in enumerate(names, 1)
+        ))
+        self.date_picker(driver, disabled)
+        return driver
+
+    def date_picker(self, driver, disabled=()):
+        """Open a one-month picker on the month of the clicked date input.
+
+        disabled (tuple): days the picker will not select
+        """
+        opened = []
+
+        def close(browser):
+            for picker in browser.document.find_class('datepicker'):
+                picker.getparent().remove(picker)
+
+        def open_picker(browser, field):
+            close(browser)
+            value = field.node.get('value')
+            shown = datetime.datetime.strptime(value, '%m/%d/%Y').date() \
+                if value else datetime.date.today()
+            last = calendar.monthrange(shown.year, shown.month)[1]
+            browser.document.body.append(fragment_fromstring(
+                '<div class="datepicker"><div class="datepicker__current-'
+                'month">%s</div>%s</div>' % (shown.strftime('%B %Y'), ''.join(
+                    '<div class="datepicker__day%s">%s</div>' % (
+                        ' datepicker__day--disabled' if day in disabled
+                        else '', day)
+                    for day in range(1, last + 1)))))
+            opened[:] = [(field.node, shown)]
+
+        def pick(browser, day):
+            if 'disabled' in day.node.get('class'):
+                return
+            field, shown = opened[0]
+            field.set('value', shown.replace(day=int(day.node.text))
+                      .strftime('%m/%d/%Y'))
+            close(browser)
+
+        driver.on_click(By.XPATH, '//div[contains(@class,"datepicker__input")]'
+                        '//input', open_picker)
+        driver.on_click(By.CLASS_NAME, 'datepicker__day', pick)
+
+    def catalog_page(self, catalog):
+        """Return an exercise picker for {section: [IDs]}."""
+        driver = FakeDriver(TestStaxingAssignmentLogic.CATALOG_PAGE % ''.join(
+            TestStaxingAssignmentLogic.CATALOG_ROW % (section, ''.join(
+                '<div><span>ID: %s</span></div>' % exercise
+                for exercise in ids
+            ))
+            for section, ids in sorted(catalog.items())
+        ))
+        driver.transient(By.XPATH, '//span[text()="Loading..."]')
+        return driver
+
+    def count_selections(self, driver):
+        """Toggle the card and the picker's count on each add control click."""
+
+        def toggle(browser, overlay):
+            card = overlay.node.getparent()
+            classes = card.get('class', '').split()
+            selected = 'is-selected' not in classes
+            if selected:
+                classes.append('is-selected')
+            else:
+                classes.remove('is-selected')
+            card.set('class', ' '.join(classes))
+            count = browser.document.xpath('//div[@class="num mine"]/h2')[0]
+            count.text = '%s' % (int(count.text) + (1 if selected else -1))
+
+        driver.on_click(By.CLASS_NAME, 'controls-overlay', toggle)
+
+    @pytest.mark.skipif(str(901) not in TESTS, reason='Excluded')
+    def test_assignment_assign_periods(self):
+        """Set dates and times only on the requested period rows."""
+        driver = self.periods_page(['First', 'Second', 'Third'])
+        Assignment().assign_periods(driver, {
+            'First': ('10/01/2026', '10/08/2026'),
+            'Third': (('10/02/2026', '6:30 am'), ('10/09/2026', '11:59 pm')),
+        })
+        rows = driver.find_elements(By.CLASS_NAME, 'tasking-plan')
+        values = [
+            [field.get_attribute('value')
+             for field in row.find_elements(By.TAG_NAME, 'input')]
+            for row in rows
+        ]
+        assert(values[0] == ['', '10/01/2026', '10/08/2026', '', ''])
+        assert(values[1] == ['', '', '', '', '']), 'Second period was set'
+        assert(values[2] == ['', '10/02/2026', '10/09/2026', '630a',
+                             '1159p'])
+        toggles = [row.find_element(By.TAG_NAME, 'input').is_selected()
+                   for row in rows]
+        assert(toggles == [True, False, True]), 'Period toggles not set'
+
+    @pytest.mark.skipif(str(920) not in TESTS, reason='Excluded')
+    def test_assignment_set_date_enabled_days(self):
+        """Pick dates in the picker and refuse the days it disables."""
+        driver = self.periods_page(['First'], disabled=(8,))
+        field = driver.find_element(
+            By.XPATH, '//div[contains(@class,"-due-date")]//input')
+        assign = Assignment()
+        assert(not assign.set_date(driver, field, datetime.date(2026, 12, 8))
+               ), 'Disabled day accepted'
+        assert(assign.set_date(driver, field, datetime.date(2026, 12, 9)))
+        assert(field.get_attribute('value') == '12/09/2026')
+        assert(not driver.find_elements(By.CLASS_NAME, 'datepicker')), \
+            'Picker left open'
+
+    @pytest.mark.skipif(str(902) not in TESTS, reason='Excluded')
+    def test_assignment_find_all_questions_fallback(self):
+        """Fall back to the element scrape when scripts are unavailable."""
+        catalog = {'1.1': ['101@1', '102@1'], '1.2': [], '2.1': ['201@1']}
+        driver = self.catalog_page(catalog)
+        start = time.time()
+        questions = Assignment().find_all_questions(driver, catalog)
+        assert(questions == catalog), 'Catalog not scraped'
+        assert(driver.calls['executeScript'] == 1), 'Script not tried once'
+        assert(driver.calls['findChildElements'] == 3), 'Rows not scraped'
+        assert(time.time() - start < 1.0), 'Loading wait not skipped'
+
+    @pytest.mark.skipif(str(903) not in TESTS, reason='Excluded')
+    def test_assignment_chapter_list_and_times(self):
+        """Gather chapter exercises and format times for the time inputs."""
+        assign = Assignment()
+        catalog = {'1.1': ['101'], '1.2': ['121', '122'], '11.1': ['1101']}
+        assert(assign.get_chapter_list(catalog, 'ch1') in (
+            ['101', '121', '122'], ['121', '122', '101']))
+        assert(assign.get_chapter_list(catalog, 'ch11') == ['1101'])
+        assert(assign.modify_time('11:59 pm') == '1159p')
+        assert(assign.modify_time('6:30 am') == '630a')
+
+    @pytest.mark.skipif(str(904) not in TESTS, reason='Excluded')
+    def test_assignment_dispatch_tables(self):
+        """Route add, edit and remove calls to the matching methods."""
+        assign = Assignment()
+        called = []
+        for action in ('add_new', 'change', 'delete'):
+            for kind in ('reading', 'homework', 'external', 'event'):
+                name = '%s_%s' % (action, kind)
+                setattr(assign, name, lambda name=name, **kwargs:
+                        called.append((name, kwargs['title'])))
+        for table, action in ((assign.add, 'add_new'),
+                              (assign.edit, 'change'),
+                              (assign.remove, 'delete')):
+            assert(sorted(table) == sorted(['reading', 'homework',
+                                            'external', 'event']))
+            for kind in sorted(table):
+                table[kind](driver=None, name=kind, description='',
+                            periods={}, reading_list=[], state='draft',
+                            problems={}, url='', feedback='immediate')
+                assert(called[-1] == ('%s_%s' % (action, kind), kind))
+
+    @pytest.mark.skipif(str(905) not in TESTS, reason='Excluded')
+    def test_text_entry_fill_without_scripts(self):
+        """Type every field when the fill script cannot run."""
+        driver = FakeDriver('<input id="auth_key"><input id="password">')
+        missed = TextEntry(driver).fill({'auth_key': 'user',
+                                         'password': 'secret'})
+        assert(sorted(missed) == ['auth_key', 'password'])
+        assert(driver.find_element(By.ID, 'auth_key')
+               .get_attribute('value') == 'user')
+        assert(driver.find_element(By.ID, 'password')
+               .get_attribute('value') == 'secret')
+
+    @pytest.mark.skipif(str(919) not in TESTS, reason='Excluded')
+    def test_text_entry_fill_script_result(self):
+        """Type the fields the fill script missed, or all when it fails."""
+        fields = {'auth_key': 'user', 'password': 'secret'}
+        driver = FakeDriver('<input id="auth_key"><input id="password">')
+        driver.scripts[TextEntry.FILL_SCRIPT] = lambda values: ['password']
+        assert(TextEntry(driver).fill(fields) == ['password'])
+        assert(driver.find_element(By.ID, 'auth_key')
+               .get_attribute('value') in (None, '')), 'Set field retyped'
+        assert(driver.find_element(By.ID, 'password')
+               .get_attribute('value') == 'secret'), 'Missed field skipped'
+        driver.scripts[TextEntry.FILL_SCRIPT] = lambda values: None
+        assert(sorted(TextEntry(driver).fill(fields)) ==
+               ['auth_key', 'password'])
+        assert(driver.find_element(By.ID, 'auth_key')
+               .get_attribute('value') == 'user'), 'Fields skipped'
+
+    @pytest.mark.skipif(str(906) not in TESTS, reason='Excluded')
+    def test_assignment_select_exercises_fallback(self):
+        """Click each add control when the bulk script is unavailable."""
+        driver = FakeDriver(
+            '<div class="num mine"><h2>0</h2></div>' +
+            TestStaxingAssignmentLogic.CATALOG_ROW % ('1.1', ''.join(
+                '<div class="card"><div class="controls-overlay"></div>'
+                '<div><span>ID: %s@1</span></div></div>' % exercise
+                for exercise in ('101', '102', '103')
+            ))
+        )
+        self.count_selections(driver)
+        start = time.time()
+        selected = Assignment().select_exercises(driver, ['101@1', '103'])
+        assert(selected == 2), 'Selected count not read back'
+        assert(driver.calls['mouseMoveTo'] == 4), 'Pointer moved per step'
+        assert(time.time() - start < 1.0), 'Selection paused'
+
+    @pytest.mark.skipif(str(914) not in TESTS, reason='Excluded')
+    def test_assignment_select_exercises_skips_selected(self):
+        """Leave exercises the picker already shows as selected."""
+        driver = FakeDriver(
+            '<div class="num mine"><h2>1</h2></div>' +
+            TestStaxingAssignmentLogic.CATALOG_ROW % ('1.1', ''.join(
+                '<div class="%s"><div class="controls-overlay"></div>'
+                '<div><span>ID: %s@1</span></div></div>' % card
+                for card in (('card is-selected', '101'), ('card', '102'))
+            ))
+        )
+        self.count_selections(driver)
+        selected = Assignment().select_exercises(driver,
+                                                 ['101', '102', '102@1'])
+        assert(selected == 2), 'Selected exercise toggled off'
+        assert(driver.calls['mouseMoveTo'] == 2), 'Clicked more than once'
+
+    @pytest.mark.skipif(str(924) not in TESTS, reason='Excluded')
+    def test_assignment_select_exercises_batched(self):
+        """Hover and click the add controls the bulk script matched."""
+        driver = FakeDriver(
+            '<div class="num mine"><h2>0</h2></div>' +
+            TestStaxingAssignmentLogic.CATALOG_ROW % ('1.1', ''.join(
+                '<div class="card"><div class="controls-overlay"></div>'
+                '<div><span>ID: %s@1</span></div></div>' % exercise
+                for exercise in ('101', '102', '103')
+            ))
+        )
+
+        def match(wanted):
+            overlay = driver.find_element(
+                By.XPATH, '//span[text()="ID: 101@1"]/../..'
+                '/div[@class="controls-overlay"]')
+            return {'found': [['101@1', overlay]], 'missed': ['103'],
+                    'selected': []}
+
+        driver.scripts[Assignment.SELECT_SCRIPT] = match
+        self.count_selections(driver)
+        selected = Assignment().select_exercises(driver, ['101@1', '103'])
+        assert(selected == 2), 'Selected count not read back'
+        assert(driver.calls['mouseMoveTo'] == 4), 'Add controls not hovered'
+        del driver.scripts[Assignment.SELECT_SCRIPT]
+        driver.click_handlers = []
+        try:
+            Assignment().select_exercises(driver, ['102'])
+            assert(False), 'Missed selection not reported'
+        except AssignmentError as err:
+            assert('Selected 2 of 3' in str(err))
+
+    @pytest.mark.skipif(str(907) not in TESTS, reason='Excluded')
+    def test_exercise_catalog_selection(self):
+        """Index exercises and select without changing the catalog."""
+        questions = {'1.1': ['101@1', '102@1', '103@2'], '1.2': ['121@1'],
+                     '2.1': ['201@1']}
+        catalog = ExerciseCatalog(questions)
+        assert(len(catalog) == 5)
+        assert(catalog.section_of('103') == '1.1')
+        assert(catalog.find('103') == '103@2')
+        assert('999' not in catalog)
+        assert(sorted(catalog.available('ch1')) ==
+               ['101@1', '102@1', '103@2', '121@1'])
+        assert(catalog.select('1.1', 2) == ['101@1', '102@1'])
+        assert(catalog.select('ch2', 'all') == ['201@1'])
+        assert(catalog.select('2.1', ['101', '121@1', '999']) ==
+               ['101@1', '121@1'])
+        assert(catalog.select('2.1', ['101', '121@1', '201'],
+                              within=['ch1']) == ['101@1', '121@1'])
+        for _ in range(20):
+            picked = catalog.select('ch1', (2, 6))
+            assert(2 <= len(picked) <= 4)
+            assert(len(set(picked)) == len(picked)), 'Sampled twice'
+        assert(catalog.as_dict() == questions), 'Catalog changed'
+        assert(catalog.select('1.1', None) == [])
+
+    @pytest.mark.skipif(str(915) not in TESTS, reason='Excluded')
+    def test_assignment_plan_custom_ids_in_sections(self):
+        """Take listed exercise IDs only from the requested sections."""
+        catalog = ExerciseCatalog({'1.1': ['101@1', '102@1'],
+                                   '1.2': ['121@1'], '2.1': ['201@1']})
+        using = Assignment().plan_exercises(
+            catalog, {'1.1': ['102', '121', '201'], 'ch2': None})
+        assert(using == ['102@1', '201@1']), 'Planned outside the sections'
+
+    @pytest.mark.skipif(str(908) not in TESTS, reason='Excluded')
+    def test_assignment_catalog_cache(self):
+        """Plan homework from a cached catalog instead of the picker."""
+        server = serve(TutorStub)
+        site = 'http://127.0.0.1:%s' % server.server_port
+        page = (
+            '<button id="problems-select"></button>'
+            '<div class="homework-plan-exercise-select-topics"></div>'
+            '<button class="btn -show-problems"></button>'
+            '<span>Loading...</span><div class="num mine"><h2>0</h2></div>' +
+            TestStaxingAssignmentLogic.CATALOG_ROW % ('1.1', ''.join(
+                '<div class="card"><div class="controls-overlay"></div>'
+                '<div><span>ID: %s@1</span></div></div>' % exercise
+                for exercise in ('101', '102', '103')
+            )) +
+            '<button>Next</button>'
+        )
+
+        def homework(assign):
+            driver = FakeDriver(page, '%s/courses/1/t/homework' % site)
+            driver.transient(By.XPATH, '//span[text()="Loading..."]')
+            self.count_selections(driver)
+            assign.select_sections = lambda driver, sections: None
+            assign.add_homework_problems(driver, {'1.1': 2})
+            return driver
+
+        directory = tempfile.mkdtemp()
+        try:
+            cache = CatalogCache(directory)
+            homework(Assignment(catalog_cache=cache))
+            cached = cache.load(site, '1', '5')
+            assert(cached.as_dict() == {'1.1': ['101@1', '102@1', '103@1']})
+            assert(cache.load(site, '1', '6') is None), 'Version ignored'
+            assign = Assignment(catalog_cache=cache)
+            assign.find_all_questions = None
+            driver = homework(assign)
+            assert(driver.calls['findChildElements'] == 0), 'Scraped again'
+            assert(driver.calls['mouseMoveTo'] == 4), 'Exercises not added'
+        finally:
+            server.shutdown()
+            shutil.rmtree(directory)
+
+
+class TestStaxingUserLogic(unittest.TestCase):
+    """Staxing case tests for User logic on an in-memory driver."""
+
+    SITE = 'https://accounts.example.org'
+
+    def interstitial(self, driver):
+        """Answer User.INTERSTITIAL_SCRIPT from the fake document."""
+        if driver.document.xpath('//*[@id="reset_password_password"]'):
+            return User.RESET_PASSWORD
+        if driver.document.xpath('//*[@id="i_agree"]'):
+            return User.AGREEMENT
+        return None
+
+    @pytest.mark.skipif(str(909) not in TESTS, reason='Excluded')
+    def test_user_clear_interstitials(self):
+        """Clear a password reset and two agreements in a row."""
+        site = TestStaxingUserLogic.SITE
+        agreement = (
+            '<h1>%s</h1>%s<input type="checkbox" id="i_agree">'
+            '<button id="agreement_submit">I agree</button>'
+        )
+        driver = FakeDriver(
+            '<input id="reset_password_password">'
+            '<input id="reset_password_password_confirmation">'
+            '<input type="submit" value="Set Password">',
+            '%s/reset' % site,
+            {
+                '%s/terms' % site: agreement % ('Terms of Use', ''),
+                '%s/privacy' % site: agreement % (
+                    'Privacy Policy',
+                    '<p>See also the <a href="/terms">Terms of Use</a>.</p>'
+                ),
+                '%s/dashboard' % site: '<h1>Dashboard</h1>',
+            }
+        )
+        following = {'%s/terms' % site: '%s/privacy' % site,
+                     '%s/privacy' % site: '%s/dashboard' % site}
+        driver.scripts[User.INTERSTITIAL_SCRIPT] = \
+            lambda: self.interstitial(driver)
+        driver.on_click(By.XPATH, '//input[@value="Set Password"]',
+                        lambda browser, button: browser.get(
+                            '%s/terms' % site))
+        driver.on_click(By.ID, 'agreement_submit',
+                        lambda browser, button: browser.get(
+                            following[browser.current_url]))
+        user = User('teacher', 'password', existing_driver=driver)
+        user.clear_interstitials()
+        assert(driver.current_url == '%s/dashboard' % site), \
+            'Interstitials not cleared'
+        assert(driver.calls['executeScript'] == 4), 'Checked more than once'
+
+    @pytest.mark.skipif(str(910) not in TESTS, reason='Excluded')
+    def test_helper_locator_cache_navigation(self):
+        """Drop cached lookups on clicks and re-find stale elements."""
+        site = TestStaxingUserLogic.SITE
+        driver = FakeDriver(
+            '<h1>Calendar</h1><div class="plan">One</div>'
+            '<a href="/scores">Scores</a>',
+            '%s/calendar' % site,
+            {'%s/scores' % site: '<h1>Scores</h1>',
+             '%s/guide' % site: '<h1>Guide</h1>'}
+        )
+        helper = Helper(existing_driver=driver, cache_locators=True)
+        first = helper.find(By.TAG_NAME, 'h1')
+        assert(helper.find(By.TAG_NAME, 'h1') is first), 'Lookup not cached'
+        assert(driver.calls['findElement'] == 1), 'Cache hit sent a command'
+        assert(driver.calls['getCurrentUrl'] == 0)
+        assert(len(helper.find_all(By.CLASS_NAME, 'plan')) == 1)
+        driver.document.body.append(
+            driver.document.body.makeelement('div', {'class': 'plan'}))
+        assert(len(helper.find_all(By.CLASS_NAME, 'plan')) == 2), \
+            'Later rendered elements hidden'
+        helper.find(By.LINK_TEXT, 'Scores').click()
+        heading = helper.find(By.TAG_NAME, 'h1')
+        assert(heading is not first), 'Cache kept across navigation'
+        assert(heading.text == 'Scores')
+        misses = helper.locator_cache.misses
+        driver.get('%s/guide' % site)
+        assert(helper.find(By.TAG_NAME, 'h1').text == 'Guide'), \
+            'Stale element not found again'
+        assert(helper.locator_cache.misses == misses + 1)
+
+    @pytest.mark.skipif(str(911) not in TESTS, reason='Excluded')
+    def test_teacher_book_sections_version(self):
+        """Key cached book sections on the course's ecosystem."""
+        server = serve(TutorStub)
+        site = 'http://127.0.0.1:%s' % server.server_port
+        driver = FakeDriver('<h1>Calendar</h1>',
+                            '%s/courses/1/t/calendar' % site)
+        try:
+            teacher = Teacher(username='', password='', site=site,
+                              existing_driver=driver)
+            Teacher.book_sections[(teacher.url, '1', '4')] = \
+                (time.time(), ['1.1 Outdated'])
+            Teacher.book_sections[(teacher.url, '1', '5')] = \
+                (time.time(), ['1.1 Current', '1.2 Added'])
+            assert(teacher.get_book_sections() ==
+                   ['1.1 Current', '1.2 Added']), 'Stale sections served'
+        finally:
+            Teacher.book_sections.clear()
+            server.shutdown()
+
+    @pytest.mark.skipif(str(912) not in TESTS, reason='Excluded')
+    def test_teacher_bulk_assignments_worker_failures(self):
+        """Report workers that fail to start and hand their items over."""
+        site = TestStaxingUserLogic.SITE
+        teacher = Teacher(username='', password='', site=site,
+                          existing_driver=FakeDriver(
+                              '<h1>Calendar</h1>', '%s/calendar' % site))
+        teacher.add_assignment = \
+            lambda kind, args, assign=None: args['title']
+        worker = Teacher(username='', password='', site=site,
+                         existing_driver=FakeDriver('<h1>Sign in</h1>'))
+
+        def refuse():
+            raise LaunchError('Login refused')
+
+        worker.login = refuse
+        launched = LaunchReport(2)
+        launched.users[0] = worker
+        launched.errors[1] = LaunchError('No browser')
+        launch = ConcurrentLauncher.launch
+        ConcurrentLauncher.launch = lambda launcher, specs: launched
+        try:
+            report = teacher.add_assignments(
+                [('reading', {'title': 'Reading %s' % number})
+                 for number in range(3)],
+                workers=3
+            )
+        finally:
+            ConcurrentLauncher.launch = launch
+        assert(len(report.completed) == 3), 'Items lost with the workers'
+        assert(sorted(report.launch_errors) == [1, 2]), \
+            'Worker failures not reported'
+
+    @pytest.mark.skipif(str(913) not in TESTS, reason='Excluded')
+    def test_helper_existing_driver_left_open(self):
+        """Leave an existing_driver open only when delete is asked to."""
+        driver = FakeDriver('<h1>Calendar</h1>')
+        user = User('teacher', 'password', existing_driver=driver)
+        user.delete(quit_driver=False)
+        del user
+        assert(driver.calls['quit'] == 0), 'Shared driver quit'
+        user = User('teacher', 'password', existing_driver=driver)
+        user.delete()
+        del user
+        assert(driver.calls['quit'] == 1), 'Driver not quit by default'
+
+    @pytest.mark.skipif(str(916) not in TESTS, reason='Excluded')
+    def test_session_pool_keeps_accounts_apart(self):
+        """Only hand a pooled driver back to the account that used it."""
+        site = TestStaxingUserLogic.SITE
+        driver = FakeDriver('<h1>Dashboard</h1>', '%s/dashboard' % site,
+                            {'about:blank': '<body></body>'})
+        pool = SessionPool()
+        pool.checkin(SessionPool.key(account='teacher@%s' % site), driver)
+        assert(driver.calls['deleteAllCookies'] == 1), 'Cookies kept'
+        assert(driver.calls['executeScript'] == 1), 'Storage kept'
+        student = FakeDriver('<h1>Sign in</h1>')
+        assert(pool.checkout(SessionPool.key(account='student@%s' % site),
+                             lambda: student) is student), \
+            'Driver handed to another account'
+        teacher = User('teacher', 'password', site=site, pool=pool,
+                       lazy=True)
+        assert(teacher.driver is driver), 'Pooled driver not reused'
+        assert(pool.stats()['hits'] == 1)
+
+    @pytest.mark.skipif(str(917) not in TESTS, reason='Excluded')
+    def test_helper_launch_options_headless_flag(self):
+        """Pass the headless flag as a browser argument."""
+        chrome = Helper.launch_options('chrome', 'headless-fast')
+        assert('--headless' in chrome.arguments), 'Chrome launched headed'
+        firefox = Helper.launch_options('firefox', 'headless-fast')
+        assert('-headless' in firefox.arguments), 'Firefox launched headed'
+        assert('--headless' not in
+               Helper.launch_options('chrome', 'headed-debug').arguments)
+
+    @pytest.mark.skipif(str(918) not in TESTS, reason='Excluded')
+    def test_wait_strategy_fast_pause_capped(self):
+        """Stop a fast pause that never settles at the legacy delay."""
+        old_mode = WaitStrategy.MODE
+        try:
+            WaitStrategy.set_mode(WaitStrategy.FAST)
+            start = time.time()
+            WaitStrategy.pause('date_picker_open', FakeDriver('<h1>X</h1>'),
+                               lambda browser: False)
+            assert(time.time() - start <
+                   WaitStrategy.DELAYS['date_picker_open'] + 0.2), \
+                'Fast pause outlasted the legacy delay'
+        finally:
+            WaitStrategy.set_mode(old_mode)
+        assert(Helper.window_matches({'width': 1299, 'height': 768},
+                                     {'width': 1300, 'height': 768}))
+        assert(not Helper.window_matches({'width': 1280, 'height': 768},
+                                         {'width': 1300, 'height': 768}))
+
+    @pytest.mark.skipif(str(921) not in TESTS, reason='Excluded')
+    def test_teacher_route_falls_back_to_menu(self):
+        """Use the menu when a route's page marker does not appear."""
+        site = TestStaxingUserLogic.SITE
+        course = '%s/courses/1/t' % site
+        driver = FakeDriver('<h1>Calendar</h1>', '%s/calendar' % course, {
+            '%s/guide' % course: '<div class="guide-container">Guide</div>',
+            '%s/scores' % course: '<h1>Page not found</h1>',
+        })
+        teacher = Teacher(username='', password='', site=site,
+                          existing_driver=driver)
+        wait = User.ROUTE_WAIT
+        User.ROUTE_WAIT = 0.2
+        try:
+            assert(teacher.goto_route('Performance Forecast')), \
+                'Route not loaded'
+            assert(not teacher.goto_route('Student Scores')), \
+                'Missing page marker accepted'
+        finally:
+            User.ROUTE_WAIT = wait
+        assert(driver.current_url == '%s/guide' % course), 'Did not go back'
+
+    @pytest.mark.skipif(str(922) not in TESTS, reason='Excluded')
+    def test_smoke_check_sign_in_redirects(self):
+        """Report redirects to sign in, not pages that link to it."""
+        class StubHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/admin/jobs':
+                    self.send_response(302)
+                    self.send_header('Location', '/accounts/login')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = ('<a href="/signin">Sign in</a>'
+                        '<input name="auth_key">').encode()
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = serve(StubHandler)
+        site = 'http://127.0.0.1:%s' % server.server_port
+        try:
+            results = SmokeCheck(Session()).check({
+                'users': ('%s/admin/users' % site, []),
+                'jobs': ('%s/admin/jobs' % site, []),
+            })
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert(results['users']['ok']), 'Sign-in link taken as signed out'
+        assert(not results['jobs']['ok']), 'Sign-in redirect not reported'
+        assert('sign in' in results['jobs']['error'])
+
+    @pytest.mark.skipif(str(923) not in TESTS, reason='Excluded')
+    def test_assignment_api_skips_empty_sections(self):
+        """Skip homework sections whose problem choice is none."""
+        server = serve(TutorStub)
+        site = 'http://127.0.0.1:%s' % server.server_port
+        try:
+            settings = AssignmentAPI(Session(), site).homework_settings(
+                5, {'1.1': None, '1.2': ['4322']})
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert(settings['page_ids'] == ['101', '102']), \
+            'Skipped section pages dropped'
+        assert(settings['exercise_ids'] == ['8']), 'Wrong exercises chosen'